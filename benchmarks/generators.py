@@ -0,0 +1,134 @@
+"""
+Synthetic KSG graph generators for benchmarks.
+
+Every generator returns (nodes, associations) built from KSG models so the
+same graph can drive NeuroService.to_neuro_json, run_inference and the raw
+NeuroEngine. All generators are deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Dict, List, Tuple
+
+from knowshowgo.models import Association, LogicType, Node
+
+Graph = Tuple[List[Node], List[Association]]
+
+
+def _make_nodes(size: int, rng: random.Random) -> List[Node]:
+    return [
+        Node.create(prototype_id="bench", payload={"index": i}, prior=round(rng.uniform(0.1, 0.9), 3))
+        for i in range(size)
+    ]
+
+
+def _edge(source: Node, target: Node, logic_type: str, weight: float) -> Association:
+    return Association.create(
+        source_id=source.id,
+        target_id=target.id,
+        relation=logic_type.lower(),
+        logic_type=logic_type,
+        logic_weight=weight,
+    )
+
+
+def chain(size: int, seed: int = 0) -> Graph:
+    """Linear IMPLIES chain: n0 -> n1 -> ... -> n{size-1}."""
+    rng = random.Random(seed)
+    nodes = _make_nodes(size, rng)
+    assocs = [
+        _edge(nodes[i], nodes[i + 1], LogicType.IMPLIES, round(rng.uniform(0.6, 1.0), 3))
+        for i in range(size - 1)
+    ]
+    return nodes, assocs
+
+
+def random_dag(size: int, seed: int = 0, avg_degree: float = 3.0) -> Graph:
+    """Random DAG of IMPLIES edges pointing from lower to higher index."""
+    rng = random.Random(seed)
+    nodes = _make_nodes(size, rng)
+    assocs: List[Association] = []
+    for target_idx in range(1, size):
+        fan_in = min(target_idx, max(1, int(rng.expovariate(1.0 / avg_degree))))
+        sources = {rng.randrange(target_idx) for _ in range(fan_in)}
+        for source_idx in sorted(sources):
+            assocs.append(
+                _edge(nodes[source_idx], nodes[target_idx], LogicType.IMPLIES, round(rng.uniform(0.5, 1.0), 3))
+            )
+    return nodes, assocs
+
+
+def dense_cyclic(size: int, seed: int = 0, degree: int = 8) -> Graph:
+    """Dense cyclic graph mixing IMPLIES and SUPPORTS edges in both directions."""
+    rng = random.Random(seed)
+    nodes = _make_nodes(size, rng)
+    assocs: List[Association] = []
+    if size < 2:
+        return nodes, assocs
+    for source_idx in range(size):
+        for _ in range(degree):
+            target_idx = rng.randrange(size - 1)
+            if target_idx >= source_idx:
+                target_idx += 1
+            logic_type = LogicType.IMPLIES if rng.random() < 0.7 else LogicType.SUPPORTS
+            assocs.append(
+                _edge(nodes[source_idx], nodes[target_idx], logic_type, round(rng.uniform(0.2, 0.9), 3))
+            )
+    return nodes, assocs
+
+
+def argumentation(size: int, seed: int = 0, attacks_per_node: int = 4) -> Graph:
+    """Argumentation graph dominated by ATTACKS edges, with a few SUPPORTS."""
+    rng = random.Random(seed)
+    nodes = _make_nodes(size, rng)
+    assocs: List[Association] = []
+    if size < 2:
+        return nodes, assocs
+    for source_idx in range(size):
+        for _ in range(attacks_per_node):
+            target_idx = rng.randrange(size - 1)
+            if target_idx >= source_idx:
+                target_idx += 1
+            assocs.append(
+                _edge(nodes[source_idx], nodes[target_idx], LogicType.ATTACKS, round(rng.uniform(0.3, 1.0), 3))
+            )
+        if rng.random() < 0.2:
+            target_idx = rng.randrange(size)
+            if target_idx != source_idx:
+                assocs.append(
+                    _edge(nodes[source_idx], nodes[target_idx], LogicType.SUPPORTS, round(rng.uniform(0.1, 0.5), 3))
+                )
+    return nodes, assocs
+
+
+def power_law(size: int, seed: int = 0, edges_per_node: int = 2) -> Graph:
+    """
+    Preferential-attachment (Barabasi-Albert style) graph, resembling KSG
+    neighborhoods with a few high-degree hubs. Edge logic types are mixed.
+    """
+    rng = random.Random(seed)
+    nodes = _make_nodes(size, rng)
+    assocs: List[Association] = []
+    # Each node appears in `endpoints` once per incident edge, so sampling it
+    # picks targets proportionally to degree.
+    endpoints: List[int] = []
+    logic_types = [LogicType.IMPLIES] * 6 + [LogicType.SUPPORTS] * 2 + [LogicType.ATTACKS] * 2
+    for source_idx in range(1, size):
+        picks = {rng.choice(endpoints) if endpoints else 0 for _ in range(edges_per_node)}
+        for target_idx in picks:
+            logic_type = rng.choice(logic_types)
+            assocs.append(
+                _edge(nodes[source_idx], nodes[target_idx], logic_type, round(rng.uniform(0.3, 1.0), 3))
+            )
+            endpoints.extend((source_idx, target_idx))
+    return nodes, assocs
+
+
+GENERATORS: Dict[str, Callable[..., Graph]] = {
+    "chain": chain,
+    "random_dag": random_dag,
+    "dense_cyclic": dense_cyclic,
+    "argumentation": argumentation,
+    "power_law": power_law,
+}
@@ -0,0 +1,240 @@
+"""
+End-to-end benchmarks for NeuroEngine and NeuroService.
+
+Usage:
+    python -m benchmarks.run --sizes 100 1000 10000 --output results.json
+    python -m benchmarks.run --output current.json --baseline results.json
+
+Each (generator, size) graph is measured for:
+- to_neuro_json:  KSG context -> NeuroJSON conversion
+- engine_run:     NeuroEngine.run on the converted schema
+- run_inference:  NeuroService.run_inference (conversion + engine)
+- train_epoch:    one NeuroEngine.train epoch
+- memory_peak:    tracemalloc peak bytes during run_inference
+
+With --baseline, timings are compared against a stored result file and the
+process exits non-zero when any benchmark is slower than the tolerance allows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from knowshowgo.neuro import NeuroEngine
+from knowshowgo.neuro.engine import TrainingData
+from knowshowgo.neuro.types import EngineConfig
+from knowshowgo.neuro_service import ContextGraph, NeuroService
+
+from .generators import GENERATORS
+
+DEFAULT_SIZES = [100, 1000, 10000]
+BENCHMARKS = ["to_neuro_json", "engine_run", "run_inference", "train_epoch", "memory_peak"]
+
+
+def _time_call(fn: Callable[[], Any], repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _result(generator: str, size: int, benchmark: str, timings: List[float], **extra: Any) -> Dict[str, Any]:
+    result = {
+        "generator": generator,
+        "size": size,
+        "benchmark": benchmark,
+        "repeats": len(timings),
+        "seconds_median": statistics.median(timings),
+        "seconds_min": min(timings),
+    }
+    result.update(extra)
+    return result
+
+
+def bench_graph(
+    generator: str,
+    size: int,
+    benchmarks: Sequence[str] = BENCHMARKS,
+    repeats: int = 3,
+    max_iterations: int = 50,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Runs the selected benchmarks on one generated graph."""
+    nodes, assocs = GENERATORS[generator](size, seed=seed)
+    service = NeuroService()
+    service.set_config(max_iterations=max_iterations)
+    context: ContextGraph = service.extract_context(nodes, assocs, center_node_id=nodes[0].id)
+
+    # Lock ~1% of nodes as evidence so there is something to propagate
+    evidence_ids = [node.id for node in nodes[::100]]
+    evidence = {node_id: 1.0 for node_id in evidence_ids}
+    schema = service.to_neuro_json(context)
+    var_evidence = {f"node_{node_id}": 1.0 for node_id in evidence_ids}
+    config = EngineConfig(max_iterations=max_iterations)
+
+    results: List[Dict[str, Any]] = []
+    common = {"variables": len(schema["variables"]), "rules": len(schema["rules"]),
+              "constraints": len(schema["constraints"])}
+
+    if "to_neuro_json" in benchmarks:
+        timings = _time_call(lambda: service.to_neuro_json(context), repeats)
+        results.append(_result(generator, size, "to_neuro_json", timings, **common))
+
+    if "engine_run" in benchmarks:
+        engine = NeuroEngine(schema, config)
+        detailed = engine.run_detailed(var_evidence)
+        timings = _time_call(lambda: engine.run(var_evidence), repeats)
+        results.append(
+            _result(
+                generator, size, "engine_run", timings,
+                iterations=detailed.iterations, converged=detailed.converged, **common,
+            )
+        )
+
+    if "run_inference" in benchmarks:
+        timings = _time_call(lambda: service.run_inference(context, evidence), repeats)
+        results.append(_result(generator, size, "run_inference", timings, **common))
+
+    if "train_epoch" in benchmarks:
+        engine = NeuroEngine(schema, config)
+        targets = {name: 0.9 for name in list(schema["variables"])[-max(1, size // 100):]}
+        data = [TrainingData(inputs=var_evidence, targets=targets)]
+        timings = _time_call(lambda: engine.train(data, epochs=1), repeats)
+        results.append(_result(generator, size, "train_epoch", timings, **common))
+
+    if "memory_peak" in benchmarks:
+        tracemalloc.start()
+        try:
+            started = time.perf_counter()
+            service.run_inference(context, evidence)
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        results.append(_result(generator, size, "memory_peak", [elapsed], peak_bytes=peak, **common))
+
+    return results
+
+
+def run_suite(
+    generators: Sequence[str],
+    sizes: Sequence[int],
+    benchmarks: Sequence[str] = BENCHMARKS,
+    repeats: int = 3,
+    max_iterations: int = 50,
+    seed: int = 0,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Runs benchmarks over every generator/size pair and returns a result document."""
+    results: List[Dict[str, Any]] = []
+    for generator in generators:
+        for size in sizes:
+            if log:
+                log(f"{generator} size={size}")
+            results.extend(bench_graph(generator, size, benchmarks, repeats, max_iterations, seed))
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "max_iterations": max_iterations,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Compares two result documents.
+
+    Returns one entry per benchmark that got slower than baseline * (1 + tolerance),
+    or whose peak memory grew by more than the same tolerance.
+    """
+    def key(row: Dict[str, Any]) -> tuple:
+        return (row["generator"], row["size"], row["benchmark"])
+
+    baseline_rows = {key(row): row for row in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+    for row in current.get("results", []):
+        base = baseline_rows.get(key(row))
+        if base is None:
+            continue
+        metric = "peak_bytes" if row["benchmark"] == "memory_peak" else "seconds_median"
+        old, new = base.get(metric), row.get(metric)
+        if not old or new is None:
+            continue
+        ratio = new / old
+        if ratio > 1.0 + tolerance:
+            regressions.append({
+                "generator": row["generator"],
+                "size": row["size"],
+                "benchmark": row["benchmark"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--generators", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES,
+                        help="Variable counts (e.g. 100 1000 1000000)")
+    parser.add_argument("--benchmarks", nargs="+", default=BENCHMARKS, choices=BENCHMARKS)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a stored results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown ratio before flagging a regression")
+    args = parser.parse_args(argv)
+
+    document = run_suite(
+        args.generators,
+        args.sizes,
+        args.benchmarks,
+        repeats=args.repeats,
+        max_iterations=args.max_iterations,
+        seed=args.seed,
+        log=lambda message: print(message, file=sys.stderr),
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(document, baseline, args.tolerance)
+        for reg in regressions:
+            print(
+                f"REGRESSION {reg['generator']} size={reg['size']} {reg['benchmark']}: "
+                f"{reg['metric']} {reg['baseline']:.6g} -> {reg['current']:.6g} (x{reg['ratio']:.2f})",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Recall/latency benchmark for LshVsaIndex against the exact scan.
+
+Usage:
+    python -m benchmarks.vsa_recall --items 100000 --dim 256 --tables 8 16 --bits 12 14
+    python -m benchmarks.vsa_recall --items 1000000 --multiprobe 0 2 --output recall.json
+
+Probes are noisy copies of stored items, so the exact top-1 is (almost
+always) the item the probe was derived from.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from knowshowgo.vsa import VsaEncoder
+from knowshowgo.vsa_ann import LshVsaIndex, measure_recall
+
+
+def run_recall(
+    items: int,
+    dim: int,
+    tables: Sequence[int],
+    bits: Sequence[int],
+    multiprobe: Sequence[int],
+    queries: int = 200,
+    top_k: int = 10,
+    noise: float = 0.5,
+    seed: int = 0,
+    log: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    rng = np.random.default_rng(seed)
+    base = rng.standard_normal((items, dim)).astype(np.float32)
+    picks = rng.choice(items, size=min(queries, items), replace=False)
+    probes = base[picks] + noise * rng.standard_normal((len(picks), dim)).astype(np.float32)
+    ids = [f"item_{i}" for i in range(items)]
+
+    rows: List[Dict[str, Any]] = []
+    for num_tables, num_bits, probes_per_table in itertools.product(tables, bits, multiprobe):
+        if log:
+            log(f"tables={num_tables} bits={num_bits} multiprobe={probes_per_table}")
+        index = LshVsaIndex(
+            VsaEncoder(dim=dim, seed=seed),
+            num_tables=num_tables,
+            num_bits=num_bits,
+            multiprobe=probes_per_table,
+        )
+        started = time.perf_counter()
+        index.add_many(ids, base)
+        build_seconds = time.perf_counter() - started
+        stats = measure_recall(index, list(probes), top_k=top_k)
+        rows.append({
+            "items": items,
+            "dim": dim,
+            "num_tables": num_tables,
+            "num_bits": num_bits,
+            "multiprobe": probes_per_table,
+            "top_k": top_k,
+            "build_seconds": build_seconds,
+            **stats,
+        })
+    return rows
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--tables", nargs="+", type=int, default=[8, 16])
+    parser.add_argument("--bits", nargs="+", type=int, default=[12, 14])
+    parser.add_argument("--multiprobe", nargs="+", type=int, default=[0, 2])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    args = parser.parse_args(argv)
+
+    rows = run_recall(
+        args.items, args.dim, args.tables, args.bits, args.multiprobe,
+        queries=args.queries, top_k=args.top_k, noise=args.noise, seed=args.seed,
+        log=lambda message: print(message, file=sys.stderr),
+    )
+    document = {"results": rows}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,9 @@ from .graph import KnowledgeGraph
 from .inference import process_instruction
 from .working_memory import WorkingMemoryGraph
 from .replication import AsyncReplicator, EdgeUpdate
+from .replication_log import ReplicationLog
 from .api import KnowShowGoAPI
+from .graph_cache import GraphCache
 from .belief_resolver import (
     BeliefResolver,
     DefaultBeliefResolver,
@@ -20,6 +22,14 @@ from .vsa import (
     attach_vsa,
     get_node_vsa,
 )
+from .vsa_ann import LshVsaIndex
+from .vsa_binary import (
+    BinaryVsaEncoder,
+    BinaryVsaIndex,
+    bind_binary,
+    bundle_binary,
+    hamming_similarity,
+)
 from .neuro_artifacts import InMemoryNeuroStore, NeuroProgramArtifact, NeuroInferenceRun
 from .models import (
     Prototype,
@@ -44,7 +54,9 @@ __all__ = [
     "WorkingMemoryGraph",
     "AsyncReplicator",
     "EdgeUpdate",
+    "ReplicationLog",
     "KnowShowGoAPI",
+    "GraphCache",
     "BeliefResolver",
     "DefaultBeliefResolver",
     "GraphDerivedBeliefResolver",
@@ -58,6 +70,12 @@ __all__ = [
     "cosine_similarity",
     "attach_vsa",
     "get_node_vsa",
+    "LshVsaIndex",
+    "BinaryVsaEncoder",
+    "BinaryVsaIndex",
+    "bind_binary",
+    "bundle_binary",
+    "hamming_similarity",
     "NeuroProgramArtifact",
     "NeuroInferenceRun",
     "InMemoryNeuroStore",
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from .models import (
     Association,
@@ -15,27 +18,170 @@ from .models import (
     seed_core_prototypes,
 )
 from .arangodb_client import ArangoGraphStore
+from .graph_cache import ASSOCIATIONS, NODES, GraphCache
+
+
+# Flush order: nodes before the associations that point at them
+BUFFERED_COLLECTIONS = ("prototypes", "nodes", "associations")
 
 
 class KnowShowGoAPI:
-    """ORM-like convenience layer over Arango + in-memory models."""
+    """ORM-like convenience layer over Arango + in-memory models.
+
+    With write_behind=True (or inside `with api.batch():`) documents are
+    buffered per collection and written with the store's bulk upserts:
+    when `flush_size` documents are pending, when the oldest pending one is
+    `flush_interval` seconds old, on flush() and close(), and when the batch
+    block exits. A document written twice before a flush is sent once, with
+    its latest contents, at its first position.
 
-    def __init__(self, store: ArangoGraphStore) -> None:
+    The age check runs on every write and on a background timer, so a quiet
+    period does not leave documents buffered. The interval is a target, not
+    a deadline: the timer flush waits for any call in progress and for the
+    store, and a failed one keeps the documents and tries again one interval
+    later (the error is kept in `last_flush_error`). Call close() (or use the
+    API as a context manager) at shutdown so nothing buffered is lost.
+
+    An optional GraphCache is updated on every write and serves get_node(s)
+    and get_associations; reads flush pending writes first so they see them.
+    """
+
+    def __init__(
+        self,
+        store: ArangoGraphStore,
+        *,
+        write_behind: bool = False,
+        flush_size: int = 1000,
+        flush_interval: Optional[float] = None,
+        cache: Optional[GraphCache] = None,
+    ) -> None:
         self.store = store
+        self.cache = cache
         self.prototypes: Dict[str, Prototype] = {}
+        self.write_behind = write_behind
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._batch_depth = 0
+        self._buffers: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in BUFFERED_COLLECTIONS}
+        self._oldest_pending: Optional[float] = None
+        self.last_flush_error: Optional[Exception] = None
+        # Serializes the timer flush with calls made by the owning thread
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    # ---- Write-behind ----
+    @property
+    def pending_writes(self) -> int:
+        return sum(len(docs) for docs in self._buffers.values())
+
+    def flush(self) -> None:
+        """Writes every buffered document, one bulk upsert per collection and batch."""
+        writers = {
+            "prototypes": self.store.upsert_prototypes,
+            "nodes": self.store.upsert_nodes,
+            "associations": self.store.upsert_associations,
+        }
+        with self._lock:
+            for name in BUFFERED_COLLECTIONS:
+                docs = self._buffers[name]
+                if docs:
+                    # Cleared only once written, so a failed flush can be retried
+                    writers[name](list(docs.values()))
+                    docs.clear()
+            self._oldest_pending = None
+            self.last_flush_error = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def close(self) -> None:
+        """Stops the flush timer and writes everything still buffered."""
+        with self._lock:
+            self._closed = True
+            self.flush()
+
+    def __enter__(self) -> "KnowShowGoAPI":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def batch(self) -> Iterator["KnowShowGoAPI"]:
+        """Buffers writes for the duration of the block and flushes on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _write(self, collection: str, doc: Dict[str, Any]) -> None:
+        if not (self.write_behind or self._batch_depth):
+            writers = {
+                "prototypes": self.store.upsert_prototype,
+                "nodes": self.store.upsert_node,
+                "associations": self.store.upsert_association,
+            }
+            writers[collection](doc)
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            self._buffers[collection][doc["_key"]] = doc
+            if self.pending_writes >= self.flush_size or (
+                self.flush_interval is not None and now - self._oldest_pending >= self.flush_interval
+            ):
+                self.flush()
+            elif self._timer is None:
+                self._start_timer()
+
+    def _start_timer(self) -> None:
+        if self.flush_interval is None or self._closed:
+            return
+        self._timer = threading.Timer(self.flush_interval, self._flush_due)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_due(self) -> None:
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return  # a flush already ran (and a newer timer may be armed)
+            self._timer = None
+            try:
+                self.flush()
+            except Exception as exc:
+                # Nobody is waiting on this flush: keep the documents, retry later
+                self.last_flush_error = exc
+                self._start_timer()
 
     def ensure_core_prototypes(self, created_by: Optional[str] = None) -> None:
+        """Loads the core prototypes, writing only those the store lacks.
+
+        Core ids are deterministic, so one bulk read tells which exist; a
+        repeated startup does no writes.
+        """
         seeds = seed_core_prototypes(created_by=created_by)
+        stored = {proto.id: proto for proto in self.store.get_prototypes([proto.id for proto in seeds.values()])}
+        missing = []
         for proto in seeds.values():
+            if proto.id in stored:
+                proto = stored[proto.id]
+            else:
+                missing.append(proto)
             self.prototypes.setdefault(proto.name, proto)
-            self.store.upsert_prototype(self._proto_doc(proto))
+        if missing:
+            self.store.upsert_prototypes([self._proto_doc(proto) for proto in missing])
 
     def create_prototype_version(
         self, name: str, schema_meta: Dict[str, Any], tags: Optional[List[str]], created_by: Optional[str], previous_version_id: Optional[str]
     ) -> Prototype:
         proto = Prototype.base(name=name, schema_meta=schema_meta, tags=tags, created_by=created_by, previous_version_id=previous_version_id)
         self.prototypes[name] = proto
-        self.store.upsert_prototype(self._proto_doc(proto))
+        self._write("prototypes", self._proto_doc(proto))
         return proto
 
     def create_node(
@@ -46,7 +192,9 @@ class KnowShowGoAPI:
         context_ids: Optional[List[str]] = None,
     ) -> Node:
         node = Node.create(prototype_id=prototype_id, payload=payload, created_by=created_by, context_ids=context_ids)
-        self.store.upsert_node(self._node_doc(node))
+        self._write("nodes", self._node_doc(node))
+        if self.cache is not None:
+            self.cache.put(node)
         return node
 
     def add_association(
@@ -68,7 +216,9 @@ class KnowShowGoAPI:
             position=position,
             metadata=metadata,
         )
-        self.store.upsert_association(self._assoc_doc(assoc))
+        self._write("associations", self._assoc_doc(assoc))
+        if self.cache is not None:
+            self.cache.put(assoc)
         return assoc
 
     def add_object_property(self, object_id: str, property_node_id: str, created_by: Optional[str] = None) -> Association:
@@ -77,6 +227,26 @@ class KnowShowGoAPI:
     def add_tag(self, object_id: str, tag_node_id: str, weight: float = 1.0, created_by: Optional[str] = None) -> Association:
         return self.add_association(object_id, tag_node_id, relation="HAS_TAG", weight=weight, created_by=created_by)
 
+    # ---- Reads ----
+    def get_node(self, node_id: str) -> Optional[Node]:
+        return self.get_nodes([node_id]).get(node_id)
+
+    def get_nodes(self, node_ids: List[str]) -> Dict[str, Node]:
+        """Nodes by id (missing ids are left out), read through the cache if any."""
+        return self._read(NODES, node_ids)
+
+    def get_associations(self, assoc_ids: List[str]) -> Dict[str, Association]:
+        return self._read(ASSOCIATIONS, assoc_ids)
+
+    def _read(self, kind: str, ids: List[str]) -> Dict[str, Any]:
+        with self._lock:
+            if self.pending_writes:
+                self.flush()
+        if self.cache is not None:
+            return self.cache.get_many(ids, kind)
+        loader = self.store.get_nodes if kind == NODES else self.store.get_associations
+        return {record.id: record for record in loader(ids)}
+
     # ---- Helpers to render docs for Arango ----
     @staticmethod
     def _proto_doc(proto: Prototype) -> Dict[str, Any]:
@@ -103,6 +273,9 @@ class KnowShowGoAPI:
             "created_at": node.created_at.isoformat(),
             "created_by": node.created_by,
             "context_ids": node.context_ids,
+            "truth_value": node.truth_value,
+            "prior": node.prior,
+            "is_locked": node.is_locked,
         }
 
     @staticmethod
@@ -118,4 +291,5 @@ class KnowShowGoAPI:
             "previous_version_id": assoc.previous_version_id,
             "position": assoc.position,
             "metadata": assoc.metadata,
+            "logic_meta": assoc.logic_meta.to_dict() if assoc.logic_meta else None,
         }
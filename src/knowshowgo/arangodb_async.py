@@ -0,0 +1,134 @@
+"""Event-loop friendly front end for ArangoGraphStore.
+
+python-arango is synchronous, so every call on ArangoGraphStore blocks the
+thread it runs on. AsyncArangoGraphStore runs those calls in a bounded
+thread pool instead: at most `max_connections` requests are in flight, all
+sharing the store's pooled HTTP session, and each call is awaited with a
+timeout.
+
+A call that times out raises asyncio.TimeoutError to the caller, but its
+worker thread keeps going until the HTTP request returns; the store's
+`request_timeout` bounds how long that can take. A timed-out write may
+therefore still be applied.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .arangodb_client import ArangoGraphStore
+from .models import Association, Node, Prototype
+
+T = TypeVar("T")
+
+
+class AsyncArangoGraphStore:
+    def __init__(
+        self,
+        store: Optional[ArangoGraphStore] = None,
+        *,
+        max_connections: int = 8,
+        timeout: Optional[float] = 10.0,
+        **store_options: Any,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be >= 1")
+        if store is None:
+            store_options.setdefault("request_timeout", timeout)
+            store = ArangoGraphStore(max_connections=max_connections, **store_options)
+        self.store = store
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="arango")
+
+    async def _call(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> T:
+        # wait_for only stops waiting: the call keeps running on its thread, so
+        # a write that timed out here may still commit. Retry writes only if
+        # they are idempotent (increment_edge_weights with op ids is).
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout if timeout is not None else self.timeout)
+
+    # ---- Writes ----
+    async def ensure_indexes(self, *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.ensure_indexes, timeout=timeout)
+
+    async def upsert_prototype(self, proto: Dict[str, Any], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_prototype, proto, timeout=timeout)
+
+    async def upsert_node(self, node: Dict[str, Any], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_node, node, timeout=timeout)
+
+    async def upsert_association(self, assoc: Dict[str, Any], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_association, assoc, timeout=timeout)
+
+    async def upsert_prototypes(self, protos: Sequence[Dict[str, Any]], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_prototypes, protos, timeout=timeout)
+
+    async def upsert_nodes(self, nodes: Sequence[Dict[str, Any]], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_nodes, nodes, timeout=timeout)
+
+    async def upsert_associations(self, assocs: Sequence[Dict[str, Any]], *, timeout: Optional[float] = None) -> None:
+        await self._call(self.store.upsert_associations, assocs, timeout=timeout)
+
+    async def upsert_embedding_version(self, embedding: Dict[str, Any], *, timeout: Optional[float] = None) -> str:
+        return await self._call(self.store.upsert_embedding_version, embedding, timeout=timeout)
+
+    async def bulk_update_nodes(self, updates: Sequence[Dict[str, Any]], *, timeout: Optional[float] = None) -> int:
+        return await self._call(self.store._bulk_update_nodes, updates, timeout=timeout)
+
+    async def increment_edge_weight(
+        self, source: str, target: str, delta: float, max_weight: float, *, timeout: Optional[float] = None
+    ) -> None:
+        await self.increment_edge_weights(
+            [{"source": source, "target": target, "delta": delta, "max_weight": max_weight}], timeout=timeout
+        )
+
+    async def increment_edge_weights(self, updates: Iterable[Any], *, timeout: Optional[float] = None) -> None:
+        # Materialize here: a generator must not be consumed on a worker thread
+        await self._call(self.store._increment_edge_weights, list(updates), timeout=timeout)
+
+    # ---- Reads ----
+    async def get_prototypes(self, keys: Sequence[str], *, timeout: Optional[float] = None) -> List[Prototype]:
+        return await self._call(self.store.get_prototypes, list(keys), timeout=timeout)
+
+    async def get_nodes(self, keys: Sequence[str], *, timeout: Optional[float] = None) -> List[Node]:
+        return await self._call(self.store.get_nodes, list(keys), timeout=timeout)
+
+    async def get_associations(self, keys: Sequence[str], *, timeout: Optional[float] = None) -> List[Association]:
+        return await self._call(self.store.get_associations, list(keys), timeout=timeout)
+
+    async def get_node(self, node_id: str, *, timeout: Optional[float] = None) -> Optional[Node]:
+        nodes, _ = await self.get_subgraph([node_id], timeout=timeout)
+        return nodes[0] if nodes else None
+
+    async def get_neighborhood(
+        self,
+        center_id: str,
+        depth: int = 2,
+        *,
+        max_nodes: Optional[int] = None,
+        relations: Optional[Sequence[str]] = None,
+        node_fields: Optional[Sequence[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[List[Node], List[Association]]:
+        return await self._call(
+            self.store._get_neighborhood, center_id, depth, max_nodes, relations, node_fields, timeout=timeout
+        )
+
+    async def get_subgraph(
+        self, node_ids: Sequence[str], *, timeout: Optional[float] = None
+    ) -> Tuple[List[Node], List[Association]]:
+        return await self._call(self.store._get_subgraph, list(node_ids), timeout=timeout)
+
+    # ---- Lifecycle ----
+    async def close(self) -> None:
+        """Waits for in-flight calls and shuts the thread pool down."""
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+
+    async def __aenter__(self) -> "AsyncArangoGraphStore":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
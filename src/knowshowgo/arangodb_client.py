@@ -1,9 +1,120 @@
-from typing import Any, Dict, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import Association, LogicMeta, Node, Prototype, now_utc
 
 try:
     from arango import ArangoClient  # type: ignore
+    from arango.http import DefaultHTTPClient  # type: ignore
 except ImportError:  # pragma: no cover - python-arango may not be installed in all environments
     ArangoClient = None  # type: ignore
+    DefaultHTTPClient = None  # type: ignore
+
+
+# One round trip per batch: edge weights are capped server-side, and a
+# missing edge is created with its (capped) delta as the starting weight.
+# Edits carrying ops ([{id, delta}]) are idempotent: each edge keeps the ids
+# of its last @op_history applied ops, and only unseen ops add their delta.
+INCREMENT_EDGE_WEIGHTS_AQL = """
+FOR e IN @edits
+  UPSERT { source_id: e.source, target_id: e.target }
+  INSERT {
+    _from: CONCAT(@nodes_col, "/", e.source),
+    _to: CONCAT(@nodes_col, "/", e.target),
+    source_id: e.source,
+    target_id: e.target,
+    relation: @relation,
+    weight: MIN([e.delta, e.max_weight]),
+    applied_ops: SLICE(e.ops[*].id, -@op_history),
+    created_at: DATE_ISO8601(DATE_NOW())
+  }
+  UPDATE {
+    weight: MIN([
+      OLD.weight + (
+        LENGTH(e.ops) == 0
+          ? e.delta
+          : SUM(e.ops[* FILTER CURRENT.id NOT IN (OLD.applied_ops || []) RETURN CURRENT.delta])
+      ),
+      e.max_weight
+    ]),
+    applied_ops: SLICE(APPEND(OLD.applied_ops || [], e.ops[*].id, true), -@op_history)
+  }
+  IN @@col
+"""
+
+# Partial update per node; ids that no longer exist are skipped
+BULK_UPDATE_NODES_AQL = """
+FOR u IN @updates
+  UPDATE { _key: u.id } WITH UNSET(u, "id") IN @@col OPTIONS { ignoreErrors: true }
+  RETURN NEW._key
+"""
+
+
+# Breadth-first traversal (nearest nodes first, capped by @limit), then every
+# association among the nodes found, in a single round trip.
+NEIGHBORHOOD_AQL = """
+LET center = DOCUMENT(@@nodes, @center)
+LET found = center == null ? [] : (
+  FOR v IN 1..@depth ANY center @@edges
+    OPTIONS { order: "bfs", uniqueVertices: "global" }
+    LIMIT @limit
+    RETURN v
+)
+LET nodes = center == null ? [] : APPEND([center], found)
+LET keys = nodes[*]._key
+LET edges = (
+  FOR e IN @@edges
+    FILTER e.source_id IN keys AND e.target_id IN keys
+    RETURN KEEP(e, @edge_fields)
+)
+RETURN { nodes: (FOR n IN nodes RETURN KEEP(n, @node_fields)), edges: edges }
+"""
+
+# As above, following only edges whose relation is in @relations. The
+# optimizer turns the p.edges[*] ALL IN filter into an edge condition checked
+# while the traversal expands, so an excluded edge neither yields a vertex nor
+# marks it visited (global uniqueness cannot hide an allowed path behind it),
+# and LIMIT still stops the BFS after @limit vertices.
+NEIGHBORHOOD_BY_RELATION_AQL = """
+LET center = DOCUMENT(@@nodes, @center)
+LET found = center == null ? [] : (
+  FOR v, e, p IN 1..@depth ANY center @@edges
+    OPTIONS { order: "bfs", uniqueVertices: "global" }
+    FILTER p.edges[*].relation ALL IN @relations
+    LIMIT @limit
+    RETURN v
+)
+LET nodes = center == null ? [] : APPEND([center], found)
+LET keys = nodes[*]._key
+LET edges = (
+  FOR e IN @@edges
+    FILTER e.source_id IN keys AND e.target_id IN keys
+    FILTER e.relation IN @relations
+    RETURN KEEP(e, @edge_fields)
+)
+RETURN { nodes: (FOR n IN nodes RETURN KEEP(n, @node_fields)), edges: edges }
+"""
+
+# Given nodes plus the associations among them
+SUBGRAPH_AQL = """
+LET nodes = DOCUMENT(@@nodes, @keys)
+LET edges = (
+  FOR e IN @@edges
+    FILTER e.source_id IN @keys AND e.target_id IN @keys
+    RETURN KEEP(e, @edge_fields)
+)
+RETURN { nodes: (FOR n IN nodes RETURN KEEP(n, @node_fields)), edges: edges }
+"""
+
+# Fields inference reads; payload carries VSA vectors and names
+NODE_FIELDS = [
+    "_key", "prototype_id", "prototype_ids", "payload", "embedding_ref", "weight",
+    "context_ids", "truth_value", "prior", "is_locked", "created_at", "created_by",
+]
+EDGE_FIELDS = [
+    "_key", "source_id", "target_id", "relation", "weight", "position", "metadata", "logic_meta",
+    "created_at", "created_by", "previous_version_id",
+]
 
 
 class ArangoGraphStore:
@@ -20,11 +131,24 @@ class ArangoGraphStore:
         password: Optional[str] = None,
         hosts: Optional[str] = None,
         client: Any = None,
+        max_connections: Optional[int] = None,
+        request_timeout: Optional[float] = None,
     ) -> None:
         if client:
             self._client = client
         elif ArangoClient:
-            self._client = ArangoClient(hosts=hosts or "http://localhost:8529")
+            options: Dict[str, Any] = {}
+            timeout = {"request_timeout": request_timeout} if request_timeout is not None else {}
+            if max_connections is not None:
+                # One pooled session shared by every thread using this store.
+                # ArangoClient ignores its own request_timeout when given an
+                # http_client, so the timeout has to go to the client itself.
+                options["http_client"] = DefaultHTTPClient(
+                    pool_connections=max_connections, pool_maxsize=max_connections, **timeout
+                )
+            else:
+                options.update(timeout)
+            self._client = ArangoClient(hosts=hosts or "http://localhost:8529", **options)
         else:
             self._client = None
 
@@ -37,6 +161,20 @@ class ArangoGraphStore:
         self.prototypes_col = "prototypes"
         self.associations_col = "associations"
         self.embeddings_col = "embeddings"
+        # Relation given to edges first created by a weight increment
+        self.default_edge_relation = "RELATED_TO"
+        # Documents/edits sent per request by the bulk methods
+        self.batch_size = 1000
+        # Applied replication op ids remembered per edge (replays older than
+        # this many later ops on the same edge are applied again)
+        self.op_history = 256
+
+    def ensure_indexes(self) -> None:
+        """Creates the index the edge-weight UPSERT looks edges up by."""
+        if not self._db:
+            return
+        col = self._db.collection(self.associations_col)
+        col.add_persistent_index(fields=["source_id", "target_id"])
 
     # ---- Prototypes / Nodes / Associations ----
     def upsert_prototype(self, proto: Dict[str, Any]) -> None:
@@ -56,7 +194,144 @@ class ArangoGraphStore:
         if not self._db:
             return
         col = self._db.collection(self.associations_col)
-        col.insert(assoc, overwrite=True)
+        col.insert(self._edge_doc(assoc), overwrite=True)
+
+    def upsert_nodes(self, nodes: Sequence[Dict[str, Any]]) -> None:
+        """Bulk variant of upsert_node (insert_many with overwrite, per batch)."""
+        self._insert_many(self.nodes_col, nodes)
+
+    def upsert_associations(self, assocs: Sequence[Dict[str, Any]]) -> None:
+        """Bulk variant of upsert_association."""
+        self._insert_many(self.associations_col, [self._edge_doc(assoc) for assoc in assocs])
+
+    def upsert_prototypes(self, protos: Sequence[Dict[str, Any]]) -> None:
+        """Bulk variant of upsert_prototype."""
+        self._insert_many(self.prototypes_col, protos)
+
+    async def bulk_update_nodes(self, updates: Sequence[Dict[str, Any]]) -> int:
+        """Applies partial updates ({"id": key, field: value, ...}); returns how many matched."""
+        return self._bulk_update_nodes(updates)
+
+    def _bulk_update_nodes(self, updates: Sequence[Dict[str, Any]]) -> int:
+        if not self._db:
+            return 0
+        updated = 0
+        for chunk in _chunks(updates, self.batch_size):
+            cursor = self._db.aql.execute(
+                BULK_UPDATE_NODES_AQL,
+                bind_vars={"updates": chunk, "@col": self.nodes_col},
+            )
+            updated += sum(1 for _ in cursor)
+        return updated
+
+    def _edge_doc(self, assoc: Dict[str, Any]) -> Dict[str, Any]:
+        """Adds _from/_to so the associations edge collection can be traversed."""
+        return {
+            "_from": f"{self.nodes_col}/{assoc['source_id']}",
+            "_to": f"{self.nodes_col}/{assoc['target_id']}",
+            **assoc,
+        }
+
+    # ---- Reads ----
+    async def get_neighborhood(
+        self,
+        center_id: str,
+        depth: int = 2,
+        *,
+        max_nodes: Optional[int] = None,
+        relations: Optional[Sequence[str]] = None,
+        node_fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Node], List[Association]]:
+        """Nodes within `depth` hops of the center plus the associations among them.
+
+        One server-side traversal; max_nodes caps the nodes besides the center
+        (nearest first), and relations restricts the edges followed.
+        """
+        return self._get_neighborhood(center_id, depth, max_nodes, relations, node_fields)
+
+    def _get_neighborhood(
+        self,
+        center_id: str,
+        depth: int,
+        max_nodes: Optional[int],
+        relations: Optional[Sequence[str]],
+        node_fields: Optional[Sequence[str]],
+    ) -> Tuple[List[Node], List[Association]]:
+        if not self._db:
+            return [], []
+        bind_vars = {
+            "@nodes": self.nodes_col,
+            "@edges": self.associations_col,
+            "center": center_id,
+            "depth": depth,
+            "limit": max_nodes if max_nodes is not None else 2**31 - 1,
+            "node_fields": list(node_fields or NODE_FIELDS),
+            "edge_fields": EDGE_FIELDS,
+        }
+        if relations is None:
+            cursor = self._db.aql.execute(NEIGHBORHOOD_AQL, bind_vars=bind_vars)
+        else:
+            bind_vars["relations"] = list(relations)
+            cursor = self._db.aql.execute(NEIGHBORHOOD_BY_RELATION_AQL, bind_vars=bind_vars)
+        return self._graph_from_result(cursor)
+
+    def get_prototypes(self, keys: Sequence[str]) -> List[Prototype]:
+        """Stored prototypes among `keys`, fetched in one request per batch."""
+        return [_proto_from_doc(doc) for doc in self._get_many(self.prototypes_col, keys)]
+
+    def get_nodes(self, keys: Sequence[str]) -> List[Node]:
+        """Stored nodes among `keys`, fetched in one request per batch."""
+        return [_node_from_doc(doc) for doc in self._get_many(self.nodes_col, keys)]
+
+    def get_associations(self, keys: Sequence[str]) -> List[Association]:
+        """Stored associations among `keys`, fetched in one request per batch."""
+        return [_assoc_from_doc(doc) for doc in self._get_many(self.associations_col, keys)]
+
+    def _get_many(self, collection: str, keys: Sequence[str]) -> List[Dict[str, Any]]:
+        if not self._db or not keys:
+            return []
+        col = self._db.collection(collection)
+        docs: List[Dict[str, Any]] = []
+        for chunk in _chunks(keys, self.batch_size):
+            docs.extend(doc for doc in col.get_many(chunk) if doc)
+        return docs
+
+    async def get_node(self, node_id: str) -> Optional[Node]:
+        nodes, _ = self._get_subgraph([node_id])
+        return nodes[0] if nodes else None
+
+    async def get_subgraph(self, node_ids: Sequence[str]) -> Tuple[List[Node], List[Association]]:
+        """The given nodes and the associations among them, in one query."""
+        return self._get_subgraph(node_ids)
+
+    def _get_subgraph(self, node_ids: Sequence[str]) -> Tuple[List[Node], List[Association]]:
+        if not self._db:
+            return [], []
+        cursor = self._db.aql.execute(
+            SUBGRAPH_AQL,
+            bind_vars={
+                "@nodes": self.nodes_col,
+                "@edges": self.associations_col,
+                "keys": list(node_ids),
+                "node_fields": NODE_FIELDS,
+                "edge_fields": EDGE_FIELDS,
+            },
+        )
+        return self._graph_from_result(cursor)
+
+    @staticmethod
+    def _graph_from_result(cursor: Any) -> Tuple[List[Node], List[Association]]:
+        result = next(iter(cursor), None) or {"nodes": [], "edges": []}
+        nodes = [_node_from_doc(doc) for doc in result["nodes"] if doc]
+        associations = [_assoc_from_doc(doc) for doc in result["edges"]]
+        return nodes, associations
+
+    def _insert_many(self, collection: str, docs: Sequence[Dict[str, Any]]) -> None:
+        if not self._db or not docs:
+            return
+        col = self._db.collection(collection)
+        for chunk in _chunks(docs, self.batch_size):
+            col.insert_many(chunk, overwrite=True)
 
     # ---- Embeddings (versioned) ----
     def upsert_embedding_version(self, embedding: Dict[str, Any]) -> str:
@@ -69,8 +344,105 @@ class ArangoGraphStore:
 
     # ---- Weights ----
     async def increment_edge_weight(self, source: str, target: str, delta: float, max_weight: float) -> None:
-        """Increment edge weight with cap. Concrete AQL update should be added here."""
+        """Increment edge weight with cap."""
+        await self.increment_edge_weights(
+            [{"source": source, "target": target, "delta": delta, "max_weight": max_weight}]
+        )
+
+    async def increment_edge_weights(self, updates: Iterable[Any]) -> None:
+        """Applies many capped increments in one AQL UPSERT per batch.
+
+        Accepts EdgeUpdate objects or dicts with source/target/delta/max_weight
+        (and optionally ops). Ops already applied to an edge are skipped, so
+        resending a batch after an error or timeout does not double-count.
+        """
+        self._increment_edge_weights(updates)
+
+    def _increment_edge_weights(self, updates: Iterable[Any]) -> None:
         if not self._db:
             return
-        # Placeholder: a real impl would use afox or AQL update on associations_col
-        return
+        edits = [_edit_dict(update) for update in updates]
+        for chunk in _chunks(edits, self.batch_size):
+            self._db.aql.execute(
+                INCREMENT_EDGE_WEIGHTS_AQL,
+                bind_vars={
+                    "edits": chunk,
+                    "relation": self.default_edge_relation,
+                    "nodes_col": self.nodes_col,
+                    "op_history": self.op_history,
+                    "@col": self.associations_col,
+                },
+            )
+
+
+def _parse_time(value: Any) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else now_utc()
+
+
+def _proto_from_doc(doc: Dict[str, Any]) -> Prototype:
+    return Prototype(
+        id=doc["_key"],
+        name=doc["name"],
+        schema_meta=doc.get("schema_meta") or {},
+        tags=doc.get("tags") or [],
+        created_at=_parse_time(doc.get("created_at")),
+        created_by=doc.get("created_by"),
+        previous_version_id=doc.get("previous_version_id"),
+    )
+
+
+def _node_from_doc(doc: Dict[str, Any]) -> Node:
+    return Node(
+        id=doc["_key"],
+        prototype_id=doc.get("prototype_id"),
+        prototype_ids=doc.get("prototype_ids") or [],
+        payload=doc.get("payload") or {},
+        associations=doc.get("associations") or [],
+        embedding_ref=doc.get("embedding_ref"),
+        weight=doc.get("weight", 0.0),
+        created_at=_parse_time(doc.get("created_at")),
+        created_by=doc.get("created_by"),
+        context_ids=doc.get("context_ids") or [],
+        truth_value=doc.get("truth_value", 0.5),
+        prior=doc.get("prior", 0.5),
+        is_locked=doc.get("is_locked", False),
+    )
+
+
+def _assoc_from_doc(doc: Dict[str, Any]) -> Association:
+    logic_meta = doc.get("logic_meta")
+    return Association(
+        id=doc["_key"],
+        source_id=doc["source_id"],
+        target_id=doc["target_id"],
+        relation=doc.get("relation", ""),
+        weight=doc.get("weight", 0.0),
+        created_at=_parse_time(doc.get("created_at")),
+        created_by=doc.get("created_by"),
+        previous_version_id=doc.get("previous_version_id"),
+        position=doc.get("position"),
+        metadata=doc.get("metadata") or {},
+        logic_meta=LogicMeta.from_dict(logic_meta) if logic_meta else None,
+    )
+
+
+def _edit_dict(update: Any) -> Dict[str, Any]:
+    if isinstance(update, dict):
+        edit = {key: update[key] for key in ("source", "target", "delta", "max_weight")}
+        ops = update.get("ops") or []
+    else:
+        edit = {
+            "source": update.source,
+            "target": update.target,
+            "delta": update.delta,
+            "max_weight": update.max_weight,
+        }
+        ops = update.ops
+    edit["ops"] = [{"id": op_id, "delta": delta} for op_id, delta in ops]
+    return edit
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[List[Any]]:
+    items = list(items)
+    for start in range(0, len(items), max(1, size)):
+        yield items[start : start + size]
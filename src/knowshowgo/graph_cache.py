@@ -0,0 +1,202 @@
+"""Read-through, in-process cache of Node and Association objects.
+
+Entries are keyed by (kind, id) and evicted least-recently-used once
+`max_entries` or (approximately) `max_bytes` is exceeded. Writes (put()
+and invalidate()) advance a global epoch; while any store read is in
+flight, the epoch of each write is remembered per id, and a read only
+caches results for ids not written since it started, so a write racing a
+read is never overwritten by the stale copy. A stamp older than the
+oldest read still in flight can no longer block anything and is dropped,
+so the stamps stay bounded by the writes made during the longest read
+even when reads keep overlapping.
+
+The store is a synchronous ArangoGraphStore (anything with bulk
+get_nodes/get_associations); reads on a miss block the calling thread.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import Association, Node
+
+NODES = "nodes"
+ASSOCIATIONS = "associations"
+
+# Bulk store read for each kind
+LOADERS = {NODES: "get_nodes", ASSOCIATIONS: "get_associations"}
+
+Record = Union[Node, Association]
+
+
+class GraphCache:
+    def __init__(self, store: Any, *, max_entries: int = 100_000, max_bytes: Optional[int] = None) -> None:
+        self.store = store
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Record, int]]" = OrderedDict()
+        self._epoch = 0
+        # Start epoch -> number of reads in flight that started then (oldest first)
+        self._reads_in_flight: "OrderedDict[int, int]" = OrderedDict()
+        # Epoch of the last write per id, oldest first; only writes an in-flight
+        # read may still need to see are kept
+        self._written_at: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cache_info(self) -> Dict[str, Any]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "max_size": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    # ---- Reads ----
+    def get(self, record_id: str, kind: str = NODES) -> Optional[Record]:
+        return self.get_many([record_id], kind).get(record_id)
+
+    def peek(self, record_id: str, kind: str = NODES) -> Optional[Record]:
+        """The cached record, without touching the store or the LRU order."""
+        entry = self._entries.get((kind, record_id))
+        return entry[0] if entry is not None else None
+
+    def get_many(self, ids: Iterable[str], kind: str = NODES) -> Dict[str, Record]:
+        """Cached records for `ids`, fetching only the misses in one bulk read.
+
+        Ids the store does not have are absent from the result.
+        """
+        if kind not in LOADERS:
+            raise ValueError(f"Unknown record kind: {kind}")
+        found: Dict[str, Record] = {}
+        missing: List[str] = []
+        with self._lock:
+            for record_id in dict.fromkeys(ids):
+                entry = self._entries.get((kind, record_id))
+                if entry is not None:
+                    self._entries.move_to_end((kind, record_id))
+                    found[record_id] = entry[0]
+                    self._hits += 1
+                else:
+                    missing.append(record_id)
+                    self._misses += 1
+        if not missing:
+            return found
+
+        with self.loading() as fill:
+            loaded = getattr(self.store, LOADERS[kind])(missing)
+            fill(loaded)
+        found.update((record.id, record) for record in loaded)
+        return found
+
+    @contextmanager
+    def loading(self) -> Iterator[Callable[[Iterable[Record]], None]]:
+        """Brackets a store read done outside the cache (e.g. an async one).
+
+        Yields fill(records), which caches loaded records unless they were
+        written after the block was entered or are already cached (a cached
+        entry is at least as new as the store read).
+        """
+        with self._lock:
+            started = self._epoch
+            self._reads_in_flight[started] = self._reads_in_flight.get(started, 0) + 1
+
+        def fill(records: Iterable[Record]) -> None:
+            with self._lock:
+                for record in records:
+                    key = (_kind(record), record.id)
+                    if key not in self._entries and self._written_at.get(key, -1) < started:
+                        self._store(key[0], record)
+                self._evict()
+
+        try:
+            yield fill
+        finally:
+            with self._lock:
+                self._reads_in_flight[started] -= 1
+                if not self._reads_in_flight[started]:
+                    del self._reads_in_flight[started]
+                    self._drop_stale_stamps()
+
+    # ---- Writes ----
+    def put(self, record: Record) -> None:
+        """Caches a record that was just written."""
+        kind = _kind(record)
+        with self._lock:
+            self._record_write(kind, record.id)
+            self._store(kind, record)
+            self._evict()
+
+    def invalidate(self, ids: Iterable[str], kind: str = NODES) -> None:
+        """Drops records changed behind the cache's back (e.g. a bulk update)."""
+        with self._lock:
+            for record_id in ids:
+                self._record_write(kind, record_id)
+                entry = self._entries.pop((kind, record_id), None)
+                if entry is not None:
+                    self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---- Internals ----
+    def _record_write(self, kind: str, record_id: str) -> None:
+        self._epoch += 1
+        if self._reads_in_flight:
+            key = (kind, record_id)
+            self._written_at[key] = self._epoch
+            self._written_at.move_to_end(key)
+
+    def _drop_stale_stamps(self) -> None:
+        # A read only rejects writes stamped at or after its start
+        oldest = next(iter(self._reads_in_flight), None)
+        while self._written_at:
+            key, stamp = next(iter(self._written_at.items()))
+            if oldest is not None and stamp >= oldest:
+                break
+            del self._written_at[key]
+
+    def _store(self, kind: str, record: Record) -> None:
+        key = (kind, record.id)
+        size = _approx_size(record)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._entries[key] = (record, size)
+        self._bytes += size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+
+def _kind(record: Record) -> str:
+    return NODES if isinstance(record, Node) else ASSOCIATIONS
+
+
+def _approx_size(value: Any) -> int:
+    """Rough deep size in bytes; only containers and the record fields are walked."""
+    if isinstance(value, (Node, Association)):
+        return sys.getsizeof(value) + sum(_approx_size(field) for field in vars(value).values())
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_approx_size(k) + _approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(_approx_size(item) for item in value)
+    return sys.getsizeof(value)
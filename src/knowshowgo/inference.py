@@ -1,4 +1,3 @@
-import asyncio
 import re
 from typing import Dict, Tuple, Optional
 
@@ -58,10 +57,9 @@ def process_instruction(
     if working_memory:
         weight = working_memory.link(prototype.id, instance.id, seed_weight=embedding_similarity)
         if replicator:
-            # Fire-and-forget replication; caller should ensure replicator.start() is running
-            asyncio.create_task(
-                replicator.enqueue(
-                    EdgeUpdate(source=prototype.id, target=instance.id, delta=working_memory.reinforce_delta, max_weight=working_memory.max_weight)
-                )
-            )
+            # Caller should ensure replicator.start() is running. This function
+            # cannot wait, so a full "block" queue rejects the update (counted
+            # in replicator.metrics()["rejected"]) instead of buffering it.
+            update = EdgeUpdate(source=prototype.id, target=instance.id, delta=working_memory.reinforce_delta, max_weight=working_memory.max_weight)
+            replicator.enqueue_nowait(update)
     return prototype, instance
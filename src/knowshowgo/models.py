@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -14,6 +16,12 @@ def gen_id() -> str:
     return uuid4().hex
 
 
+def content_id(*parts: Any) -> str:
+    """Deterministic id (same length as gen_id) derived from JSON-serializable content."""
+    blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
 @dataclass(frozen=True)
 class Prototype:
     """Immutable prototype; edits create a new version via previous_version_id."""
@@ -33,9 +41,10 @@ class Prototype:
         tags: Optional[List[str]] = None,
         created_by: Optional[str] = None,
         previous_version_id: Optional[str] = None,
+        proto_id: Optional[str] = None,
     ) -> "Prototype":
         return Prototype(
-            id=gen_id(),
+            id=proto_id or gen_id(),
             name=name,
             schema_meta=schema_meta,
             tags=tags or [],
@@ -232,6 +241,26 @@ class Association:
             created_by=created_by,
         )
 
+    @staticmethod
+    def create_mutex(
+        source_id: str,
+        target_id: str,
+        relation: str = "mutex",
+        weight: float = 1.0,
+        created_by: Optional[str] = None,
+        group: Optional[str] = None,
+    ) -> "Association":
+        """Creates a mutual-exclusion edge; edges sharing `group` form one MUTEX group."""
+        return Association.create(
+            source_id=source_id,
+            target_id=target_id,
+            relation=relation,
+            logic_type=LogicType.MUTEX,
+            logic_weight=weight,
+            created_by=created_by,
+            metadata={"mutex_group": group} if group is not None else None,
+        )
+
     @staticmethod
     def create_follows(
         source_id: str,
@@ -265,14 +294,24 @@ QUANTITY_PROTOTYPE = "QUANTITY"
 
 
 def seed_core_prototypes(created_by: Optional[str] = None) -> Dict[str, Prototype]:
-    """Generate immutable core prototypes for bootstrapping."""
+    """Generate immutable core prototypes for bootstrapping.
+
+    Ids are content-addressed (name, schema, tags), so every process seeds the
+    same ids and a changed definition gets a new one.
+    """
 
     def proto(name: str, description: str, extra_tags: Optional[List[str]] = None, meta: Optional[Dict[str, Any]] = None) -> Prototype:
         schema = {"description": description}
         if meta:
             schema.update(meta)
         tags = extra_tags or []
-        return Prototype.base(name=name, schema_meta=schema, tags=tags, created_by=created_by)
+        return Prototype.base(
+            name=name,
+            schema_meta=schema,
+            tags=tags,
+            created_by=created_by,
+            proto_id=content_id("prototype", name, schema, tags),
+        )
 
     return {
         ROOT_PROTOTYPE: proto(ROOT_PROTOTYPE, "Base node prototype"),
@@ -16,6 +16,7 @@ from .logic import (
     support,
 )
 from .engine import NeuroEngine
+from .instrumentation import InstrumentationSink, EngineMetrics
 from .types import NeuroJSON, Variable, Rule, Constraint
 
 __all__ = [
@@ -30,6 +31,9 @@ __all__ = [
     "support",
     # Engine
     "NeuroEngine",
+    # Instrumentation
+    "InstrumentationSink",
+    "EngineMetrics",
     # Types
     "NeuroJSON",
     "Variable",
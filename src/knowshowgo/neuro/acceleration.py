@@ -0,0 +1,186 @@
+"""
+Fixed-Point Acceleration Module
+
+Strategies for speeding up the damped fixed-point loop in NeuroEngine.run.
+One engine iteration (forward pass + constraints) is treated as a map
+G(x) -> x' over the free (unlocked) variables; an accelerator decides the
+next iterate from the current iterate x and the mapped state g = G(x).
+
+Strategies:
+- none:     x' = g (plain damped iteration)
+- adaptive: x' = x + step * (g - x), where the step grows while the
+            residual shrinks and is cut back when it oscillates
+- sor:      x' = x + omega * (g - x) (successive over-relaxation)
+- anderson: Anderson mixing over the last k residuals
+"""
+
+from typing import List, Optional
+
+from .logic import clamp
+from .types import EngineConfig
+
+
+ACCELERATION_STRATEGIES = ("none", "adaptive", "sor", "anderson")
+
+
+class Accelerator:
+    """Base accelerator: plain fixed-point iteration."""
+
+    def __init__(self, config: EngineConfig):
+        self.config = config
+
+    def reset(self) -> None:
+        """Clears per-run state."""
+
+    def mix(self, x: List[float], g: List[float], residual: float) -> List[float]:
+        """Returns the next iterate given current state x and mapped state g."""
+        return g
+
+
+class AdaptiveDamping(Accelerator):
+    """
+    Adaptive outer damping: grows the step while the residual shrinks and
+    halves it when the residual grows (oscillation).
+
+    The engine's own damping_factor is left untouched so the fixed point
+    is the same as for the plain iteration.
+    """
+
+    def __init__(self, config: EngineConfig, growth: float = 1.2, backoff: float = 0.5):
+        super().__init__(config)
+        self.growth = growth
+        self.backoff = backoff
+        self.step = 1.0
+        self._last_residual: Optional[float] = None
+
+    def reset(self) -> None:
+        super().reset()
+        self.step = 1.0
+        self._last_residual = None
+
+    def mix(self, x: List[float], g: List[float], residual: float) -> List[float]:
+        if self._last_residual is not None:
+            if residual < self._last_residual:
+                self.step = min(self.config.adaptive_max_step, self.step * self.growth)
+            else:
+                self.step = max(self.config.adaptive_min_step, self.step * self.backoff)
+        self._last_residual = residual
+        step = self.step
+        return [clamp(xi + step * (gi - xi)) for xi, gi in zip(x, g)]
+
+
+class OverRelaxation(Accelerator):
+    """Successive over-relaxation: extrapolates along the update direction."""
+
+    def mix(self, x: List[float], g: List[float], residual: float) -> List[float]:
+        omega = self.config.relaxation_factor
+        return [clamp(xi + omega * (gi - xi)) for xi, gi in zip(x, g)]
+
+
+class AndersonMixing(Accelerator):
+    """
+    Anderson mixing (type II) over the last `anderson_depth` iterates.
+
+    Solves the small least-squares problem min ||f_k - dF * gamma|| via
+    regularized normal equations and extrapolates x' = g_k - dG * gamma.
+    Falls back to the plain iterate when the system is ill-conditioned.
+    """
+
+    def __init__(self, config: EngineConfig, regularization: float = 1e-10):
+        super().__init__(config)
+        self.regularization = regularization
+        self._prev_f: Optional[List[float]] = None
+        self._prev_g: Optional[List[float]] = None
+        self._delta_f: List[List[float]] = []
+        self._delta_g: List[List[float]] = []
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev_f = None
+        self._prev_g = None
+        self._delta_f = []
+        self._delta_g = []
+
+    def mix(self, x: List[float], g: List[float], residual: float) -> List[float]:
+        f = [gi - xi for xi, gi in zip(x, g)]
+
+        if self._prev_f is not None and self._prev_g is not None:
+            self._delta_f.append([a - b for a, b in zip(f, self._prev_f)])
+            self._delta_g.append([a - b for a, b in zip(g, self._prev_g)])
+            if len(self._delta_f) > self.config.anderson_depth:
+                self._delta_f.pop(0)
+                self._delta_g.pop(0)
+
+        self._prev_f = f
+        self._prev_g = g
+
+        if not self._delta_f:
+            return g
+
+        gamma = self._solve(f)
+        if gamma is None:
+            return g
+
+        mixed = list(g)
+        for coeff, dg in zip(gamma, self._delta_g):
+            for i, value in enumerate(dg):
+                mixed[i] -= coeff * value
+        return [clamp(v) for v in mixed]
+
+    def _solve(self, f: List[float]) -> Optional[List[float]]:
+        """Solves (dF^T dF + lambda I) gamma = dF^T f by Gaussian elimination."""
+        m = len(self._delta_f)
+        gram = [[0.0] * m for _ in range(m)]
+        rhs = [0.0] * m
+        for a in range(m):
+            fa = self._delta_f[a]
+            rhs[a] = sum(p * q for p, q in zip(fa, f))
+            for b in range(a, m):
+                value = sum(p * q for p, q in zip(fa, self._delta_f[b]))
+                gram[a][b] = value
+                gram[b][a] = value
+        scale = max((gram[i][i] for i in range(m)), default=0.0)
+        if scale <= 0.0:
+            return None
+        for i in range(m):
+            gram[i][i] += self.regularization * scale
+
+        # Gaussian elimination with partial pivoting
+        for col in range(m):
+            pivot = max(range(col, m), key=lambda r: abs(gram[r][col]))
+            if abs(gram[pivot][col]) < 1e-14:
+                return None
+            gram[col], gram[pivot] = gram[pivot], gram[col]
+            rhs[col], rhs[pivot] = rhs[pivot], rhs[col]
+            for row in range(col + 1, m):
+                factor = gram[row][col] / gram[col][col]
+                for k in range(col, m):
+                    gram[row][k] -= factor * gram[col][k]
+                rhs[row] -= factor * rhs[col]
+
+        gamma = [0.0] * m
+        for row in range(m - 1, -1, -1):
+            acc = rhs[row] - sum(gram[row][k] * gamma[k] for k in range(row + 1, m))
+            gamma[row] = acc / gram[row][row]
+        return gamma
+
+
+def create_accelerator(config: EngineConfig) -> Optional[Accelerator]:
+    """
+    Creates the accelerator selected by `config.acceleration`.
+
+    Returns None for "none" so the engine can skip snapshotting entirely.
+    """
+    strategy = (config.acceleration or "none").lower()
+    if strategy == "none":
+        return None
+    if strategy == "adaptive":
+        return AdaptiveDamping(config)
+    if strategy == "sor":
+        return OverRelaxation(config)
+    if strategy == "anderson":
+        return AndersonMixing(config)
+    raise ValueError(
+        f"Unknown acceleration strategy: {config.acceleration} "
+        f"(expected one of {ACCELERATION_STRATEGIES})"
+    )
@@ -5,8 +5,10 @@ The main entry point for neurosymbolic reasoning.
 Combines graph management and inference into a clean API.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
 
 from .logic import (
     clamp,
@@ -18,6 +20,16 @@ from .logic import (
     support,
     mutex_normalize,
 )
+from .acceleration import Accelerator, create_accelerator
+from .sparse import SparseConstraintSet
+from .mutex import MutexGroupIndex, mutex_members
+from .instrumentation import (
+    InstrumentationSink,
+    PHASE_ACCELERATION,
+    PHASE_CONSTRAINTS,
+    PHASE_FORWARD_PASS,
+    PHASE_RESET,
+)
 from .types import (
     NeuroJSON,
     Variable,
@@ -25,6 +37,7 @@ from .types import (
     Constraint,
     VariableState,
     EngineConfig,
+    InferenceResult,
     TruthValue,
     create_default_config,
 )
@@ -71,14 +84,24 @@ class NeuroEngine:
         print(result["wet_ground"])  # ~0.95
     """
 
-    def __init__(self, schema: NeuroJSON, config: Optional[EngineConfig] = None):
+    def __init__(
+        self,
+        schema: NeuroJSON,
+        config: Optional[EngineConfig] = None,
+        instrumentation: Optional[InstrumentationSink] = None,
+    ):
         self.config = config or create_default_config()
+        self.instrumentation = instrumentation
         self._variables: Dict[str, Variable] = {}
         self._rules: Dict[str, Rule] = {}
         self._constraints: Dict[str, Constraint] = {}
         self._states: Dict[str, VariableState] = {}
         self._var_to_input_rules: Dict[str, List[str]] = {}
         self._var_to_output_rules: Dict[str, List[str]] = {}
+        self._accelerator: Optional[Accelerator] = create_accelerator(self.config)
+        self._rule_evaluations = 0
+        self._sparse_constraints: Optional[SparseConstraintSet] = None
+        self._mutex_index = MutexGroupIndex([], [])
         
         self._load(schema)
 
@@ -112,6 +135,16 @@ class NeuroEngine:
         # Load constraints
         for constraint in schema.get("constraints", []):
             self._constraints[constraint["id"]] = constraint
+        
+        self._mutex_index = MutexGroupIndex(self._variables, self._constraints.values())
+        
+        mode = self.config.constraint_mode
+        if mode == "sparse":
+            self._sparse_constraints = SparseConstraintSet(
+                list(self._variables), self._constraints.values()
+            )
+        elif mode != "sequential":
+            raise ValueError(f"Unknown constraint mode: {mode}")
 
     # =========================================================================
     # Inference
@@ -134,7 +167,71 @@ class NeuroEngine:
         Returns:
             Dict with all variable values after inference
         """
+        self._infer(evidence, iterations)
+        return self._get_all_values()
+
+    def run_detailed(
+        self,
+        evidence: Optional[Evidence] = None,
+        iterations: Optional[int] = None,
+        history_variables: Optional[List[str]] = None,
+        history_size: int = 100,
+    ) -> InferenceResult:
+        """
+        Runs inference and reports how it went.
+        
+        Same semantics as run(), but returns an InferenceResult with the
+        iteration count, convergence flag, per-iteration max delta, wall
+        time and number of rule evaluations.
+        
+        Args:
+            evidence: Optional variable -> value mappings to lock
+            iterations: Optional max iterations (defaults to config)
+            history_variables: Optional variables to snapshot after every
+                iteration (history is None when omitted)
+            history_size: Max snapshots kept; older ones are dropped
+        
+        Returns:
+            InferenceResult with copies of the final variable states
+        """
+        deltas: List[float] = []
+        history: Optional[Deque[Dict[str, TruthValue]]] = None
+        tracked: List[str] = []
+        if history_variables is not None:
+            history = deque(maxlen=max(1, history_size))
+            tracked = [name for name in history_variables if name in self._states]
+        
+        def record(delta: float) -> None:
+            deltas.append(delta)
+            if history is not None:
+                history.append({name: self._states[name].value for name in tracked})
+        
+        evaluations_before = self._rule_evaluations
+        started = time.perf_counter()
+        iterations_run, converged = self._infer(evidence, iterations, record)
+        wall_time = time.perf_counter() - started
+        
+        return InferenceResult(
+            states={name: replace(state) for name, state in self._states.items()},
+            iterations=iterations_run,
+            converged=converged,
+            history=list(history) if history is not None else None,
+            deltas=deltas,
+            wall_time=wall_time,
+            rule_evaluations=self._rule_evaluations - evaluations_before,
+        )
+
+    def _infer(
+        self,
+        evidence: Optional[Evidence],
+        iterations: Optional[int],
+        on_iteration: Optional[Callable[[float], None]] = None,
+    ) -> Tuple[int, bool]:
+        """Resets, locks evidence and iterates; returns (iterations, converged)."""
         max_iter = iterations or self.config.max_iterations
+        threshold = self.config.convergence_threshold
+        sink = self.instrumentation
+        started = time.perf_counter() if sink is not None else 0.0
         
         # Reset to priors
         self._reset_to_priors()
@@ -146,16 +243,124 @@ class NeuroEngine:
                     self._states[name].value = clamp(value)
                     self._states[name].locked = True
         
+        if sink is not None:
+            sink.on_phase(PHASE_RESET, time.perf_counter() - started)
+        
         # Run inference loop
-        for _ in range(max_iter):
-            rule_delta = self._forward_pass()
-            constraint_delta = self._apply_constraints()
+        accelerator = self._accelerator
+        free_states: List[VariableState] = []
+        if accelerator is not None:
+            accelerator.reset()
+            free_states = [state for state in self._states.values() if not state.locked]
+        
+        iterations_run, converged = max_iter, False
+        for iteration in range(1, max_iter + 1):
+            if accelerator is not None:
+                total_delta = self._accelerated_step(accelerator, free_states)
+            elif sink is None:
+                rule_delta = self._forward_pass()
+                constraint_delta = self._apply_constraints()
+                total_delta = max(rule_delta, constraint_delta)
+            else:
+                rule_delta = self._timed(sink, PHASE_FORWARD_PASS, self._forward_pass)
+                constraint_delta = self._timed(sink, PHASE_CONSTRAINTS, self._apply_constraints)
+                total_delta = max(rule_delta, constraint_delta)
             
-            total_delta = max(rule_delta, constraint_delta)
-            if total_delta < self.config.convergence_threshold:
+            if on_iteration is not None:
+                on_iteration(total_delta)
+            if total_delta < threshold:
+                iterations_run, converged = iteration, True
                 break
         
-        return self._get_all_values()
+        if sink is not None:
+            self._report_run(sink, iterations_run, converged, time.perf_counter() - started)
+        return iterations_run, converged
+
+    def _accelerated_step(self, accelerator: Accelerator, free_states: List[VariableState]) -> float:
+        """Runs one iteration G(x) and lets the accelerator pick the next iterate."""
+        sink = self.instrumentation
+        x = [state.value for state in free_states]
+        if sink is None:
+            self._forward_pass()
+            self._apply_constraints()
+        else:
+            self._timed(sink, PHASE_FORWARD_PASS, self._forward_pass)
+            self._timed(sink, PHASE_CONSTRAINTS, self._apply_constraints)
+        g = [state.value for state in free_states]
+        
+        # Measure the fixed-point residual |G(x) - x| rather than per-stage
+        # deltas, which never vanish when constraints pull against rules.
+        residual = max((abs(gi - xi) for xi, gi in zip(x, g)), default=0.0)
+        if residual < self.config.convergence_threshold:
+            return residual
+        
+        if sink is None:
+            mixed = accelerator.mix(x, g, residual)
+        else:
+            mixed = self._timed(sink, PHASE_ACCELERATION, lambda: accelerator.mix(x, g, residual))
+        for state, value in zip(free_states, mixed):
+            state.value = value
+        return residual
+
+    # =========================================================================
+    # Instrumentation
+    # =========================================================================
+
+    @staticmethod
+    def _timed(sink: InstrumentationSink, phase: str, fn: Callable[[], Any]) -> Any:
+        """Calls fn and reports its wall time to the sink."""
+        started = time.perf_counter()
+        result = fn()
+        sink.on_phase(phase, time.perf_counter() - started)
+        return result
+
+    def _report_run(self, sink: InstrumentationSink, iterations: int, converged: bool, seconds: float) -> None:
+        """
+        Reports per-run counts to the sink.
+        
+        The set of locked variables is fixed for the whole run, so the work per
+        iteration is constant and counts are derived once instead of being
+        tallied in the hot loop.
+        """
+        rule_counts: Dict[str, int] = {}
+        for var_name, rule_ids in self._var_to_output_rules.items():
+            if not rule_ids or self._states[var_name].locked:
+                continue
+            for rule_id in rule_ids:
+                rule_type = self._rules[rule_id].get("type", "IMPLICATION")
+                rule_counts[rule_type] = rule_counts.get(rule_type, 0) + iterations
+        
+        constraint_counts: Dict[str, int] = {}
+        for constraint in self._constraints.values():
+            c_type = constraint.get("type", "")
+            updates = self._constraint_target_count(constraint)
+            if updates:
+                constraint_counts[c_type] = constraint_counts.get(c_type, 0) + updates * iterations
+        
+        sink.on_rule_evaluations(rule_counts)
+        sink.on_constraint_updates(constraint_counts)
+        sink.on_run(iterations, converged, seconds)
+
+    def _constraint_target_count(self, constraint: Constraint) -> int:
+        """Number of targets a constraint updates per iteration."""
+        c_type = constraint.get("type")
+        if c_type == "MUTEX":
+            members = [name for name in mutex_members(constraint) if name in self._states]
+            if len(members) < 2:
+                return 0
+            return sum(1 for name in members if not self._states[name].locked)
+        if c_type not in ("ATTACK", "SUPPORT"):
+            return 0
+        if constraint.get("source", "") not in self._states:
+            return 0
+        target = constraint.get("target", "")
+        targets = [target] if isinstance(target, str) else target
+        count = 0
+        for target_name in targets:
+            state = self._states.get(target_name)
+            if state is not None and not state.locked:
+                count += 1
+        return count
 
     def query(self, variable: str, evidence: Optional[Evidence] = None) -> TruthValue:
         """Queries a specific variable given evidence."""
@@ -187,6 +392,7 @@ class NeuroEngine:
             if state.locked:
                 continue
             
+            self._rule_evaluations += len(rule_ids)
             # Compute contributions from all rules
             contributions: List[TruthValue] = []
             weights: List[float] = []
@@ -232,7 +438,7 @@ class NeuroEngine:
         weight = rule.get("weight", 1.0)
         
         if rule_type == "IMPLICATION":
-            antecedent = apply_operation(op, input_values)
+            antecedent = apply_operation(op, input_values, rule.get("weights"))
             result = antecedent * weight
         elif rule_type == "CONJUNCTION":
             result = fuzzy_and(*input_values) * weight
@@ -249,7 +455,11 @@ class NeuroEngine:
         return clamp(result)
 
     def _apply_constraints(self) -> float:
-        """Applies all constraints."""
+        """Applies all constraints; MUTEX groups are normalized last, in one step."""
+        if self._sparse_constraints is not None:
+            max_delta = self._sparse_constraints.apply(self._states)
+            return max(max_delta, self._mutex_index.apply(self._states))
+        
         max_delta = 0.0
         
         for constraint in self._constraints.values():
@@ -261,9 +471,8 @@ class NeuroEngine:
             elif c_type == "SUPPORT":
                 delta = self._apply_support(constraint)
                 max_delta = max(max_delta, delta)
-            # MUTEX handling would go here
         
-        return max_delta
+        return max(max_delta, self._mutex_index.apply(self._states))
 
     def _apply_attack(self, constraint: Constraint) -> float:
         """Applies an attack constraint."""
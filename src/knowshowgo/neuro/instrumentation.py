@@ -0,0 +1,166 @@
+"""
+Instrumentation Module
+
+Pluggable hooks for seeing where inference time goes inside NeuroEngine.run.
+An engine with no sink attached skips all timing calls; attach a sink
+(e.g. EngineMetrics) to receive per-run phase timings, rule/constraint
+counts and convergence iterations.
+
+Example:
+    metrics = EngineMetrics()
+    engine = NeuroEngine(schema, instrumentation=metrics)
+    engine.run({"raining": 1.0})
+    print(metrics.to_prometheus())
+"""
+
+from typing import Any, Dict, List
+
+
+# Phases reported by NeuroEngine
+PHASE_RESET = "reset"
+PHASE_FORWARD_PASS = "forward_pass"
+PHASE_CONSTRAINTS = "constraints"
+PHASE_ACCELERATION = "acceleration"
+
+
+class InstrumentationSink:
+    """
+    Base sink: receives engine events and ignores them.
+
+    Subclass and override the hooks you care about.
+    """
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        """Called with the time spent in one phase of one iteration (or reset)."""
+
+    def on_rule_evaluations(self, counts: Dict[str, int]) -> None:
+        """Called once per run with rule evaluations keyed by rule type."""
+
+    def on_constraint_updates(self, counts: Dict[str, int]) -> None:
+        """Called once per run with target updates keyed by constraint type."""
+
+    def on_run(self, iterations: int, converged: bool, seconds: float) -> None:
+        """Called at the end of each run."""
+
+
+class EngineMetrics(InstrumentationSink):
+    """Aggregating sink with dict and Prometheus text export."""
+
+    def __init__(self, prefix: str = "neurosym_engine"):
+        self.prefix = prefix
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears all accumulated metrics."""
+        self.runs = 0
+        self.converged_runs = 0
+        self.iterations_total = 0
+        self.last_iterations = 0
+        self.run_seconds_total = 0.0
+        self.phase_seconds: Dict[str, float] = {}
+        self.phase_calls: Dict[str, int] = {}
+        self.rule_evaluations: Dict[str, int] = {}
+        self.constraint_updates: Dict[str, int] = {}
+
+    def on_phase(self, phase: str, seconds: float) -> None:
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+
+    def on_rule_evaluations(self, counts: Dict[str, int]) -> None:
+        for rule_type, count in counts.items():
+            self.rule_evaluations[rule_type] = self.rule_evaluations.get(rule_type, 0) + count
+
+    def on_constraint_updates(self, counts: Dict[str, int]) -> None:
+        for c_type, count in counts.items():
+            self.constraint_updates[c_type] = self.constraint_updates.get(c_type, 0) + count
+
+    def on_run(self, iterations: int, converged: bool, seconds: float) -> None:
+        self.runs += 1
+        self.converged_runs += 1 if converged else 0
+        self.iterations_total += iterations
+        self.last_iterations = iterations
+        self.run_seconds_total += seconds
+
+    # =========================================================================
+    # Export
+    # =========================================================================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exports metrics as a structured dict."""
+        return {
+            "runs": self.runs,
+            "converged_runs": self.converged_runs,
+            "iterations_total": self.iterations_total,
+            "last_iterations": self.last_iterations,
+            "run_seconds_total": self.run_seconds_total,
+            "phases": {
+                phase: {"seconds": seconds, "calls": self.phase_calls.get(phase, 0)}
+                for phase, seconds in self.phase_seconds.items()
+            },
+            "rule_evaluations": dict(self.rule_evaluations),
+            "constraint_updates": dict(self.constraint_updates),
+        }
+
+    def to_prometheus(self) -> str:
+        """Exports metrics in the Prometheus text exposition format."""
+        p = self.prefix
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List[str]) -> None:
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            lines.extend(samples)
+
+        metric("runs_total", "counter", "Inference runs.", [f"{p}_runs_total {self.runs}"])
+        metric(
+            "converged_runs_total",
+            "counter",
+            "Inference runs that reached the convergence threshold.",
+            [f"{p}_converged_runs_total {self.converged_runs}"],
+        )
+        metric(
+            "iterations_total",
+            "counter",
+            "Inference iterations across all runs.",
+            [f"{p}_iterations_total {self.iterations_total}"],
+        )
+        metric(
+            "last_iterations",
+            "gauge",
+            "Iterations used by the most recent run.",
+            [f"{p}_last_iterations {self.last_iterations}"],
+        )
+        metric(
+            "run_seconds_total",
+            "counter",
+            "Wall time spent in runs.",
+            [f"{p}_run_seconds_total {self.run_seconds_total:.9f}"],
+        )
+        metric(
+            "phase_seconds_total",
+            "counter",
+            "Wall time spent per engine phase.",
+            [
+                f'{p}_phase_seconds_total{{phase="{phase}"}} {seconds:.9f}'
+                for phase, seconds in sorted(self.phase_seconds.items())
+            ],
+        )
+        metric(
+            "rule_evaluations_total",
+            "counter",
+            "Rule evaluations by rule type.",
+            [
+                f'{p}_rule_evaluations_total{{rule_type="{rule_type}"}} {count}'
+                for rule_type, count in sorted(self.rule_evaluations.items())
+            ],
+        )
+        metric(
+            "constraint_updates_total",
+            "counter",
+            "Constraint target updates by constraint type.",
+            [
+                f'{p}_constraint_updates_total{{constraint_type="{c_type}"}} {count}'
+                for c_type, count in sorted(self.constraint_updates.items())
+            ],
+        )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,144 @@
+"""
+Mutual Exclusion Module
+
+Indexes MUTEX constraints as groups of member variables and normalizes
+every group in one pass per iteration, so work is linear in the total
+number of memberships (no pairwise expansion).
+
+A MUTEX constraint's group is its source plus all of its targets. Locked
+members keep their values; free members are scaled down proportionally
+so the group sums to at most 1:
+
+    cap   = max(0, 1 - sum(locked members))
+    scale = cap / sum(free members)        (only when the free sum exceeds cap)
+    v'    = v * (1 - weight + weight * scale)
+
+The constraint weight blends between no normalization (0) and full
+normalization (1). A variable in several groups takes its most
+restrictive scale. NumPy is used when installed.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from .types import Constraint, VariableState
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+
+def mutex_members(constraint: Constraint) -> List[str]:
+    """Returns the ordered, de-duplicated member names of a MUTEX constraint."""
+    target = constraint.get("target", [])
+    targets = [target] if isinstance(target, str) else list(target or [])
+    source = constraint.get("source")
+    members = ([source] if source else []) + targets
+    return list(dict.fromkeys(members))
+
+
+class MutexGroupIndex:
+    """Flat membership index over all MUTEX groups."""
+
+    def __init__(self, variables: Iterable[str], constraints: Iterable[Constraint]):
+        known = set(variables)
+        self.groups: List[List[str]] = []
+        self.weights: List[float] = []
+        # Flat membership arrays: entry k is variable member_names[k] in group member_group[k]
+        self.member_names: List[str] = []
+        self.member_group: List[int] = []
+
+        for constraint in constraints:
+            if constraint.get("type") != "MUTEX":
+                continue
+            members = [name for name in mutex_members(constraint) if name in known]
+            if len(members) < 2:
+                continue
+            group_id = len(self.groups)
+            self.groups.append(members)
+            self.weights.append(constraint.get("weight", 1.0))
+            self.member_names.extend(members)
+            self.member_group.extend([group_id] * len(members))
+
+        self.variables: List[str] = list(dict.fromkeys(self.member_names))
+        var_pos = {name: i for i, name in enumerate(self.variables)}
+        self.member_var: List[int] = [var_pos[name] for name in self.member_names]
+
+        self._np: Optional[Dict[str, object]] = None
+        if np is not None and self.groups:
+            self._np = {
+                "group": np.asarray(self.member_group, dtype=np.int64),
+                "var": np.asarray(self.member_var, dtype=np.int64),
+                "weight": np.asarray(self.weights, dtype=np.float64),
+            }
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def apply(self, states: Dict[str, VariableState]) -> float:
+        """Normalizes all groups in place; returns the max delta."""
+        if not self.groups:
+            return 0.0
+        var_states = [states[name] for name in self.variables]
+        values = [state.value for state in var_states]
+        locked = [state.locked for state in var_states]
+
+        if self._np is not None:
+            scales = self._scales_numpy(values, locked)
+        else:
+            scales = self._scales_python(values, locked)
+
+        max_delta = 0.0
+        for state, value, is_locked, scale in zip(var_states, values, locked, scales):
+            if is_locked or scale >= 1.0:
+                continue
+            new_value = value * scale
+            delta = value - new_value
+            if delta > max_delta:
+                max_delta = delta
+            state.value = new_value
+        return max_delta
+
+    def _scales_numpy(self, values: List[float], locked: List[bool]) -> List[float]:
+        group = self._np["group"]
+        var = self._np["var"]
+        weight = self._np["weight"]
+        n_groups = len(self.groups)
+
+        member_values = np.asarray(values, dtype=np.float64)[var]
+        member_locked = np.asarray(locked, dtype=bool)[var]
+        locked_mass = np.bincount(group, weights=np.where(member_locked, member_values, 0.0), minlength=n_groups)
+        free_mass = np.bincount(group, weights=np.where(member_locked, 0.0, member_values), minlength=n_groups)
+        cap = np.maximum(0.0, 1.0 - locked_mass)
+
+        scale = np.ones(n_groups, dtype=np.float64)
+        over = free_mass > cap
+        scale[over] = cap[over] / free_mass[over]
+        group_scale = 1.0 - weight + weight * scale
+
+        var_scale = np.ones(len(self.variables), dtype=np.float64)
+        np.minimum.at(var_scale, var, group_scale[group])
+        return var_scale.tolist()
+
+    def _scales_python(self, values: List[float], locked: List[bool]) -> List[float]:
+        n_groups = len(self.groups)
+        locked_mass = [0.0] * n_groups
+        free_mass = [0.0] * n_groups
+        for group_id, var_idx in zip(self.member_group, self.member_var):
+            if locked[var_idx]:
+                locked_mass[group_id] += values[var_idx]
+            else:
+                free_mass[group_id] += values[var_idx]
+
+        group_scale = [1.0] * n_groups
+        for group_id in range(n_groups):
+            cap = max(0.0, 1.0 - locked_mass[group_id])
+            if free_mass[group_id] > cap:
+                weight = self.weights[group_id]
+                group_scale[group_id] = 1.0 - weight + weight * (cap / free_mass[group_id])
+
+        var_scale = [1.0] * len(self.variables)
+        for group_id, var_idx in zip(self.member_group, self.member_var):
+            if group_scale[group_id] < var_scale[var_idx]:
+                var_scale[var_idx] = group_scale[group_id]
+        return var_scale
@@ -0,0 +1,172 @@
+"""
+Sparse Constraint Propagation Module
+
+Represents ATTACK and SUPPORT constraints as sparse weighted adjacency
+matrices in CSR form (rows = targets, columns = sources) and applies each
+family in a single multiplicative update per iteration:
+
+    ATTACK:  t' = t * prod(1 - a_i * w_i)
+    SUPPORT: t' = 1 - (1 - t) * prod(1 - s_i * w_i)
+
+The products are computed as exp(sum(log1p(-x))) per target. All source
+values are read from one snapshot taken before the update, so the result
+does not depend on the order constraints were declared in. Attacks are
+applied before supports.
+
+NumPy is used when installed; otherwise an equivalent pure-Python loop
+over the CSR arrays is used.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .types import Constraint, VariableState
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+
+@dataclass
+class CsrMatrix:
+    """
+    Target-by-source weight matrix in compressed sparse row form.
+
+    Row r covers entries indptr[r]:indptr[r + 1] and updates variable
+    targets[r]; indices holds source variable indices.
+    """
+
+    targets: List[int] = field(default_factory=list)
+    indptr: List[int] = field(default_factory=lambda: [0])
+    indices: List[int] = field(default_factory=list)
+    weights: List[float] = field(default_factory=list)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    @staticmethod
+    def from_edges(edges: Iterable[Tuple[int, int, float]]) -> "CsrMatrix":
+        """Builds a matrix from (target, source, weight) triples."""
+        by_target: Dict[int, List[Tuple[int, float]]] = {}
+        for target, source, weight in edges:
+            by_target.setdefault(target, []).append((source, weight))
+
+        matrix = CsrMatrix()
+        for target in sorted(by_target):
+            matrix.targets.append(target)
+            for source, weight in by_target[target]:
+                matrix.indices.append(source)
+                matrix.weights.append(weight)
+            matrix.indptr.append(len(matrix.indices))
+        return matrix
+
+    def log_factors(self, values: List[float]) -> List[float]:
+        """Per-row sum of log(1 - value[source] * weight), pure Python."""
+        out: List[float] = []
+        indices, weights, indptr = self.indices, self.weights, self.indptr
+        for row in range(len(self.targets)):
+            total = 0.0
+            for k in range(indptr[row], indptr[row + 1]):
+                strength = values[indices[k]] * weights[k]
+                if strength >= 1.0:
+                    total = -math.inf
+                    break
+                if strength > 0.0:
+                    total += math.log1p(-strength)
+            out.append(total)
+        return out
+
+
+class SparseConstraintSet:
+    """ATTACK and SUPPORT constraints compiled to CSR matrices."""
+
+    def __init__(self, variables: List[str], constraints: Iterable[Constraint]):
+        self.variables = list(variables)
+        index = {name: i for i, name in enumerate(self.variables)}
+
+        attack_edges: List[Tuple[int, int, float]] = []
+        support_edges: List[Tuple[int, int, float]] = []
+        for constraint in constraints:
+            c_type = constraint.get("type", "")
+            if c_type == "ATTACK":
+                edges = attack_edges
+            elif c_type == "SUPPORT":
+                edges = support_edges
+            else:
+                continue
+            source = index.get(constraint.get("source", ""))
+            if source is None:
+                continue
+            target = constraint.get("target", "")
+            targets = [target] if isinstance(target, str) else target
+            weight = constraint.get("weight", 1.0)
+            for target_name in targets:
+                target_idx = index.get(target_name)
+                if target_idx is not None:
+                    edges.append((target_idx, source, weight))
+
+        self.attack = CsrMatrix.from_edges(attack_edges)
+        self.support = CsrMatrix.from_edges(support_edges)
+        self.touched: List[int] = sorted(set(self.attack.targets) | set(self.support.targets))
+        self._np: Optional[Dict[str, object]] = self._compile_numpy() if np is not None else None
+
+    def _compile_numpy(self) -> Dict[str, object]:
+        compiled: Dict[str, object] = {}
+        for family, matrix in (("attack", self.attack), ("support", self.support)):
+            counts = [matrix.indptr[r + 1] - matrix.indptr[r] for r in range(len(matrix.targets))]
+            compiled[family] = (
+                np.asarray(matrix.targets, dtype=np.int64),
+                np.asarray(matrix.indices, dtype=np.int64),
+                np.asarray(matrix.weights, dtype=np.float64),
+                np.repeat(np.arange(len(matrix.targets), dtype=np.int64), counts),
+            )
+        return compiled
+
+    def apply(self, states: Dict[str, VariableState]) -> float:
+        """Applies both constraint families in place; returns the max delta."""
+        if not self.touched:
+            return 0.0
+        values = [states[name].value for name in self.variables]
+        if self._np is not None:
+            updated = self._apply_numpy(values)
+        else:
+            updated = self._apply_python(values)
+
+        max_delta = 0.0
+        for target_idx in self.touched:
+            state = states[self.variables[target_idx]]
+            if state.locked:
+                continue
+            new_value = updated[target_idx]
+            delta = abs(new_value - state.value)
+            if delta > max_delta:
+                max_delta = delta
+            state.value = new_value
+        return max_delta
+
+    def _apply_numpy(self, values: List[float]) -> List[float]:
+        current = np.asarray(values, dtype=np.float64)
+        updated = current.copy()
+        with np.errstate(divide="ignore"):
+            targets, indices, weights, rows = self._np["attack"]
+            if len(indices):
+                strength = np.clip(current[indices] * weights, 0.0, 1.0)
+                factors = np.exp(np.bincount(rows, weights=np.log1p(-strength), minlength=len(targets)))
+                updated[targets] *= factors
+            targets, indices, weights, rows = self._np["support"]
+            if len(indices):
+                strength = np.clip(current[indices] * weights, 0.0, 1.0)
+                factors = np.exp(np.bincount(rows, weights=np.log1p(-strength), minlength=len(targets)))
+                updated[targets] = 1.0 - (1.0 - updated[targets]) * factors
+        return np.clip(updated, 0.0, 1.0).tolist()
+
+    def _apply_python(self, values: List[float]) -> List[float]:
+        updated = list(values)
+        for target_idx, log_factor in zip(self.attack.targets, self.attack.log_factors(values)):
+            updated[target_idx] *= math.exp(log_factor)
+        for target_idx, log_factor in zip(self.support.targets, self.support.log_factors(values)):
+            updated[target_idx] = 1.0 - (1.0 - updated[target_idx]) * math.exp(log_factor)
+        return [min(1.0, max(0.0, value)) for value in updated]
@@ -28,6 +28,7 @@ class Rule(TypedDict, total=False):
     inputs: List[str]  # Input variable names
     output: str  # Output variable name
     op: str  # AND, OR, NOT, IDENTITY, WEIGHTED
+    weights: List[float]  # Per-input weights for WEIGHTED (default: equal)
     weight: float  # Confidence in this rule [0, 1]
     learnable: bool  # Whether weight can be updated
     description: str
@@ -71,6 +72,15 @@ class EngineConfig:
     convergence_threshold: float = 0.001
     learning_rate: float = 0.1
     damping_factor: float = 0.5
+    # Fixed-point acceleration: "none", "adaptive", "sor", or "anderson"
+    acceleration: str = "none"
+    relaxation_factor: float = 1.5  # SOR over-relaxation (omega)
+    anderson_depth: int = 5  # Number of past iterates used by Anderson mixing
+    adaptive_min_step: float = 0.25  # Lower bound for the adaptive step size
+    adaptive_max_step: float = 2.0  # Upper bound for the adaptive step size
+    # Constraint application: "sequential" (in-place, declaration order) or
+    # "sparse" (CSR matrices, order-independent, vectorized)
+    constraint_mode: str = "sequential"
 
 
 @dataclass
@@ -80,6 +90,14 @@ class InferenceResult:
     iterations: int
     converged: bool
     history: Optional[List[Dict[str, float]]] = None
+    deltas: List[float] = field(default_factory=list)  # Max delta per iteration
+    wall_time: float = 0.0  # Seconds spent in the inference loop
+    rule_evaluations: int = 0  # Rules evaluated across all iterations
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """Final truth values keyed by variable name."""
+        return {name: state.value for name, state in self.states.items()}
 
 
 def create_default_config() -> EngineConfig:
@@ -19,10 +19,15 @@ Usage:
 from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass
 
-from .models import Node, Association, LogicType, LogicMeta
+from .models import Node, Association, LogicType, LogicMeta, LogicOp
 from .belief_resolver import BeliefResolver, DefaultBeliefResolver
 from .neuro import NeuroEngine
+from .neuro.instrumentation import InstrumentationSink
 from .neuro.types import NeuroJSON, Variable, Rule, Constraint, TruthValue
+from .graph_cache import GraphCache
+from .vsa import VsaEncoder, VsaMemoryIndex, collect_node_vectors, get_node_vsa
+
+CONTEXT_MODES = ("hops", "vsa", "vsa_hops")
 
 
 @dataclass
@@ -44,7 +49,14 @@ class NeuroService:
     - Grounding of first-order rules to instances
     """
 
-    def __init__(self, db=None, belief_resolver: Optional[BeliefResolver] = None):
+    def __init__(
+        self,
+        db=None,
+        belief_resolver: Optional[BeliefResolver] = None,
+        instrumentation: Optional[InstrumentationSink] = None,
+        vsa_index: Optional[VsaMemoryIndex] = None,
+        cache: Optional[GraphCache] = None,
+    ):
         """
         Initialize NeuroService.
         
@@ -52,15 +64,33 @@ class NeuroService:
             db: Optional database adapter with methods like:
                 - get_node(id) -> Node
                 - get_neighborhood(center_id, depth) -> (nodes, associations)
+                - get_subgraph(node_ids) -> (nodes, associations)  [vsa context mode]
                 - bulk_update_nodes(updates)
+            belief_resolver: Optional resolver for priors/evidence
+            instrumentation: Optional sink attached to every engine run
+            vsa_index: Optional index of node hypervectors (keyed by node id)
+                used by the "vsa" context mode
+            cache: Optional GraphCache; serves (and is filled with) the "vsa"
+                mode's center node and is invalidated for nodes written back
+                by solve_context
         """
         self.db = db
+        self.cache = cache
         self.belief_resolver = belief_resolver or DefaultBeliefResolver()
+        self.instrumentation = instrumentation
+        self.vsa_index = vsa_index
         self.config = {
             "max_iterations": 50,
             "convergence_threshold": 0.001,
             "learning_rate": 0.1,
             "damping_factor": 0.5,
+            "acceleration": "none",
+            "constraint_mode": "sequential",
+            "group_rules": True,
+            # Context retrieval: "hops" (full neighborhood), "vsa" (top-k similar
+            # nodes from vsa_index) or "vsa_hops" (top-k similar within the neighborhood)
+            "context_mode": "hops",
+            "context_top_k": 32,
         }
 
     def set_config(self, **kwargs) -> None:
@@ -88,25 +118,100 @@ class NeuroService:
             center_node_id=center_node_id,
         )
 
-    async def fetch_context(self, center_node_id: str, depth: int = 2) -> ContextGraph:
+    async def fetch_context(
+        self,
+        center_node_id: str,
+        depth: int = 2,
+        mode: Optional[str] = None,
+        top_k: Optional[int] = None,
+    ) -> ContextGraph:
         """
         Fetches a context subgraph from the database.
         
         Uses neighborhood/context window approach - doesn't load whole DB.
+        The VSA modes rank nodes by hypervector similarity to the center and
+        keep at most `top_k` of them besides the center, so the context size
+        stays bounded on high-degree hubs.
         
         Args:
             center_node_id: ID of the center node
             depth: Number of hops to include
+            mode: "hops", "vsa" or "vsa_hops" (default: config["context_mode"])
+            top_k: Node cap for the VSA modes (default: config["context_top_k"])
         
         Returns:
             ContextGraph with nodes and associations
         """
         if self.db is None:
             raise RuntimeError("Database not configured")
-        
+        mode = mode or self.config.get("context_mode", "hops")
+        if mode not in CONTEXT_MODES:
+            raise ValueError(f"Unknown context mode: {mode}")
+        if top_k is None:
+            top_k = self.config.get("context_top_k", 32)
+
+        if mode == "vsa":
+            if self.vsa_index is None:
+                raise RuntimeError("vsa context mode requires a vsa_index")
+            if self.cache is None:
+                center = await self.db.get_node(center_node_id)
+            else:
+                center = self.cache.peek(center_node_id)
+                if center is None:
+                    with self.cache.loading() as fill:
+                        center = await self.db.get_node(center_node_id)
+                        fill([center] if center is not None else [])
+            center_vec = get_node_vsa(center) if center is not None else None
+            if center_vec is None:
+                raise ValueError(f"Node {center_node_id} has no VSA vector")
+            hits = self.vsa_index.query(center_vec, top_k=top_k + 1)
+            keep = [center_node_id] + [item for item, _ in hits if item != center_node_id][:top_k]
+            nodes, associations = await self.db.get_subgraph(keep)
+            return self.extract_context(nodes, associations, center_node_id)
+
         nodes, associations = await self.db.get_neighborhood(center_node_id, depth)
+        if mode == "vsa_hops":
+            nodes, associations = self._top_similar(nodes, associations, center_node_id, top_k)
         return self.extract_context(nodes, associations, center_node_id)
 
+    def index_node_vectors(self, nodes: List[Node]) -> int:
+        """Adds the hypervectors of `nodes` to vsa_index; returns the count added."""
+        ids, vectors = collect_node_vectors(nodes)
+        if not ids:
+            return 0
+        if self.vsa_index is None:
+            self.vsa_index = VsaMemoryIndex(VsaEncoder(dim=len(vectors[0])))
+        self.vsa_index.add_many(ids, vectors)
+        return len(ids)
+
+    def _top_similar(
+        self,
+        nodes: List[Node],
+        associations: List[Association],
+        center_node_id: str,
+        top_k: int,
+    ) -> tuple:
+        """Keeps the center and its top_k most similar neighbors (by hypervector)."""
+        by_id = {node.id: node for node in nodes}
+        center = by_id.get(center_node_id)
+        center_vec = get_node_vsa(center) if center is not None else None
+        if center_vec is None:
+            raise ValueError(f"Node {center_node_id} has no VSA vector")
+
+        ids, vectors = collect_node_vectors(
+            (node for node in nodes if node.id != center_node_id), dim=len(center_vec)
+        )
+        local = VsaMemoryIndex(VsaEncoder(dim=len(center_vec)))
+        local.add_many(ids, vectors)
+        keep = {center_node_id} | {item for item, _ in local.query(center_vec, top_k=top_k)}
+
+        kept_nodes = [node for node in nodes if node.id in keep]
+        kept_assocs = [
+            assoc for assoc in associations
+            if assoc.source_id in keep and assoc.target_id in keep
+        ]
+        return kept_nodes, kept_assocs
+
     # =========================================================================
     # Conversion to NeuroJSON
     # =========================================================================
@@ -135,6 +240,9 @@ class NeuroService:
         # Convert associations to rules/constraints
         rule_counter = 0
         constraint_counter = 0
+        mutex_edges: List[tuple] = []  # (source_var, target_var, weight, group_key)
+        # (logic_type, target_var, group_key, op) -> [(assoc, source_var)]
+        rule_groups: Dict[tuple, List[tuple]] = {}
         
         for assoc_id, assoc in context.associations.items():
             if assoc.logic_meta is None:
@@ -150,6 +258,15 @@ class NeuroService:
             target_var = self._node_to_var_name(target_node)
             logic = assoc.logic_meta
             
+            if logic.type in (LogicType.IMPLIES, LogicType.DEPENDS):
+                group_key = self._rule_group_key(assoc)
+                if group_key is not None:
+                    # Collected and emitted as one multi-input rule per group below
+                    rule_groups.setdefault(
+                        (logic.type, target_var, group_key, logic.op), []
+                    ).append((assoc, source_var))
+                    continue
+            
             if logic.type == LogicType.IMPLIES:
                 rule_counter += 1
                 rules.append({
@@ -179,6 +296,11 @@ class NeuroService:
                     "target": target_var,
                     "weight": logic.weight,
                 })
+            elif logic.type == LogicType.MUTEX:
+                # Collected and emitted as one constraint per group below
+                mutex_edges.append(
+                    (source_var, target_var, logic.weight, assoc.metadata.get("mutex_group"))
+                )
             elif logic.type == LogicType.DEPENDS:
                 # DEPENDS can be modeled as a weaker implication
                 rule_counter += 1
@@ -192,6 +314,9 @@ class NeuroService:
                     "learnable": logic.learnable,
                 })
         
+        rules.extend(self._grouped_rules(rule_groups, rule_counter))
+        constraints.extend(self._mutex_constraints(mutex_edges))
+        
         return {
             "version": "1.0",
             "name": f"context_{context.center_node_id[:8]}",
@@ -200,6 +325,106 @@ class NeuroService:
             "constraints": constraints,
         }
 
+    def _rule_group_key(self, assoc: Association) -> Optional[str]:
+        """
+        Returns the key under which an IMPLIES/DEPENDS edge joins a multi-input rule.
+        
+        Edges with metadata["rule_group"] group by that key. Edges using the
+        AND/OR operators without an explicit key share one implicit group per
+        target and operator. Only IDENTITY/AND/OR edges group; other operators
+        (e.g. NOT) have no multi-input form and stay single-input rules.
+        """
+        if not self.config.get("group_rules", True) or assoc.logic_meta is None:
+            return None
+        if assoc.logic_meta.op not in (LogicOp.IDENTITY, LogicOp.AND, LogicOp.OR):
+            return None
+        group = assoc.metadata.get("rule_group")
+        if group is not None:
+            return str(group)
+        if assoc.logic_meta.op in (LogicOp.AND, LogicOp.OR):
+            return ""
+        return None
+
+    def _grouped_rules(self, rule_groups: Dict[tuple, List[tuple]], rule_counter: int) -> List[Rule]:
+        """
+        Builds one rule per group of associations sharing a target and group key.
+        
+        AND/OR groups over several inputs keep their operator and take the
+        mean edge weight. IDENTITY groups become WEIGHTED with per-input
+        weights w_i**2 and rule weight sum(w_i**2) / sum(w_i), so on its own
+        the rule yields sum(w_i * x_i * w_i) / sum(w_i), as the separate
+        single-edge rules would; a group whose edges all come from one source
+        keeps its operator with that same sum(w_i**2) / sum(w_i). Edge weights are halved for DEPENDS as for single edges, and
+        the rule is learnable only if every edge is.
+        """
+        rules: List[Rule] = []
+        for (logic_type, target_var, _, op), members in rule_groups.items():
+            rule_counter += 1
+            first = members[0][0]
+            prefix = "rule" if logic_type == LogicType.IMPLIES else "depends"
+            scale = 0.5 if logic_type == LogicType.DEPENDS else 1.0  # Weaker influence
+            # Squared edge weight per input (a repeated source sums its edges)
+            input_weights: Dict[str, float] = {}
+            for assoc, source_var in members:
+                edge_weight = assoc.logic_meta.weight * scale
+                input_weights[source_var] = input_weights.get(source_var, 0.0) + edge_weight**2
+            inputs = list(input_weights)
+            edge_weights = [assoc.logic_meta.weight * scale for assoc, _ in members]
+            rule: Rule = {
+                "id": f"{prefix}_{rule_counter}_{first.id[:8]}",
+                "type": "IMPLICATION",
+                "inputs": inputs,
+                "output": target_var,
+                "learnable": all(assoc.logic_meta.learnable for assoc, _ in members),
+            }
+            total = sum(edge_weights)
+            if len(inputs) == 1:
+                rule["op"] = op
+                rule["weight"] = sum(input_weights.values()) / total if total > 0 else 0.0
+            elif op in (LogicOp.AND, LogicOp.OR):
+                rule["op"] = op
+                rule["weight"] = sum(edge_weights) / len(edge_weights)
+            else:
+                rule["op"] = "WEIGHTED"
+                rule["weights"] = list(input_weights.values())
+                rule["weight"] = sum(input_weights.values()) / total if total > 0 else 0.0
+            rules.append(rule)
+        return rules
+
+    def _mutex_constraints(self, mutex_edges: List[tuple]) -> List[Constraint]:
+        """
+        Groups pairwise MUTEX associations into MUTEX constraints.
+        
+        Edges sharing metadata["mutex_group"] form one constraint, weighted by
+        the strongest edge in the group. Other edges stay pairwise (exclusion
+        is not transitive): one 2-member constraint per pair with that edge's
+        weight, the stronger one if a pair is declared twice.
+        """
+        # Dicts used as insertion-ordered sets keep grouping linear
+        members: Dict[tuple, Dict[str, None]] = {}
+        weights: Dict[tuple, float] = {}
+        for source_var, target_var, weight, group_key in mutex_edges:
+            if group_key is not None:
+                key: tuple = ("group", str(group_key))
+            else:
+                key = ("pair", *sorted((source_var, target_var)))
+            group_members = members.setdefault(key, {})
+            group_members[source_var] = None
+            group_members[target_var] = None
+            weights[key] = max(weights.get(key, 0.0), weight)
+        
+        constraints: List[Constraint] = []
+        for counter, (key, group_members) in enumerate(members.items(), start=1):
+            group = list(group_members)
+            constraints.append({
+                "id": f"mutex_{counter}_{self._var_name_to_node_id(group[0])[:8]}",
+                "type": "MUTEX",
+                "source": group[0],
+                "target": group[1:],
+                "weight": weights[key],
+            })
+        return constraints
+
     def _node_to_var_name(self, node: Node) -> str:
         """Converts a node to a variable name for NeuroJSON."""
         # Use node ID as variable name (ensures uniqueness)
@@ -250,8 +475,10 @@ class NeuroService:
             convergence_threshold=self.config["convergence_threshold"],
             learning_rate=self.config["learning_rate"],
             damping_factor=self.config["damping_factor"],
+            acceleration=self.config.get("acceleration", "none"),
+            constraint_mode=self.config.get("constraint_mode", "sequential"),
         )
-        engine = NeuroEngine(schema, config)
+        engine = NeuroEngine(schema, config, instrumentation=self.instrumentation)
         
         # Convert evidence node IDs to variable names
         var_evidence = {}
@@ -321,6 +548,8 @@ class NeuroService:
                 for node_id, value in results.items()
             ]
             await self.db.bulk_update_nodes(updates)
+            if self.cache is not None:
+                self.cache.invalidate(results)
         
         return results
 
@@ -1,6 +1,15 @@
 import asyncio
-from dataclasses import dataclass
-from typing import Protocol
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Protocol, Sequence
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from .replication_log import ReplicationLog
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "coalesce")
 
 
 @dataclass
@@ -9,42 +18,397 @@ class EdgeUpdate:
     target: str
     delta: float
     max_weight: float
+    # (op id, delta) of every queued update folded into this one; a store that
+    # records applied op ids skips the ones it has seen, so a resend is harmless
+    ops: list[tuple[str, float]] = field(default_factory=list, compare=False)
+
+
+def new_op_id() -> str:
+    return uuid4().hex
 
 
 class GraphClient(Protocol):
     async def increment_edge_weight(self, source: str, target: str, delta: float, max_weight: float) -> None: ...
 
+    # Optional bulk variant; used whenever the client provides it. Clients that
+    # skip already-applied EdgeUpdate.ops make retries exactly-once.
+    # async def increment_edge_weights(self, updates: Sequence[EdgeUpdate]) -> None: ...
+
+
+def coalesce_updates(updates: Sequence[EdgeUpdate]) -> list[EdgeUpdate]:
+    """Merges updates to the same edge by summing their deltas.
+
+    Only non-negative deltas with the same max_weight are merged, since
+    then min(min(w + a, cap) + b, cap) == min(w + a + b, cap) and the
+    result matches applying them one by one. First-seen order is kept.
+    """
+    merged: list[EdgeUpdate] = []
+    open_slots: dict[tuple[str, str, float], int] = {}
+    for upd in updates:
+        key = (upd.source, upd.target, upd.max_weight)
+        slot = open_slots.get(key)
+        if slot is not None and upd.delta >= 0:
+            merged[slot] = replace(
+                merged[slot], delta=merged[slot].delta + upd.delta, ops=merged[slot].ops + upd.ops
+            )
+            continue
+        open_slots[key] = len(merged)
+        merged.append(upd)
+        if upd.delta < 0:
+            # Later updates must not be folded in ahead of a decrement
+            del open_slots[key]
+    return merged
+
+
+@dataclass
+class DeadLetter:
+    """A batch that still failed after all retries."""
+
+    updates: list[EdgeUpdate]
+    error: str
+    failed_at: float = field(default_factory=time.time)
+    # Log sequence numbers of the originals (acked once requeued)
+    seqs: list[int] = field(default_factory=list)
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive failures.
+
+    While open, wait_ready() blocks until `reset_timeout` has passed; the next
+    call is a half-open trial that closes the breaker on success or reopens
+    it on failure.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 5.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+    async def wait_ready(self) -> None:
+        while self._opened_at is not None:
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
 
 class AsyncReplicator:
-    """Background worker to push edge-weight updates to long-term store."""
+    """Background worker(s) to push edge-weight updates to long-term store.
+
+    With batch_size > 1 each worker drains up to batch_size queued updates,
+    waiting at most batch_interval seconds for the batch to fill, coalesces
+    repeated edges and sends the batch through the client's
+    increment_edge_weights (falling back to one call per update).
 
-    def __init__(self, client: GraphClient) -> None:
+    max_queue bounds the number of pending updates (0 = unbounded). When the
+    queue is full, `overflow` decides what enqueue does:
+    - "block":       wait for room (backpressure on the caller); enqueue_nowait
+                     rejects the update instead
+    - "drop_oldest": discard the oldest pending update
+    - "coalesce":    fold the update into a pending one for the same edge
+                     (merging happens whenever possible, full or not), else wait
+
+    With a ReplicationLog (`wal`), every accepted update is logged before it
+    is queued and acked once the store accepts its batch (dropped updates
+    are acked too). start() replays whatever a previous process left unacked.
+
+    Every accepted update gets an op id (kept in the log, and through
+    coalescing in EdgeUpdate.ops). A failed batch is retried up to
+    max_retries times with full-jitter exponential backoff
+    (backoff_base * 2**attempt, capped at backoff_max). A failure can be
+    partial, or a timeout whose write still lands, so retries rely on the
+    client skipping op ids it has applied (ArangoGraphStore does, through
+    increment_edge_weights). With a client that only has
+    increment_edge_weight, updates are sent one at a time and the one in
+    flight when a call fails may be applied twice.
+    Consecutive failures open `breaker`, which pauses draining until the
+    store has had reset_timeout to recover. Batches that exhaust their
+    retries go to the bounded `dead_letters` buffer; requeue_dead_letters()
+    puts them back. With a log, dead-lettered updates stay unacked, so a
+    restart replays them even if the buffer overflowed.
+    """
+
+    def __init__(
+        self,
+        client: GraphClient,
+        *,
+        batch_size: int = 1,
+        batch_interval: float = 0.0,
+        workers: int = 1,
+        coalesce: bool = True,
+        max_queue: int = 0,
+        overflow: str = "block",
+        wal: "ReplicationLog | None" = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.05,
+        backoff_max: float = 5.0,
+        breaker: CircuitBreaker | None = None,
+        dead_letter_size: int = 1000,
+    ) -> None:
+        if batch_size < 1 or workers < 1:
+            raise ValueError("batch_size and workers must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
         self.client = client
-        self.queue: asyncio.Queue[EdgeUpdate] = asyncio.Queue()
-        self._task: asyncio.Task | None = None
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.workers = workers
+        self.coalesce = coalesce
+        self.overflow = overflow
+        self.queue: asyncio.Queue[EdgeUpdate] = asyncio.Queue(maxsize=max_queue)
+        self._tasks: list[asyncio.Task] = []
+        # Enqueue times of pending updates, in queue order (for lag)
+        self._enqueued_at: deque[float] = deque()
+        # Pending updates that later ones may be folded into ("coalesce" policy)
+        self._mergeable: dict[tuple[str, str, float], EdgeUpdate] = {}
+        self._counters = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "sent": 0,
+            "batches": 0,
+            "retries": 0,
+            "failed_batches": 0,
+            "dead_lettered": 0,
+        }
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.dead_letters: deque[DeadLetter] = deque(maxlen=dead_letter_size)
+        self._rng = random.Random()
+        self.wal = wal
+        # Log sequence numbers carried by each queued update object
+        self._seqs: dict[int, list[int]] = {}
+        self._replayed = False
 
     async def start(self) -> None:
-        if self._task is None:
-            self._task = asyncio.create_task(self._worker())
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if self.wal is not None:
+            if not self._replayed:
+                self._replayed = True
+                queued = {seq for seqs in self._seqs.values() for seq in seqs}
+                for seq, update in self.wal.pending():
+                    if seq in queued:
+                        continue
+                    update = self._prepare(update)
+                    await self.queue.put(update)
+                    self._track(update, seqs=[seq])
 
-    async def stop(self) -> None:
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+    async def stop(self, drain: bool = True, timeout: float | None = None) -> None:
+        """Stops the workers, first waiting for pending updates unless drain=False.
+
+        If draining times out, the workers are still stopped and the log
+        synced before asyncio.TimeoutError is raised; whatever was not sent
+        stays in the queue (and unacked in the log, to be replayed).
+        """
+        try:
+            if drain and self._tasks:
+                await self.flush(timeout)
+        finally:
+            tasks = self._tasks
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            self._tasks = []
+            if self.wal is not None:
+                await asyncio.get_running_loop().run_in_executor(None, self.wal.sync)
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """Waits until every pending update has been sent (requires running workers)."""
+        await asyncio.wait_for(self.queue.join(), timeout)
 
     async def enqueue(self, update: EdgeUpdate) -> None:
+        update = self._prepare(update)
+        if self._try_enqueue(update):
+            return
         await self.queue.put(update)
+        self._track(update)
+
+    def enqueue_nowait(self, update: EdgeUpdate) -> bool:
+        """Enqueues without waiting; returns False (and counts the update as
+        rejected) if a "block" queue is full."""
+        if self._try_enqueue(self._prepare(update)):
+            return True
+        self._counters["rejected"] += 1
+        return False
+
+    def metrics(self) -> dict[str, Any]:
+        loop_time = asyncio.get_running_loop().time() if self._enqueued_at else 0.0
+        return {
+            "depth": self.queue.qsize(),
+            "max_depth": self.queue.maxsize,
+            "lag_seconds": loop_time - self._enqueued_at[0] if self._enqueued_at else 0.0,
+            "breaker": self.breaker.state,
+            "dead_letters": len(self.dead_letters),
+            **self._counters,
+        }
+
+    async def requeue_dead_letters(self) -> int:
+        """Enqueues every dead-lettered update again; returns how many."""
+        count = 0
+        while self.dead_letters:
+            letter = self.dead_letters.popleft()
+            for update in letter.updates:
+                await self.enqueue(update)
+                count += 1
+            if self.wal is not None:
+                # The requeued copies were logged afresh by enqueue
+                self.wal.ack(letter.seqs)
+        return count
+
+    @staticmethod
+    def _prepare(update: EdgeUpdate) -> EdgeUpdate:
+        # Queued copies may be merged into or keyed by identity, so never hold
+        # the caller's object; requeued updates keep their op ids
+        return replace(update, ops=list(update.ops) or [(new_op_id(), update.delta)])
+
+    def _try_enqueue(self, update: EdgeUpdate) -> bool:
+        if self.overflow == "coalesce" and update.delta >= 0:
+            pending = self._mergeable.get((update.source, update.target, update.max_weight))
+            if pending is not None:
+                pending.delta += update.delta
+                pending.ops.extend(update.ops)
+                if self.wal is not None:
+                    self._seqs[id(pending)].append(self.wal.append(update))
+                self._counters["coalesced"] += 1
+                return True
+        if self.queue.full():
+            if self.overflow != "drop_oldest":
+                return False
+            dropped = self._take()
+            if self.wal is not None:
+                self.wal.ack(self._seqs.pop(id(dropped), []))
+            self.queue.task_done()
+            self._counters["dropped"] += 1
+        self.queue.put_nowait(update)
+        self._track(update)
+        return True
+
+    def _track(self, update: EdgeUpdate, seqs: list[int] | None = None) -> None:
+        if self.wal is not None:
+            self._seqs[id(update)] = seqs if seqs is not None else [self.wal.append(update)]
+        self._enqueued_at.append(asyncio.get_running_loop().time())
+        self._counters["enqueued"] += 1
+        if self.overflow == "coalesce":
+            key = (update.source, update.target, update.max_weight)
+            if update.delta >= 0:
+                self._mergeable[key] = update
+            else:
+                # Nothing may be folded in ahead of a decrement
+                self._mergeable.pop(key, None)
+
+    def _take(self) -> EdgeUpdate:
+        """Removes the next pending update (queue lock-step with the bookkeeping)."""
+        update = self.queue.get_nowait()
+        self._untrack(update)
+        return update
+
+    def _untrack(self, update: EdgeUpdate) -> None:
+        self._enqueued_at.popleft()
+        key = (update.source, update.target, update.max_weight)
+        if self._mergeable.get(key) is update:
+            del self._mergeable[key]
 
     async def _worker(self) -> None:
         while True:
-            upd = await self.queue.get()
+            await self.breaker.wait_ready()
+            batch = await self._next_batch()
+            seqs = [seq for upd in batch for seq in self._seqs.pop(id(upd), [])]
             try:
-                await self.client.increment_edge_weight(
-                    source=upd.source, target=upd.target, delta=upd.delta, max_weight=upd.max_weight
-                )
+                unsent = list(coalesce_updates(batch) if self.coalesce else batch)
+                error = await self._deliver(unsent)
+                if error is None:
+                    self._counters["sent"] += len(batch)
+                    self._counters["batches"] += 1
+                    if self.wal is not None:
+                        self.wal.ack(seqs)
+                else:
+                    self._counters["failed_batches"] += 1
+                    self._counters["dead_lettered"] += len(unsent)
+                    self.dead_letters.append(DeadLetter(updates=unsent, error=repr(error), seqs=seqs))
             finally:
-                self.queue.task_done()
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _deliver(self, unsent: list[EdgeUpdate]) -> Exception | None:
+        """Sends with retries; returns the last error, or None once everything is sent."""
+        error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._counters["retries"] += 1
+                cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+                await asyncio.sleep(self._rng.uniform(0, cap))
+                await self.breaker.wait_ready()
+            try:
+                await self._send(unsent)
+            except Exception as exc:  # any store error; cancellation still propagates
+                self.breaker.record_failure()
+                error = exc
+            else:
+                self.breaker.record_success()
+                return None
+        return error
+
+    async def _next_batch(self) -> list[EdgeUpdate]:
+        first = await self.queue.get()
+        self._untrack(first)
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_interval
+        while len(batch) < self.batch_size:
+            if not self.queue.empty():
+                batch.append(self._take())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                update = await asyncio.wait_for(self.queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            self._untrack(update)
+            batch.append(update)
+        return batch
+
+    async def _send(self, updates: list[EdgeUpdate]) -> None:
+        """Sends updates, removing each from the list once its call returns.
+
+        A bulk call that fails may still have applied part of the batch; the
+        op ids it carries make the retry skip that part.
+        """
+        bulk = getattr(self.client, "increment_edge_weights", None)
+        if bulk is not None:
+            await bulk(list(updates))
+            updates.clear()
+            return
+        while updates:
+            upd = updates[0]
+            await self.client.increment_edge_weight(
+                source=upd.source, target=upd.target, delta=upd.delta, max_weight=upd.max_weight
+            )
+            updates.pop(0)
@@ -0,0 +1,262 @@
+"""Append-only local write-ahead log for replication updates.
+
+Each queued EdgeUpdate is appended to the log with a sequence number
+before it is enqueued; once the store has accepted it, an ack record is
+appended. After a crash, `pending()` returns every logged update without
+an ack, and AsyncReplicator replays them on start.
+
+The log is a directory of numbered segment files with one JSON record per line:
+    {"s": seq, "u": [source, target, delta, max_weight],   update
+     "o": [[op_id, delta], ...]}
+    {"a": [seq, ...]}                                       ack
+Writes reach the OS immediately but are fsynced in batches by a background
+thread (so the event loop that appends never waits on the disk): after
+`sync_every` records or `sync_interval` seconds, whichever comes first,
+and on sync()/close(). Segments rotate at `segment_bytes`. A closed
+segment is deleted once it and every older segment are fully acked, and
+compact() rewrites the remaining pending updates into one fresh segment.
+The same thread fsyncs the directory after segments are created or
+deleted. sync() and compact() do their disk work on the calling thread.
+"""
+
+import json
+import os
+import threading
+from dataclasses import replace
+from typing import IO, Iterable
+
+from .replication import EdgeUpdate
+
+SEGMENT_PREFIX = "wal-"
+SEGMENT_SUFFIX = ".log"
+
+
+class ReplicationLog:
+    def __init__(
+        self,
+        directory: str,
+        *,
+        segment_bytes: int = 16 * 1024 * 1024,
+        sync_every: int = 256,
+        sync_interval: float = 0.05,
+    ) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        os.makedirs(directory, exist_ok=True)
+
+        self._pending: dict[int, EdgeUpdate] = {}
+        self._seq_segment: dict[int, int] = {}
+        self._segment_unacked: dict[int, set[int]] = {}
+        self._next_seq = 1
+        for index in self._segment_indexes():
+            self._load_segment(index)
+
+        # Always start a fresh segment: the last one may end in a torn write
+        self._active_index = max(self._segment_unacked, default=0) + 1
+        self._segment_unacked[self._active_index] = set()
+        self._file: IO[str] | None = open(self._segment_path(self._active_index), "a", encoding="utf-8")
+        # Rotated-out segments still to be fsynced and closed
+        self._retired: list[IO[str]] = []
+        # Records written / fsynced and directory changes made / fsynced; the
+        # writing thread owns the first of each pair, the syncing one the second
+        self._written = 0
+        self._synced = 0
+        self._dir_changes = 1
+        self._dir_synced = 0
+        # Held while fsyncing or swapping the active file
+        self._file_lock = threading.Lock()
+        self._sync_wanted = threading.Event()
+        self._syncer = threading.Thread(target=self._sync_worker, name="replication-log-sync", daemon=True)
+        self._syncer.start()
+        self._drop_acked_prefix()
+
+    # ---- Writes ----
+    def append(self, update: EdgeUpdate) -> int:
+        """Logs an update and returns its sequence number."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._write(_update_record(seq, update))
+        self._pending[seq] = replace(update, ops=list(update.ops))
+        self._seq_segment[seq] = self._active_index
+        self._segment_unacked[self._active_index].add(seq)
+        self._maybe_rotate()
+        return seq
+
+    def ack(self, seqs: Iterable[int]) -> None:
+        """Marks updates as stored; they will not be replayed."""
+        acked = [seq for seq in seqs if seq in self._pending]
+        if not acked:
+            return
+        self._write({"a": acked})
+        for seq in acked:
+            del self._pending[seq]
+            self._segment_unacked[self._seq_segment.pop(seq)].discard(seq)
+        self._drop_acked_prefix()
+        self._maybe_rotate()
+
+    def pending(self) -> list[tuple[int, EdgeUpdate]]:
+        """Unacked updates in log order."""
+        return sorted(self._pending.items())
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def sync(self) -> None:
+        """Fsyncs everything written so far (blocks; call off the event loop)."""
+        with self._file_lock:
+            self._fsync_all()
+
+    def compact(self) -> None:
+        """Rewrites pending updates into a new segment and deletes all older ones."""
+        old_indexes = sorted(self._segment_unacked)
+        self._start_segment()
+        for seq, update in self.pending():
+            self._write(_update_record(seq, update))
+            self._seq_segment[seq] = self._active_index
+            self._segment_unacked[self._active_index].add(seq)
+        self.sync()
+        for index in old_indexes:
+            self._segment_unacked.pop(index, None)
+            self._remove_segment(index)
+        self._dir_changes += 1
+        self.sync()
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        self._sync_wanted.set()
+        with self._file_lock:
+            self._fsync_all()
+            self._file.close()
+            self._file = None
+        self._syncer.join()
+
+    # ---- Internals ----
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            raise RuntimeError("replication log is closed")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self._written += 1
+        if self._written - self._synced >= self.sync_every:
+            self._sync_wanted.set()
+
+    def _sync_worker(self) -> None:
+        while True:
+            self._sync_wanted.wait(self.sync_interval)
+            self._sync_wanted.clear()
+            with self._file_lock:
+                if self._file is None:
+                    return
+                self._fsync_all()
+
+    def _fsync_all(self) -> None:
+        # Lines are flushed to the OS as they are written, so only the fsync
+        # is left; the active file object is never written off its own thread
+        written, dir_changes = self._written, self._dir_changes
+        while self._retired:
+            retired = self._retired.pop(0)
+            os.fsync(retired.fileno())
+            retired.close()
+        if self._file is not None and written != self._synced:
+            os.fsync(self._file.fileno())
+            self._synced = written
+        if dir_changes != self._dir_synced:
+            self._sync_directory()
+            self._dir_synced = dir_changes
+
+    def _maybe_rotate(self) -> None:
+        if self._file is not None and self._file.tell() >= self.segment_bytes:
+            self._start_segment()
+            self._drop_acked_prefix()
+
+    def _start_segment(self) -> None:
+        with self._file_lock:
+            if self._file is not None:
+                self._retired.append(self._file)
+            self._active_index += 1
+            self._segment_unacked[self._active_index] = set()
+            self._file = open(self._segment_path(self._active_index), "a", encoding="utf-8")
+        self._dir_changes += 1
+        self._sync_wanted.set()
+
+    def _drop_acked_prefix(self) -> None:
+        # Acks for an entry may live in a later segment, so only a fully acked
+        # prefix of closed segments can go without resurrecting acked entries
+        removed = False
+        for index in sorted(self._segment_unacked):
+            if index == self._active_index or self._segment_unacked[index]:
+                break
+            del self._segment_unacked[index]
+            self._remove_segment(index)
+            removed = True
+        if removed:
+            self._dir_changes += 1
+            self._sync_wanted.set()
+
+    def _load_segment(self, index: int) -> None:
+        self._segment_unacked[index] = set()
+        with open(self._segment_path(index), encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn final write
+                if "s" in record:
+                    seq = record["s"]
+                    previous = self._seq_segment.get(seq)
+                    if previous is not None:
+                        # compact() crashed before deleting the old segments:
+                        # the newest copy wins so the old segment can empty out
+                        self._segment_unacked[previous].discard(seq)
+                    source, target, delta, max_weight = record["u"]
+                    ops = [(op_id, op_delta) for op_id, op_delta in record.get("o", [])]
+                    self._pending[seq] = EdgeUpdate(source, target, delta, max_weight, ops)
+                    self._seq_segment[seq] = index
+                    self._segment_unacked[index].add(seq)
+                    self._next_seq = max(self._next_seq, seq + 1)
+                elif "a" in record:
+                    for seq in record["a"]:
+                        if self._pending.pop(seq, None) is not None:
+                            self._segment_unacked[self._seq_segment.pop(seq)].discard(seq)
+
+    def _segment_indexes(self) -> list[int]:
+        indexes = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                digits = name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)]
+                if digits.isdigit():
+                    indexes.append(int(digits))
+        return sorted(indexes)
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}")
+
+    def _remove_segment(self, index: int) -> None:
+        try:
+            os.remove(self._segment_path(index))
+        except FileNotFoundError:
+            pass
+
+    def _sync_directory(self) -> None:
+        # Makes segment creation/removal durable; not possible on every platform
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _update_record(seq: int, update: EdgeUpdate) -> dict:
+    return {
+        "s": seq,
+        "u": [update.source, update.target, update.delta, update.max_weight],
+        "o": [list(op) for op in update.ops],
+    }
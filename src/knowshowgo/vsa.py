@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import base64
 import hashlib
 import math
 import random
+import struct
+import sys
 
 from .models import Node
+from .vsa_store import read_vector_file, write_vector_file
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional; pure-Python paths are used instead
+    np = None  # type: ignore
 
 VSA_PAYLOAD_KEY = "vsa_vector"
+VSA_VERSION_KEY = "vsa_version"
+VSA_ENCODINGS = ("list", "float32", "float16", "bits")
 
 
 def _seed_from_symbol(symbol: str, base_seed: int) -> int:
@@ -29,6 +41,20 @@ def random_bipolar_vector(dim: int, seed: int) -> List[float]:
     return normalize_vector(raw)
 
 
+def random_bipolar_array(dim: int, seed: int) -> Any:
+    """NumPy version of random_bipolar_vector; returns the identical values.
+
+    random.Random and numpy's legacy RandomState share the MT19937 generator
+    and the 53-bit random() recipe, so the Python generator's seeded state is
+    handed to numpy and all draws happen in one vectorized call.
+    """
+    state = random.Random(seed).getstate()[1]
+    rng = np.random.RandomState()
+    rng.set_state(("MT19937", np.asarray(state[:-1], dtype=np.uint32), state[-1]))
+    raw = np.where(rng.random_sample(dim) >= 0.5, 1.0, -1.0)
+    return raw / math.sqrt(dim)
+
+
 def bundle(vectors: Iterable[List[float]], weights: Optional[Iterable[float]] = None) -> List[float]:
     vector_list = list(vectors)
     if not vector_list:
@@ -68,34 +94,263 @@ def cosine_similarity(left: List[float], right: List[float]) -> float:
     return dot / (left_norm * right_norm)
 
 
+# ---- Batch operations (numpy) ----
+# Batches are 2-D arrays with one vector per row; bundle_batch takes a 3-D
+# array of shape (batch, set_size, dim). Each function writes into `out`
+# when given (it may alias the input) and returns it.
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for batch VSA operations")
+
+
+def _float_array(values: Any) -> Any:
+    block = np.asarray(values)
+    return block if block.dtype.kind == "f" else block.astype(np.float64)
+
+
+def normalize_rows(block: Any, out: Any = None) -> Any:
+    """L2-normalizes along the last axis; zero vectors stay zero."""
+    _require_numpy()
+    block = _float_array(block)
+    norms = np.linalg.norm(block, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.divide(block, norms, out=out)
+
+
+def bind_batch(vectors: Any, key: Any, out: Any = None) -> Any:
+    """Binds every row against `key` (one vector, or one key per row)."""
+    _require_numpy()
+    block = _float_array(vectors)
+    key = _float_array(key)
+    if block.shape[-1] != key.shape[-1]:
+        raise ValueError("vectors must have the same dimension")
+    out = np.multiply(block, key, out=out)
+    return normalize_rows(out, out=out)
+
+
+def unbind_batch(bound: Any, key: Any, out: Any = None) -> Any:
+    return bind_batch(bound, key, out=out)
+
+
+def bundle_batch(sets: Any, weights: Any = None, out: Any = None) -> Any:
+    """Bundles each (set_size, dim) slice of `sets` into one row.
+
+    `weights` has shape (set_size,) or (batch, set_size); zero weights can
+    pad sets of uneven size.
+    """
+    _require_numpy()
+    block = _float_array(sets)
+    if block.ndim != 3:
+        raise ValueError("sets must have shape (batch, set_size, dim)")
+    if weights is None:
+        out = np.sum(block, axis=1, out=out)
+    else:
+        weight_block = np.broadcast_to(_float_array(weights), block.shape[:2])
+        out = np.einsum("bk,bkd->bd", weight_block, block, out=out)
+    return normalize_rows(out, out=out)
+
+
+def unbind_and_cleanup(
+    bound: Any,
+    key: Any,
+    index: "VsaMemoryIndex",
+    top_k: int = 1,
+) -> List[List[Tuple[str, float]]]:
+    """Unbinds each row with `key` and returns the nearest stored items."""
+    noisy = unbind_batch(bound, key)
+    if noisy.ndim == 1:
+        noisy = noisy[None, :]
+    return index.query_many(noisy, top_k=top_k)
+
+
 @dataclass
 class VsaEncoder:
-    """Deterministic symbol-to-vector encoder."""
+    """Deterministic symbol-to-vector encoder.
+
+    With numpy installed, vectors are generated in one vectorized draw and
+    cached as read-only float64 arrays; `array()` and `vectors()` return
+    them without copying. `cache_size` bounds the cache (least recently
+    used symbols are evicted); None keeps every symbol.
+
+    A codebook saved with `save_codebook` can be reopened with
+    `load_codebook`; the vectors are then read from a memory-mapped file
+    instead of being regenerated.
+    """
 
     dim: int = 128
     seed: int = 0
-    _cache: Dict[str, List[float]] = field(default_factory=dict, init=False)
+    cache_size: Optional[int] = None
+    _cache: "OrderedDict[str, Any]" = field(default_factory=OrderedDict, init=False)
+    _codebook: Any = field(default=None, init=False)
+    _codebook_rows: Dict[str, int] = field(default_factory=dict, init=False)
+    _hits: int = field(default=0, init=False)
+    _misses: int = field(default=0, init=False)
+    _evictions: int = field(default=0, init=False)
 
     def vector(self, symbol: str) -> List[float]:
-        if symbol in self._cache:
-            return list(self._cache[symbol])
+        found = self._lookup(symbol)
+        return found.tolist() if np is not None else list(found)
+
+    def array(self, symbol: str) -> Any:
+        """Returns the vector as a shared read-only numpy array (no copy)."""
+        if np is None:
+            raise RuntimeError("numpy is required for VsaEncoder.array")
+        return self._lookup(symbol)
+
+    def vectors(self, symbols: Sequence[str]) -> Any:
+        """Returns a (len(symbols), dim) float64 array, one row per symbol."""
+        if np is None:
+            raise RuntimeError("numpy is required for VsaEncoder.vectors")
+        out = np.empty((len(symbols), self.dim), dtype=np.float64)
+        for i, symbol in enumerate(symbols):
+            out[i] = self._lookup(symbol)
+        return out
+
+    def cache_info(self) -> Dict[str, Any]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._cache),
+            "max_size": self.cache_size,
+        }
+
+    def _lookup(self, symbol: str) -> Any:
+        cached = self._cache.get(symbol)
+        if cached is not None:
+            self._hits += 1
+            if self.cache_size is not None:
+                self._cache.move_to_end(symbol)
+            return cached
+        row = self._codebook_rows.get(symbol)
+        if row is not None:
+            self._hits += 1
+            return self._codebook[row]
+
+        self._misses += 1
         seed = _seed_from_symbol(symbol, self.seed)
-        vec = random_bipolar_vector(self.dim, seed)
-        self._cache[symbol] = vec
-        return list(vec)
+        if np is not None:
+            vec = random_bipolar_array(self.dim, seed)
+            vec.setflags(write=False)
+        else:
+            vec = random_bipolar_vector(self.dim, seed)
+        if self.cache_size is None or self.cache_size > 0:
+            self._cache[symbol] = vec
+            if self.cache_size is not None and len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return vec
+
+    def save_codebook(self, path: str) -> None:
+        """Writes every known symbol vector to a memory-mappable file."""
+        if np is None:
+            raise RuntimeError("numpy is required to save a codebook")
+        symbols = list(self._codebook_rows) + [s for s in self._cache if s not in self._codebook_rows]
+        rows = np.empty((len(symbols), self.dim), dtype=np.float64)
+        for i, symbol in enumerate(symbols):
+            row = self._codebook_rows.get(symbol)
+            rows[i] = self._codebook[row] if row is not None else self._cache[symbol]
+        write_vector_file(path, symbols, rows, self.dim, self.seed)
+
+    @classmethod
+    def load_codebook(cls, path: str, mmap: bool = True) -> "VsaEncoder":
+        """Opens a saved codebook; symbols missing from it are still generated."""
+        stored = read_vector_file(path, mmap=mmap)
+        encoder = cls(dim=stored.dim, seed=stored.seed)
+        stored.rows.setflags(write=False)
+        encoder._codebook = stored.rows
+        encoder._codebook_rows = {symbol: row for row, symbol in enumerate(stored.ids)}
+        return encoder
 
 
 @dataclass
 class VsaMemoryIndex:
-    """In-memory VSA index for nearest-neighbor recall."""
+    """In-memory VSA index for nearest-neighbor recall.
+
+    With numpy installed, vectors live pre-normalized in one contiguous float32
+    matrix: a query is a single matrix-vector product plus an argpartition
+    top-k. Without numpy, vectors are kept as normalized lists and scanned.
+
+    `save` writes the index to a flat file; `load` maps it back read-only,
+    so worker processes share one page-cached copy. The mapped matrix is
+    copied into private memory on the first mutation.
+    """
 
     encoder: VsaEncoder
+    use_numpy: bool = True
     _vectors: Dict[str, List[float]] = field(default_factory=dict, init=False)
+    _ids: List[str] = field(default_factory=list, init=False)
+    _rows: Dict[str, int] = field(default_factory=dict, init=False)
+    _matrix: Any = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.use_numpy = self.use_numpy and np is not None
+        if self.use_numpy:
+            self._matrix = np.zeros((0, self.encoder.dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._ids) if self.use_numpy else len(self._vectors)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in (self._rows if self.use_numpy else self._vectors)
 
     def add(self, item_id: str, vector: List[float]) -> None:
         if len(vector) != self.encoder.dim:
             raise ValueError("vector dimension does not match encoder")
-        self._vectors[item_id] = normalize_vector(vector)
+        if not self.use_numpy:
+            self._vectors[item_id] = normalize_vector(list(vector))
+            return
+        row = self._rows.get(item_id)
+        if row is None:
+            row = len(self._ids)
+            self._reserve(row + 1)
+            self._ids.append(item_id)
+            self._rows[item_id] = row
+        self._ensure_writable()
+        self._matrix[row] = _normalized_rows(np.asarray(vector, dtype=np.float32)[None, :])[0]
+
+    def add_many(self, item_ids: Sequence[str], vectors: Sequence[List[float]]) -> None:
+        """Adds many vectors at once (one normalization pass with numpy)."""
+        if len(item_ids) != len(vectors):
+            raise ValueError("item_ids must match number of vectors")
+        if not self.use_numpy or not item_ids:
+            for item_id, vector in zip(item_ids, vectors):
+                self.add(item_id, vector)
+            return
+        block = np.asarray(vectors, dtype=np.float32)
+        if block.ndim != 2 or block.shape[1] != self.encoder.dim:
+            raise ValueError("vector dimension does not match encoder")
+        rows: List[int] = []
+        for item_id in item_ids:
+            row = self._rows.get(item_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(item_id)
+                self._rows[item_id] = row
+            rows.append(row)
+        self._reserve(len(self._ids))
+        self._ensure_writable()
+        self._matrix[rows] = _normalized_rows(block)
+
+    def remove(self, item_id: str) -> bool:
+        """Removes an item; returns False if it was not indexed."""
+        if not self.use_numpy:
+            return self._vectors.pop(item_id, None) is not None
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        # Move the last row into the hole so the matrix stays dense
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ensure_writable()
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        return True
 
     def add_symbol(self, item_id: str, symbol: str) -> List[float]:
         vector = self.encoder.vector(symbol)
@@ -103,11 +358,13 @@ class VsaMemoryIndex:
         return vector
 
     def query(self, vector: List[float], top_k: int = 5) -> List[Tuple[str, float]]:
-        if not self._vectors:
+        if len(self) == 0:
             return []
         if len(vector) != self.encoder.dim:
             raise ValueError("vector dimension does not match encoder")
-        normalized = normalize_vector(vector)
+        if self.use_numpy:
+            return self.query_many([vector], top_k=top_k)[0]
+        normalized = normalize_vector(list(vector))
         scored = [
             (item_id, cosine_similarity(normalized, stored))
             for item_id, stored in self._vectors.items()
@@ -115,13 +372,264 @@ class VsaMemoryIndex:
         scored.sort(key=lambda item: item[1], reverse=True)
         return scored[:top_k]
 
-
-def attach_vsa(node: Node, vector: List[float]) -> None:
-    node.payload[VSA_PAYLOAD_KEY] = list(vector)
+    def query_many(self, vectors: Sequence[List[float]], top_k: int = 5) -> List[List[Tuple[str, float]]]:
+        """Queries many probes at once; returns one ranked list per probe."""
+        if not self.use_numpy:
+            return [self.query(vector, top_k=top_k) for vector in vectors]
+        if len(vectors) == 0:
+            return []
+        if len(self) == 0 or top_k <= 0:
+            return [[] for _ in vectors]
+        probes = np.asarray(vectors, dtype=np.float32)
+        if probes.ndim != 2 or probes.shape[1] != self.encoder.dim:
+            raise ValueError("vector dimension does not match encoder")
+        scores = _normalized_rows(probes) @ self._matrix[: len(self._ids)].T
+        return [self._top_k(row_scores, top_k) for row_scores in scores]
+
+    def _top_k(self, scores: Any, top_k: int) -> List[Tuple[str, float]]:
+        count = scores.shape[0]
+        if top_k < count:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(count)
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._ids[row], float(scores[row])) for row in order]
+
+    def save(self, path: str) -> None:
+        """Writes ids and normalized vectors to a memory-mappable file."""
+        if self.use_numpy:
+            rows = self._matrix[: len(self._ids)]
+            ids: List[str] = self._ids
+        elif np is None:
+            raise RuntimeError("numpy is required to save a VSA index")
+        else:
+            ids = list(self._vectors)
+            rows = np.asarray([self._vectors[item_id] for item_id in ids], dtype=np.float32)
+            rows = rows.reshape(len(ids), self.encoder.dim)
+        write_vector_file(path, ids, rows, self.encoder.dim, self.encoder.seed)
+
+    @classmethod
+    def load(cls, path: str, encoder: VsaEncoder, mmap: bool = True, **options: Any) -> "VsaMemoryIndex":
+        """Opens a saved index; with mmap=True the vectors are not copied."""
+        stored = read_vector_file(path, mmap=mmap)
+        if stored.dim != encoder.dim:
+            raise ValueError("stored vector dimension does not match encoder")
+        index = cls(encoder, **options)
+        index._attach(stored.ids, stored.rows)
+        return index
+
+    def _attach(self, item_ids: List[str], rows: Any) -> None:
+        if not self.use_numpy:
+            self._vectors = {item_id: row.tolist() for item_id, row in zip(item_ids, rows)}
+            return
+        self._ids = list(item_ids)
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        self._matrix = rows
+
+    def _ensure_writable(self) -> None:
+        if not self._matrix.flags.writeable:
+            self._matrix = np.array(self._matrix)
+
+    def _reserve(self, rows: int) -> None:
+        """Grows the backing matrix geometrically so appends stay amortized O(dim)."""
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        grown = np.zeros((max(rows, capacity * 2, 16), self.encoder.dim), dtype=np.float32)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
+
+
+def _normalized_rows(block: Any) -> Any:
+    """L2-normalizes each row of a 2-D numpy array; zero rows stay zero."""
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (block / norms).astype(np.float32, copy=False)
+
+
+# ---- Node payload storage ----
+# A vector is stored under VSA_PAYLOAD_KEY either as a plain list ("list")
+# or as {"encoding", "dim", "data"} with base64 data: little-endian float32
+# or float16 values, or sign bits ("bits", decoded as +-1/sqrt(dim)).
+# attach_vsa bumps VSA_VERSION_KEY; decoded vectors are cached per node.
+
+_STRUCT_CODES = {"float32": "f", "float16": "e"}
+
+
+def encode_vsa_payload(vector: Sequence[float], encoding: str = "list") -> Any:
+    """Returns the JSON-friendly payload value for a vector."""
+    if encoding == "list":
+        return [float(value) for value in vector]
+    if encoding in _STRUCT_CODES:
+        if np is not None:
+            data = np.asarray(vector, dtype="<" + _STRUCT_CODES[encoding]).tobytes()
+        else:
+            data = struct.pack(f"<{len(vector)}{_STRUCT_CODES[encoding]}", *vector)
+    elif encoding == "bits":
+        if np is not None:
+            data = np.packbits(np.asarray(vector) >= 0).tobytes()
+        else:
+            packed = bytearray((len(vector) + 7) // 8)
+            for idx, value in enumerate(vector):
+                if value >= 0:
+                    packed[idx // 8] |= 0x80 >> (idx % 8)
+            data = bytes(packed)
+    else:
+        raise ValueError(f"Unknown VSA encoding: {encoding}")
+    return {"encoding": encoding, "dim": len(vector), "data": base64.b64encode(data).decode("ascii")}
+
+
+def _decode_payload(raw: Any) -> Any:
+    """Decodes a payload value to a float64 array (list without numpy), or None."""
+    if isinstance(raw, list):
+        if not all(isinstance(value, (int, float)) for value in raw):
+            return None
+        return np.asarray(raw, dtype=np.float64) if np is not None else [float(value) for value in raw]
+    if not isinstance(raw, dict):
+        return None
+    encoding, dim = raw.get("encoding"), raw.get("dim")
+    try:
+        data = base64.b64decode(raw.get("data", ""), validate=True)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(dim, int):
+        return None
+    if encoding in _STRUCT_CODES:
+        code = _STRUCT_CODES[encoding]
+        if len(data) != dim * struct.calcsize(code):
+            return None
+        if np is not None:
+            return np.frombuffer(data, dtype="<" + code).astype(np.float64)
+        return list(struct.unpack(f"<{dim}{code}", data))
+    if encoding == "bits":
+        if len(data) != (dim + 7) // 8:
+            return None
+        scale = 1.0 / math.sqrt(dim) if dim else 0.0
+        if np is not None:
+            bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))[:dim]
+            return np.where(bits == 1, scale, -scale)
+        return [scale if data[idx // 8] & (0x80 >> (idx % 8)) else -scale for idx in range(dim)]
+    return None
 
 
-def get_node_vsa(node: Node) -> Optional[List[float]]:
-    raw = node.payload.get(VSA_PAYLOAD_KEY)
-    if isinstance(raw, list) and all(isinstance(value, (int, float)) for value in raw):
-        return [float(value) for value in raw]
-    return None
+def decode_vsa_payload(raw: Any) -> Optional[List[float]]:
+    decoded = _decode_payload(raw)
+    if decoded is None:
+        return None
+    return decoded.tolist() if np is not None else decoded
+
+
+class VsaPayloadCache:
+    """Per-node cache of decoded payload vectors.
+
+    Entries are keyed by node id and checked against the node's vsa_version,
+    embedding_ref and raw payload: a hit needs the same payload object, or
+    for encoded payloads an equal {"encoding", "dim", "data"} dict (a string
+    compare, far cheaper than decoding). Freshly loaded copies of an
+    unchanged node therefore hit, and a payload replaced in place never
+    returns the old vector. The cache holds at most `max_entries` vectors
+    and roughly `max_bytes` of decoded data, evicting least-recently-used.
+    """
+
+    def __init__(self, max_entries: int = 100_000, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, Any, Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get(self, node: Node) -> Any:
+        """Returns the decoded vector (read-only array with numpy) or None."""
+        raw = node.payload.get(VSA_PAYLOAD_KEY)
+        if raw is None:
+            return None
+        key = (node.payload.get(VSA_VERSION_KEY), node.embedding_ref)
+        entry = self._entries.get(node.id)
+        if entry is not None and entry[0] == key and _same_payload(entry[1], raw):
+            self.hits += 1
+            self._entries.move_to_end(node.id)
+            return entry[2]
+
+        self.misses += 1
+        self._discard(node.id)
+        decoded = _decode_payload(raw)
+        if decoded is None:
+            return None
+        if np is not None:
+            decoded.setflags(write=False)
+        size = _vector_bytes(decoded)
+        if self.max_entries > 0 and (self.max_bytes is None or size <= self.max_bytes):
+            self._entries[node.id] = (key, raw, decoded, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._bytes -= self._entries.popitem(last=False)[1][3]
+        return decoded
+
+    def _discard(self, node_id: str) -> None:
+        entry = self._entries.pop(node_id, None)
+        if entry is not None:
+            self._bytes -= entry[3]
+
+
+def _same_payload(cached: Any, raw: Any) -> bool:
+    # Lists are only trusted by identity: comparing them costs about as much
+    # as decoding. Encoded payloads compare by their (short) fields.
+    return cached is raw or (isinstance(cached, dict) and isinstance(raw, dict) and cached == raw)
+
+
+def _vector_bytes(decoded: Any) -> int:
+    if np is not None:
+        return decoded.nbytes
+    return sys.getsizeof(decoded) + len(decoded) * sys.getsizeof(0.0)
+
+
+_payload_cache = VsaPayloadCache()
+
+
+def attach_vsa(node: Node, vector: List[float], encoding: str = "list") -> None:
+    node.payload[VSA_PAYLOAD_KEY] = encode_vsa_payload(vector, encoding)
+    node.payload[VSA_VERSION_KEY] = int(node.payload.get(VSA_VERSION_KEY) or 0) + 1
+
+
+def get_node_vsa(node: Node, cache: Optional[VsaPayloadCache] = None) -> Optional[List[float]]:
+    decoded = (cache if cache is not None else _payload_cache).get(node)
+    if decoded is None:
+        return None
+    return decoded.tolist() if np is not None else list(decoded)
+
+
+def get_node_vsa_array(node: Node, cache: Optional[VsaPayloadCache] = None) -> Any:
+    """Returns the node's vector as a shared read-only float64 array (no copy)."""
+    if np is None:
+        raise RuntimeError("numpy is required for get_node_vsa_array")
+    return (cache if cache is not None else _payload_cache).get(node)
+
+
+def collect_node_vectors(nodes: Iterable[Node], dim: Optional[int] = None) -> Tuple[List[str], List[Any]]:
+    """Returns (ids, vectors) for nodes carrying a vector (of length `dim` if given).
+
+    Vectors come straight from the payload cache (read-only arrays with
+    numpy), ready for VsaMemoryIndex.add_many.
+    """
+    ids: List[str] = []
+    vectors: List[Any] = []
+    for node in nodes:
+        vector = _payload_cache.get(node)
+        if vector is not None and (dim is None or len(vector) == dim):
+            ids.append(node.id)
+            vectors.append(vector)
+    return ids, vectors
@@ -0,0 +1,200 @@
+"""Approximate nearest-neighbour search for VSA vectors.
+
+LshVsaIndex extends VsaMemoryIndex with random-hyperplane LSH. Each of
+`num_tables` hash tables maps a `num_bits`-bit sign pattern to the items
+in that bucket. A query collects the items sharing a bucket with the
+probe and re-ranks only those candidates exactly against the stored
+matrix, instead of scanning all N rows.
+
+Recall/latency trade-off:
+- more tables       -> higher recall, more candidates
+- more bits         -> smaller buckets, lower latency, lower recall
+- multiprobe        -> also visit buckets one bit-flip away (on the
+                       lowest-margin bits), raising recall without more memory
+
+Everything is local and in-process; numpy is required.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from .vsa import VsaMemoryIndex, _normalized_rows
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+
+@dataclass
+class LshVsaIndex(VsaMemoryIndex):
+    """VsaMemoryIndex with random-hyperplane LSH candidate selection."""
+
+    num_tables: int = 8
+    num_bits: int = 12
+    multiprobe: int = 0
+    exact_fallback: bool = False
+    _planes: Any = field(default=None, init=False)
+    _tables: List[Dict[int, Set[str]]] = field(default_factory=list, init=False)
+    _codes: Dict[str, Tuple[int, ...]] = field(default_factory=dict, init=False)
+    _bit_weights: Any = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        if np is None:
+            raise RuntimeError("numpy is required for LshVsaIndex")
+        if not 1 <= self.num_bits <= 62:
+            raise ValueError("num_bits must be between 1 and 62")
+        super().__post_init__()
+        self.use_numpy = True
+        rng = np.random.default_rng(self.encoder.seed)
+        self._planes = rng.standard_normal(
+            (self.num_tables * self.num_bits, self.encoder.dim)
+        ).astype(np.float32)
+        self._tables = [{} for _ in range(self.num_tables)]
+        self._bit_weights = (1 << np.arange(self.num_bits, dtype=np.int64))
+
+    # ---- Mutation ----
+    def add(self, item_id: str, vector: List[float]) -> None:
+        super().add(item_id, vector)
+        self._index_rows([item_id])
+
+    def add_many(self, item_ids: Sequence[str], vectors: Sequence[List[float]]) -> None:
+        super().add_many(item_ids, vectors)
+        self._index_rows(list(dict.fromkeys(item_ids)))
+
+    def remove(self, item_id: str) -> bool:
+        self._unhash(item_id)
+        return super().remove(item_id)
+
+    def _attach(self, item_ids: List[str], rows: Any) -> None:
+        # Hash tables are not persisted; rebuild them from the loaded rows
+        super()._attach(item_ids, rows)
+        if self._ids:
+            self._index_rows(list(self._ids))
+
+    # ---- Queries ----
+    def query(self, vector: List[float], top_k: int = 5) -> List[Tuple[str, float]]:
+        if len(self) == 0:
+            return []
+        return self.query_many([vector], top_k=top_k)[0]
+
+    def query_many(self, vectors: Sequence[List[float]], top_k: int = 5) -> List[List[Tuple[str, float]]]:
+        if len(vectors) == 0:
+            return []
+        if len(self) == 0 or top_k <= 0:
+            return [[] for _ in vectors]
+        probes = np.asarray(vectors, dtype=np.float32)
+        if probes.ndim != 2 or probes.shape[1] != self.encoder.dim:
+            raise ValueError("vector dimension does not match encoder")
+        probes = _normalized_rows(probes)
+        projections = probes @ self._planes.T
+
+        results: List[List[Tuple[str, float]]] = []
+        for probe, projection in zip(probes, projections):
+            candidates = self._candidates(projection)
+            if self.exact_fallback and len(candidates) < top_k:
+                results.append(self.exact_query_many([probe], top_k)[0])
+                continue
+            if not candidates:
+                results.append([])
+                continue
+            rows = np.fromiter((self._rows[item_id] for item_id in candidates), dtype=np.int64)
+            scores = self._matrix[rows] @ probe
+            count = rows.shape[0]
+            if top_k < count:
+                picked = np.argpartition(-scores, top_k - 1)[:top_k]
+            else:
+                picked = np.arange(count)
+            order = picked[np.argsort(-scores[picked], kind="stable")]
+            results.append([(self._ids[rows[i]], float(scores[i])) for i in order])
+        return results
+
+    def exact_query_many(self, vectors: Sequence[List[float]], top_k: int = 5) -> List[List[Tuple[str, float]]]:
+        """Brute-force scan over all items (ground truth for recall checks)."""
+        return VsaMemoryIndex.query_many(self, vectors, top_k=top_k)
+
+    def candidate_count(self, vector: List[float]) -> int:
+        """Number of items a query for this vector would re-rank."""
+        probe = _normalized_rows(np.asarray([vector], dtype=np.float32))[0]
+        return len(self._candidates(self._planes @ probe))
+
+    # ---- Hashing ----
+    def _codes_for(self, projection: Any) -> Any:
+        bits = (projection.reshape(-1, self.num_tables, self.num_bits) >= 0).astype(np.int64)
+        return bits @ self._bit_weights
+
+    def _index_rows(self, item_ids: List[str]) -> None:
+        for item_id in item_ids:
+            self._unhash(item_id)
+        rows = np.fromiter((self._rows[item_id] for item_id in item_ids), dtype=np.int64)
+        codes = self._codes_for(self._matrix[rows] @ self._planes.T)
+        for item_id, item_codes in zip(item_ids, codes.tolist()):
+            self._codes[item_id] = tuple(item_codes)
+            for table, code in zip(self._tables, item_codes):
+                table.setdefault(code, set()).add(item_id)
+
+    def _unhash(self, item_id: str) -> None:
+        codes = self._codes.pop(item_id, None)
+        if codes is None:
+            return
+        for table, code in zip(self._tables, codes):
+            bucket = table.get(code)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del table[code]
+
+    def _candidates(self, projection: Any) -> Set[str]:
+        codes = self._codes_for(projection[None, :])[0].tolist()
+        margins = np.abs(projection.reshape(self.num_tables, self.num_bits)) if self.multiprobe else None
+        found: Set[str] = set()
+        for t, (table, code) in enumerate(zip(self._tables, codes)):
+            bucket = table.get(code)
+            if bucket:
+                found.update(bucket)
+            if self.multiprobe:
+                # Flip the bits whose hyperplanes the probe lies closest to
+                for bit in np.argsort(margins[t])[: self.multiprobe].tolist():
+                    bucket = table.get(code ^ (1 << bit))
+                    if bucket:
+                        found.update(bucket)
+        return found
+
+
+def measure_recall(
+    index: LshVsaIndex,
+    probes: Sequence[List[float]],
+    top_k: int = 10,
+) -> Dict[str, float]:
+    """
+    Compares LSH results against the exact scan on the same index.
+
+    Returns recall@k, mean per-query latency of both paths, and the mean
+    number of re-ranked candidates.
+    """
+    started = time.perf_counter()
+    approx = index.query_many(probes, top_k=top_k)
+    ann_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    exact = index.exact_query_many(probes, top_k=top_k)
+    exact_seconds = time.perf_counter() - started
+
+    hits = 0
+    expected = 0
+    for approx_hits, exact_hits in zip(approx, exact):
+        truth = {item_id for item_id, _ in exact_hits}
+        hits += len(truth & {item_id for item_id, _ in approx_hits})
+        expected += len(truth)
+
+    queries = max(1, len(probes))
+    candidates = sum(index.candidate_count(probe) for probe in probes) / queries
+    return {
+        "recall": hits / expected if expected else 1.0,
+        "ann_seconds_per_query": ann_seconds / queries,
+        "exact_seconds_per_query": exact_seconds / queries,
+        "mean_candidates": candidates,
+    }
@@ -0,0 +1,213 @@
+"""Binary (bit-packed) hypervectors with Hamming/popcount similarity.
+
+Each component is one bit, so a 10k-dimensional hypervector takes 1,256
+bytes. Compare that with 80,000 bytes for a float64 list. Vectors are
+numpy uint8 arrays padded to a multiple of 8 bytes. Similarity and index
+scans view them as uint64 words and use popcount.
+
+Operations:
+- bind:   XOR (self-inverse, so unbind == bind)
+- bundle: per-bit majority vote (ties take the first vector's bit)
+- similarity: 1 - 2 * hamming / dim, in [-1, 1] like bipolar cosine
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .vsa import _seed_from_symbol
+from .vsa_store import read_vector_file, write_vector_file
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+# Rows scanned per chunk, so XOR temporaries stay small for large indexes
+SCAN_CHUNK_ROWS = 65536
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for binary VSA vectors")
+
+
+def packed_bytes(dim: int) -> int:
+    """Bytes per packed vector: ceil(dim / 8) rounded up to whole uint64 words."""
+    return ((dim + 63) // 64) * 8
+
+
+def _tail_mask(dim: int) -> Any:
+    """Per-byte mask that zeroes bits beyond `dim` (packbits is big-endian per byte)."""
+    mask = np.zeros(packed_bytes(dim), dtype=np.uint8)
+    full, rem = divmod(dim, 8)
+    mask[:full] = 0xFF
+    if rem:
+        mask[full] = (0xFF << (8 - rem)) & 0xFF
+    return mask
+
+
+def popcount(words: Any) -> Any:
+    """Bit count per element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    # numpy < 2.0: count per byte through a lookup table
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    as_bytes = words.view(np.uint8).reshape(words.shape + (8,))
+    return table[as_bytes].sum(axis=-1, dtype=np.uint64)
+
+
+def random_binary_vector(dim: int, seed: int) -> Any:
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    raw = rng.integers(0, 256, size=packed_bytes(dim), dtype=np.uint8)
+    return raw & _tail_mask(dim)
+
+
+def pack_bipolar(vector: Sequence[float]) -> Any:
+    """Packs a real-valued vector by sign (>= 0 -> 1)."""
+    _require_numpy()
+    bits = np.packbits(np.asarray(vector) >= 0)
+    out = np.zeros(packed_bytes(len(vector)), dtype=np.uint8)
+    out[: bits.shape[0]] = bits
+    return out
+
+
+def bind_binary(left: Any, right: Any) -> Any:
+    if left.shape != right.shape:
+        raise ValueError("vectors must have the same dimension")
+    return np.bitwise_xor(left, right)
+
+
+def unbind_binary(bound: Any, key: Any) -> Any:
+    return bind_binary(bound, key)
+
+
+def bundle_binary(vectors: Iterable[Any], dim: int) -> Any:
+    """Majority vote per bit; ties (even counts) take the first vector's bit."""
+    _require_numpy()
+    stacked = np.asarray(list(vectors), dtype=np.uint8)
+    if stacked.size == 0:
+        return np.zeros(packed_bytes(dim), dtype=np.uint8)
+    bits = np.unpackbits(stacked, axis=1)
+    ones = bits.sum(axis=0, dtype=np.int64)
+    count = stacked.shape[0]
+    majority = ones * 2 > count
+    tie = ones * 2 == count
+    majority |= tie & bits[0].astype(bool)
+    return np.packbits(majority) & _tail_mask(dim)
+
+
+def hamming_distance(left: Any, right: Any) -> int:
+    if left.shape != right.shape:
+        raise ValueError("vectors must have the same dimension")
+    return int(popcount(np.bitwise_xor(left, right).view(np.uint64)).sum())
+
+
+def hamming_similarity(left: Any, right: Any, dim: int) -> float:
+    return 1.0 - 2.0 * hamming_distance(left, right) / dim
+
+
+@dataclass
+class BinaryVsaEncoder:
+    """Deterministic symbol-to-packed-bits encoder."""
+
+    dim: int = 10000
+    seed: int = 0
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        _require_numpy()
+
+    def vector(self, symbol: str) -> Any:
+        """Returns the packed vector for a symbol (read-only, shared)."""
+        cached = self._cache.get(symbol)
+        if cached is None:
+            cached = random_binary_vector(self.dim, _seed_from_symbol(symbol, self.seed))
+            cached.setflags(write=False)
+            self._cache[symbol] = cached
+        return cached
+
+
+@dataclass
+class BinaryVsaIndex:
+    """Nearest-neighbor index scanning packed rows with XOR + popcount."""
+
+    encoder: BinaryVsaEncoder
+    _ids: List[str] = field(default_factory=list, init=False)
+    _rows: Dict[str, int] = field(default_factory=dict, init=False)
+    _matrix: Any = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        _require_numpy()
+        self._matrix = np.zeros((0, packed_bytes(self.encoder.dim) // 8), dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item_id: str, vector: Any) -> None:
+        words = np.ascontiguousarray(vector, dtype=np.uint8).view(np.uint64)
+        if words.shape[0] != self._matrix.shape[1]:
+            raise ValueError("vector dimension does not match encoder")
+        row = self._rows.get(item_id)
+        if row is None:
+            row = len(self._ids)
+            self._reserve(row + 1)
+            self._ids.append(item_id)
+            self._rows[item_id] = row
+        if not self._matrix.flags.writeable:
+            self._matrix = np.array(self._matrix)
+        self._matrix[row] = words
+
+    def add_symbol(self, item_id: str, symbol: str) -> Any:
+        vector = self.encoder.vector(symbol)
+        self.add(item_id, vector)
+        return vector
+
+    def query(self, vector: Any, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Returns (id, similarity) pairs, most similar first."""
+        size = len(self._ids)
+        if size == 0 or top_k <= 0:
+            return []
+        probe = np.ascontiguousarray(vector, dtype=np.uint8).view(np.uint64)
+        if probe.shape[0] != self._matrix.shape[1]:
+            raise ValueError("vector dimension does not match encoder")
+
+        distances = np.empty(size, dtype=np.int64)
+        for start in range(0, size, SCAN_CHUNK_ROWS):
+            stop = min(size, start + SCAN_CHUNK_ROWS)
+            xor = np.bitwise_xor(self._matrix[start:stop], probe)
+            distances[start:stop] = popcount(xor).sum(axis=1, dtype=np.int64)
+
+        if top_k < size:
+            candidates = np.argpartition(distances, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(size)
+        order = candidates[np.argsort(distances[candidates], kind="stable")]
+        dim = self.encoder.dim
+        return [(self._ids[row], 1.0 - 2.0 * float(distances[row]) / dim) for row in order]
+
+    def save(self, path: str) -> None:
+        """Writes ids and packed rows to a memory-mappable file."""
+        write_vector_file(path, self._ids, self._matrix[: len(self._ids)], self.encoder.dim, self.encoder.seed)
+
+    @classmethod
+    def load(cls, path: str, encoder: BinaryVsaEncoder, mmap: bool = True) -> "BinaryVsaIndex":
+        """Opens a saved index; with mmap=True the rows are not copied."""
+        stored = read_vector_file(path, mmap=mmap)
+        if stored.dim != encoder.dim:
+            raise ValueError("stored vector dimension does not match encoder")
+        index = cls(encoder)
+        index._ids = list(stored.ids)
+        index._rows = {item_id: row for row, item_id in enumerate(index._ids)}
+        index._matrix = stored.rows
+        return index
+
+    def _reserve(self, rows: int) -> None:
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        grown = np.zeros((max(rows, capacity * 2, 16), self._matrix.shape[1]), dtype=np.uint64)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
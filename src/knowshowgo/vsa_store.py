@@ -0,0 +1,120 @@
+"""Flat binary persistence for VSA vectors.
+
+One file holds a fixed header, the item ids, and a contiguous block of
+fixed-width rows. The row block starts on a 64-byte boundary, so it can
+be opened with numpy.memmap. Worker processes then share one read-only,
+page-cached copy instead of each re-encoding the codebook at startup.
+
+Layout (little-endian):
+    header   magic, version, dtype code, dim, row width, count,
+             ids length, vectors offset, seed
+    ids      UTF-8 JSON array of item ids
+    padding  zeros up to the 64-byte aligned vectors offset
+    vectors  count x row width values (float32, float64 or uint64)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from dataclasses import dataclass
+from typing import Any, List, Sequence
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None  # type: ignore
+
+MAGIC = b"KSGVSA\x00\x01"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sIIQQQQQq")
+ALIGNMENT = 64
+
+DTYPE_FLOAT32 = 0
+DTYPE_UINT64 = 1
+DTYPE_FLOAT64 = 2
+_DTYPES = {DTYPE_FLOAT32: "float32", DTYPE_UINT64: "uint64", DTYPE_FLOAT64: "float64"}
+
+
+@dataclass
+class VectorFile:
+    """Contents of a vector file; `rows` is a read-only memmap when mapped."""
+
+    ids: List[str]
+    rows: Any
+    dim: int
+    seed: int
+    dtype_code: int
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for VSA vector files")
+
+
+def write_vector_file(path: str, ids: Sequence[str], rows: Any, dim: int, seed: int = 0) -> None:
+    """Writes ids and a 2-D row block; replaces `path` atomically."""
+    _require_numpy()
+    rows = np.ascontiguousarray(rows)
+    if rows.ndim != 2 or rows.shape[0] != len(ids):
+        raise ValueError("rows must be a 2-D array with one row per id")
+    codes = {np.dtype(name): code for code, name in _DTYPES.items()}
+    dtype_code = codes.get(rows.dtype)
+    if dtype_code is None:
+        raise ValueError(f"unsupported row dtype: {rows.dtype}")
+
+    ids_blob = json.dumps(list(ids), separators=(",", ":")).encode("utf-8")
+    ids_end = HEADER.size + len(ids_blob)
+    vectors_offset = (ids_end + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        dtype_code,
+        dim,
+        rows.shape[1],
+        rows.shape[0],
+        len(ids_blob),
+        vectors_offset,
+        seed,
+    )
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(header)
+        handle.write(ids_blob)
+        handle.write(b"\0" * (vectors_offset - ids_end))
+        handle.write(rows.tobytes(order="C"))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_vector_file(path: str, mmap: bool = True) -> VectorFile:
+    """Reads a vector file; with mmap=True the row block is mapped read-only."""
+    _require_numpy()
+    with open(path, "rb") as handle:
+        raw_header = handle.read(HEADER.size)
+        if len(raw_header) != HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, dtype_code, dim, width, count, ids_length, vectors_offset, seed = HEADER.unpack(
+            raw_header
+        )
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a VSA vector file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported format version {version}")
+        if dtype_code not in _DTYPES:
+            raise ValueError(f"{path}: unknown dtype code {dtype_code}")
+        ids = json.loads(handle.read(ids_length).decode("utf-8"))
+
+    dtype = np.dtype(_DTYPES[dtype_code])
+    if count == 0:
+        rows = np.zeros((0, width), dtype=dtype)
+    elif mmap:
+        rows = np.memmap(path, dtype=dtype, mode="r", offset=vectors_offset, shape=(count, width))
+    else:
+        rows = np.fromfile(path, dtype=dtype, count=count * width, offset=vectors_offset).reshape(count, width)
+    if len(ids) != count:
+        raise ValueError(f"{path}: id count does not match row count")
+    return VectorFile(ids=ids, rows=rows, dim=dim, seed=seed, dtype_code=dtype_code)
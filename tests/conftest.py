@@ -6,3 +6,6 @@ ROOT = Path(__file__).resolve().parents[1]
 src_path = ROOT / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+# Repo root, for the benchmarks package
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,191 @@
+"""In-memory stand-in for the parts of python-arango that ArangoGraphStore uses.
+
+AQL is not parsed: each query the store issues is recognised by its text
+and evaluated by an equivalent Python handler, and every execute() call is
+recorded so tests can count round trips.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from knowshowgo import arangodb_client as store_module
+
+
+class FakeCollection:
+    def __init__(self) -> None:
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.indexes: List[List[str]] = []
+        self.requests = 0
+        self._next_key = 1
+
+    def insert(self, doc: Dict[str, Any], overwrite: bool = False) -> Dict[str, Any]:
+        self.requests += 1
+        return self._store(doc, overwrite)
+
+    def insert_many(self, docs: List[Dict[str, Any]], overwrite: bool = False) -> List[Dict[str, Any]]:
+        self.requests += 1
+        return [self._store(doc, overwrite) for doc in docs]
+
+    def get_many(self, keys: List[str]) -> List[Dict[str, Any]]:
+        self.requests += 1
+        return [dict(self.docs[key]) for key in keys if key in self.docs]
+
+    def add_persistent_index(self, fields: List[str], **_: Any) -> Dict[str, Any]:
+        self.indexes.append(list(fields))
+        return {"fields": fields}
+
+    def _store(self, doc: Dict[str, Any], overwrite: bool) -> Dict[str, Any]:
+        key = doc.get("_key")
+        if key is None:
+            key = str(self._next_key)
+            self._next_key += 1
+        if key in self.docs and not overwrite:
+            raise KeyError(f"unique constraint violated: {key}")
+        self.docs[key] = {**doc, "_key": key}
+        return {"_key": key}
+
+
+class FakeAql:
+    def __init__(self, db: "FakeDatabase") -> None:
+        self.db = db
+        self.calls: List[tuple] = []
+        # A query runs as one transaction, even when issued from several threads
+        self._lock = threading.Lock()
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], List[Any]]] = {
+            store_module.INCREMENT_EDGE_WEIGHTS_AQL: self._increment_edge_weights,
+            store_module.BULK_UPDATE_NODES_AQL: self._bulk_update_nodes,
+            store_module.NEIGHBORHOOD_AQL: self._neighborhood,
+            store_module.NEIGHBORHOOD_BY_RELATION_AQL: self._neighborhood_by_relation,
+            store_module.SUBGRAPH_AQL: self._subgraph,
+        }
+
+    def execute(self, query: str, bind_vars: Optional[Dict[str, Any]] = None, **_: Any) -> Any:
+        handler = self.handlers.get(query)
+        if handler is None:
+            raise NotImplementedError("query not supported by FakeArangoClient")
+        with self._lock:
+            self.calls.append((query, bind_vars or {}))
+            return iter(handler(bind_vars or {}))
+
+    def _increment_edge_weights(self, bind: Dict[str, Any]) -> List[Any]:
+        col = self.db.collection(bind["@col"])
+        for edit in bind["edits"]:
+            match = next(
+                (
+                    doc
+                    for doc in col.docs.values()
+                    if doc.get("source_id") == edit["source"] and doc.get("target_id") == edit["target"]
+                ),
+                None,
+            )
+            op_ids = [op["id"] for op in edit["ops"]]
+            if match is None:
+                col._store(
+                    {
+                        "source_id": edit["source"],
+                        "target_id": edit["target"],
+                        "relation": bind["relation"],
+                        "weight": min(edit["delta"], edit["max_weight"]),
+                        "applied_ops": op_ids[-bind["op_history"] :],
+                    },
+                    overwrite=False,
+                )
+            else:
+                applied = match.get("applied_ops") or []
+                if edit["ops"]:
+                    delta = sum(op["delta"] for op in edit["ops"] if op["id"] not in applied)
+                else:
+                    delta = edit["delta"]
+                match["weight"] = min(match["weight"] + delta, edit["max_weight"])
+                merged = applied + [op_id for op_id in dict.fromkeys(op_ids) if op_id not in applied]
+                match["applied_ops"] = merged[-bind["op_history"] :]
+        return []
+
+    def _bulk_update_nodes(self, bind: Dict[str, Any]) -> List[Any]:
+        col = self.db.collection(bind["@col"])
+        updated = []
+        for update in bind["updates"]:
+            doc = col.docs.get(update["id"])
+            if doc is None:
+                continue
+            doc.update({key: value for key, value in update.items() if key != "id"})
+            updated.append(update["id"])
+        return updated
+
+    def _neighborhood(self, bind: Dict[str, Any]) -> List[Any]:
+        # Global vertex uniqueness: BFS order, each vertex once
+        nodes = self.db.collection(bind["@nodes"]).docs
+        edges = list(self.db.collection(bind["@edges"]).docs.values())
+        if bind["center"] not in nodes:
+            return [{"nodes": [], "edges": []}]
+        order = [bind["center"]] + self._bfs(bind, edges, nodes)
+        return self._graph(bind, order[: bind["limit"] + 1], edges)
+
+    def _neighborhood_by_relation(self, bind: Dict[str, Any]) -> List[Any]:
+        # Global vertex uniqueness over allowed edges only: the relation
+        # condition is applied while expanding, before a vertex counts as seen
+        nodes = self.db.collection(bind["@nodes"]).docs
+        edges = list(self.db.collection(bind["@edges"]).docs.values())
+        if bind["center"] not in nodes:
+            return [{"nodes": [], "edges": []}]
+        allowed = [edge for edge in edges if edge.get("relation") in bind["relations"]]
+        order = [bind["center"]] + self._bfs(bind, allowed, nodes)
+        return self._graph(bind, order[: bind["limit"] + 1], allowed)
+
+    @staticmethod
+    def _bfs(bind: Dict[str, Any], edges: List[Dict[str, Any]], nodes: Dict[str, Any]) -> List[str]:
+        """Keys of vertices reachable from the center, in BFS order."""
+        seen = {bind["center"]}
+        found = []
+        frontier = [bind["center"]]
+        for _ in range(bind["depth"]):
+            next_frontier = []
+            for key in frontier:
+                for edge in edges:
+                    for here, there in ((edge["source_id"], edge["target_id"]), (edge["target_id"], edge["source_id"])):
+                        if here == key and there not in seen and there in nodes:
+                            seen.add(there)
+                            found.append(there)
+                            next_frontier.append(there)
+            frontier = next_frontier
+        return found
+
+    def _subgraph(self, bind: Dict[str, Any]) -> List[Any]:
+        nodes = self.db.collection(bind["@nodes"]).docs
+        edges = list(self.db.collection(bind["@edges"]).docs.values())
+        return self._graph(bind, [key for key in bind["keys"] if key in nodes], edges)
+
+    def _graph(self, bind: Dict[str, Any], keys: List[str], edges: List[Dict[str, Any]]) -> List[Any]:
+        nodes = self.db.collection(bind["@nodes"]).docs
+        keep = set(keys)
+        return [
+            {
+                "nodes": [_keep(nodes[key], bind["node_fields"]) for key in keys],
+                "edges": [
+                    _keep(edge, bind["edge_fields"])
+                    for edge in edges
+                    if edge["source_id"] in keep and edge["target_id"] in keep
+                ],
+            }
+        ]
+
+
+def _keep(doc: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    return {field: doc[field] for field in fields if field in doc}
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.collections: Dict[str, FakeCollection] = {}
+        self.aql = FakeAql(self)
+
+    def collection(self, name: str) -> FakeCollection:
+        return self.collections.setdefault(name, FakeCollection())
+
+
+class FakeArangoClient:
+    def __init__(self) -> None:
+        self.database = FakeDatabase()
+
+    def db(self, name: str, username: Optional[str] = None, password: Optional[str] = None) -> FakeDatabase:
+        return self.database
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from fake_arango import FakeArangoClient
+from knowshowgo.api import KnowShowGoAPI
+from knowshowgo.arangodb_client import ArangoGraphStore
+
+
+def _api(**options) -> KnowShowGoAPI:
+    return KnowShowGoAPI(ArangoGraphStore(client=FakeArangoClient()), **options)
+
+
+def _requests(api: KnowShowGoAPI, collection: str) -> int:
+    return api.store._db.collection(collection).requests
+
+
+def test_batch_turns_tagging_into_bulk_writes():
+    api = _api()
+    with api.batch():
+        doc = api.create_node("document", payload={"title": "report"})
+        tags = [api.create_node("tag", payload={"name": f"t{i}"}) for i in range(300)]
+        for tag in tags:
+            api.add_tag(doc.id, tag.id)
+        assert _requests(api, "nodes") == 0
+
+    assert _requests(api, "nodes") == 1
+    assert _requests(api, "associations") == 1
+    nodes = api.store._db.collection("nodes").docs
+    assert list(nodes) == [doc.id] + [tag.id for tag in tags]
+    assert len(api.store._db.collection("associations").docs) == 300
+
+    api.create_node("tag")  # outside the block writes straight through
+    assert _requests(api, "nodes") == 2
+
+
+def test_size_and_time_triggers():
+    api = _api(write_behind=True, flush_size=10)
+    for _ in range(25):
+        api.create_node("concept")
+    assert _requests(api, "nodes") == 2 and api.pending_writes == 5
+    api.flush()
+    assert len(api.store._db.collection("nodes").docs) == 25 and api.pending_writes == 0
+
+    timed = _api(write_behind=True, flush_interval=0.0)
+    timed.create_node("concept")
+    assert timed.pending_writes == 0 and _requests(timed, "nodes") == 1
+
+
+def test_quiet_period_is_flushed_by_the_timer_and_close():
+    api = _api(write_behind=True, flush_interval=0.02)
+    api.create_node("concept")
+    assert api.pending_writes == 1
+    deadline = time.monotonic() + 2.0
+    while api.pending_writes and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert api.pending_writes == 0 and _requests(api, "nodes") == 1
+
+    with _api(write_behind=True) as untimed:
+        untimed.create_node("concept")
+        assert untimed.pending_writes == 1
+    assert untimed.pending_writes == 0 and len(untimed.store._db.collection("nodes").docs) == 1
+
+
+def test_failed_flush_keeps_documents_buffered():
+    api = _api()
+    calls = []
+
+    def broken(docs):
+        calls.append(len(docs))
+        raise ConnectionError("store down")
+
+    real = api.store.upsert_nodes
+    api.store.upsert_nodes = broken
+    with pytest.raises(ConnectionError):
+        with api.batch():
+            api.create_node("concept")
+            api.create_node("concept")
+    assert calls == [2] and api.pending_writes == 2
+
+    api.store.upsert_nodes = real
+    api.flush()
+    assert len(api.store._db.collection("nodes").docs) == 2
+
+
+def test_core_prototypes_are_deterministic_and_written_once():
+    first = _api()
+    first.ensure_core_prototypes(created_by="worker-1")
+    protos = first.store._db.collection("prototypes")
+    assert len(protos.docs) == 10 and protos.requests == 2  # one bulk read, one bulk write
+
+    restarted = KnowShowGoAPI(first.store)
+    restarted.ensure_core_prototypes(created_by="worker-2")
+    assert protos.requests == 3  # the read only
+    assert {name: proto.id for name, proto in restarted.prototypes.items()} == {
+        name: proto.id for name, proto in first.prototypes.items()
+    }
+    assert restarted.prototypes["TAG"].created_by == "worker-1"
+    assert restarted.prototypes["TAG"].schema_meta["parent_prototype"] == "OBJECT_PROPERTY"
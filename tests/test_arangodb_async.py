@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fake_arango import FakeArangoClient
+from knowshowgo.arangodb_async import AsyncArangoGraphStore
+from knowshowgo.arangodb_client import ArangoGraphStore
+from knowshowgo.replication import AsyncReplicator, EdgeUpdate
+
+
+class SlowArangoClient(FakeArangoClient):
+    """Every AQL round trip sleeps, and the peak number of concurrent ones is recorded."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+        lock = threading.Lock()
+        execute = self.database.aql.execute
+
+        def slow_execute(*args, **kwargs):
+            with lock:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+            try:
+                time.sleep(latency)
+                return execute(*args, **kwargs)
+            finally:
+                with lock:
+                    self.in_flight -= 1
+
+        self.database.aql.execute = slow_execute
+
+
+def _async_store(latency: float, **options) -> tuple[AsyncArangoGraphStore, SlowArangoClient]:
+    client = SlowArangoClient(latency)
+    return AsyncArangoGraphStore(ArangoGraphStore(client=client), **options), client
+
+
+@pytest.mark.asyncio
+async def test_calls_run_off_the_event_loop_with_bounded_concurrency():
+    async with _async_store(0.05, max_connections=2)[0] as store:
+        client = store.store._client
+        await store.upsert_nodes([{"_key": f"n{i}", "truth_value": 0.5} for i in range(6)])
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        counts = await asyncio.gather(*(store.bulk_update_nodes([{"id": f"n{i}", "truth_value": 0.9}]) for i in range(6)))
+        ticking.cancel()
+
+        assert counts == [1] * 6
+        assert client.peak == 2
+        assert ticks > 5  # the loop kept running while the queries slept
+        node = await store.get_node("n3")
+        assert node is not None and node.truth_value == 0.9
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout():
+    store, _ = _async_store(0.2, timeout=1.0)
+    with pytest.raises(asyncio.TimeoutError):
+        await store.get_neighborhood("missing", timeout=0.01)
+
+    await store.increment_edge_weights(EdgeUpdate("a", "b", 0.5, 1.0) for _ in range(3))
+    edge = next(iter(store.store._db.collection("associations").docs.values()))
+    assert edge["weight"] == 1.0
+    await store.close()
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        AsyncArangoGraphStore(ArangoGraphStore(client=FakeArangoClient()), max_connections=0)
+
+
+@pytest.mark.asyncio
+async def test_timed_out_writes_are_not_applied_twice():
+    store, client = _async_store(0.05, timeout=0.03)
+    replicator = AsyncReplicator(store, max_retries=3, backoff_base=0.001)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate("a", "b", 0.1, 10.0))
+    await replicator.flush(timeout=2.0)
+    assert len(replicator.dead_letters) == 1  # every attempt timed out...
+
+    store.timeout = 1.0
+    assert await replicator.requeue_dead_letters() == 1
+    await replicator.stop(timeout=2.0)
+    await store.close()
+    edge = next(iter(client.database.collection("associations").docs.values()))
+    assert edge["weight"] == pytest.approx(0.1)  # ...but the op landed exactly once
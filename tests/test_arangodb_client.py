@@ -0,0 +1,172 @@
+import pytest
+
+from fake_arango import FakeArangoClient
+from knowshowgo.api import KnowShowGoAPI
+from knowshowgo.arangodb_client import ArangoGraphStore
+from knowshowgo.models import Association
+from knowshowgo.neuro_service import NeuroService
+from knowshowgo.replication import AsyncReplicator, EdgeUpdate
+
+
+def _store() -> ArangoGraphStore:
+    return ArangoGraphStore(client=FakeArangoClient())
+
+
+def test_bulk_upserts_batch_requests():
+    store = _store()
+    store.batch_size = 2
+    store.upsert_nodes([{"_key": f"n{i}", "weight": 0.0} for i in range(5)])
+    store.upsert_nodes([{"_key": "n0", "weight": 1.0}])
+    store.upsert_associations([{"_key": "a1", "source_id": "n0", "target_id": "n1"}])
+
+    nodes = store._db.collection("nodes")
+    assert len(nodes.docs) == 5
+    assert nodes.docs["n0"]["weight"] == 1.0
+    assert nodes.requests == 4  # 3 chunks + 1 overwrite
+    assert store._db.collection("associations").docs["a1"]["target_id"] == "n1"
+
+
+@pytest.mark.asyncio
+async def test_increment_edge_weights_is_one_capped_upsert():
+    store = _store()
+    store.ensure_indexes()
+    await store.increment_edge_weights(
+        [
+            EdgeUpdate("a", "b", 0.6, 1.0),
+            {"source": "a", "target": "c", "delta": 2.0, "max_weight": 1.5},
+        ]
+    )
+    await store.increment_edge_weight("a", "b", 0.6, 1.0)
+
+    assert len(store._db.aql.calls) == 2
+    edges = {(doc["source_id"], doc["target_id"]): doc for doc in store._db.collection("associations").docs.values()}
+    assert edges[("a", "b")]["weight"] == 1.0
+    assert edges[("a", "c")]["weight"] == 1.5
+    assert edges[("a", "c")]["relation"] == "RELATED_TO"
+    assert store._db.collection("associations").indexes == [["source_id", "target_id"]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_nodes_and_replicator_integration():
+    store = _store()
+    store.upsert_nodes([{"_key": "n1", "truth_value": 0.5}, {"_key": "n2", "truth_value": 0.5}])
+    updated = await store.bulk_update_nodes(
+        [{"id": "n1", "truth_value": 0.9}, {"id": "missing", "truth_value": 0.1}]
+    )
+    assert updated == 1
+    assert store._db.collection("nodes").docs["n1"]["truth_value"] == 0.9
+
+    replicator = AsyncReplicator(store, batch_size=50)
+    for _ in range(10):
+        await replicator.enqueue(EdgeUpdate("p", "i", 1.0, 5.0))
+    await replicator.start()
+    await replicator.stop(timeout=1.0)
+    edge = next(iter(store._db.collection("associations").docs.values()))
+    assert edge["weight"] == 5.0
+    assert len(store._db.aql.calls) == 2  # the update above + one coalesced batch
+
+
+def _seed_graph(store: ArangoGraphStore):
+    """hub -> a, b, c (implies); a -> d (attacks); d -> e (implies)."""
+    api = KnowShowGoAPI(store)
+    hub = api.create_node("concept", payload={"name": "hub", "vsa_vector": [1.0, 0.0]})
+    a, b, c, d, e = (api.create_node("concept", payload={"name": name}) for name in "abcde")
+    assocs = [
+        Association.create_implies(hub.id, a.id, weight=0.9),
+        Association.create_implies(hub.id, b.id),
+        Association.create_implies(hub.id, c.id),
+        Association.create_attacks(a.id, d.id, weight=0.7),
+        Association.create_implies(d.id, e.id),
+    ]
+    store.upsert_associations([KnowShowGoAPI._assoc_doc(assoc) for assoc in assocs])
+    return hub, (a, b, c, d, e)
+
+
+@pytest.mark.asyncio
+async def test_get_neighborhood_is_one_traversal_query():
+    store = _store()
+    hub, (a, b, c, d, e) = _seed_graph(store)
+
+    nodes, assocs = await store.get_neighborhood(hub.id, depth=2)
+    assert len(store._db.aql.calls) == 1
+    assert {node.id for node in nodes} == {hub.id, a.id, b.id, c.id, d.id}
+    assert len(assocs) == 4
+    attack = next(assoc for assoc in assocs if assoc.target_id == d.id)
+    assert attack.logic_meta.type == "ATTACKS" and attack.logic_meta.weight == 0.7
+    assert nodes[0].payload["vsa_vector"] == [1.0, 0.0]
+
+    capped, _ = await store.get_neighborhood(hub.id, depth=3, max_nodes=2)
+    assert len(capped) == 3 and capped[0].id == hub.id
+
+    implies_only, edges = await store.get_neighborhood(hub.id, depth=3, relations=["implies"])
+    assert {node.id for node in implies_only} == {hub.id, a.id, b.id, c.id}
+    assert all(edge.relation == "implies" for edge in edges)
+
+    assert await store.get_neighborhood("missing") == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_store_backs_neuro_service_context():
+    store = _store()
+    hub, (a, *_rest) = _seed_graph(store)
+    service = NeuroService(db=store)
+
+    results = await service.solve_context(hub.id, depth=1, evidence={hub.id: 1.0})
+    assert results[a.id] > 0.5
+    assert store._db.collection("nodes").docs[a.id]["truth_value"] == results[a.id]
+
+    nodes, assocs = await store.get_subgraph([hub.id, a.id])
+    assert {node.id for node in nodes} == {hub.id, a.id} and len(assocs) == 1
+
+
+@pytest.mark.asyncio
+async def test_retried_partial_bulk_failure_skips_applied_ops():
+    store = _store()
+    store.batch_size = 1
+    aql = store._db.aql
+    execute = aql.execute
+    failures = iter([False, True])
+
+    def flaky_execute(*args, **kwargs):
+        result = execute(*args, **kwargs)
+        if next(failures, False):
+            raise ConnectionError("connection reset after commit")
+        return result
+
+    aql.execute = flaky_execute
+    replicator = AsyncReplicator(store, batch_size=10, batch_interval=0.01, backoff_base=0.001)
+    for target in "bcd":
+        await replicator.enqueue(EdgeUpdate("a", target, 0.5, 5.0))
+    await replicator.start()
+    await replicator.stop(timeout=1.0)
+
+    weights = {doc["target_id"]: doc["weight"] for doc in store._db.collection("associations").docs.values()}
+    assert weights == {"b": 0.5, "c": 0.5, "d": 0.5}
+    assert replicator.metrics()["retries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_relation_filter_finds_nodes_first_reached_over_excluded_edges():
+    store = _store()
+    api = KnowShowGoAPI(store)
+    hub, x, y = (api.create_node("concept", payload={"name": name}) for name in ("hub", "x", "y"))
+    # BFS from hub reaches x over the excluded edge before the implies path
+    store.upsert_associations(
+        [
+            KnowShowGoAPI._assoc_doc(Association.create_attacks(hub.id, x.id)),
+            KnowShowGoAPI._assoc_doc(Association.create_implies(hub.id, y.id)),
+            KnowShowGoAPI._assoc_doc(Association.create_implies(y.id, x.id)),
+        ]
+    )
+
+    nodes, edges = await store.get_neighborhood(hub.id, depth=2, relations=["implies"])
+    assert [node.id for node in nodes] == [hub.id, y.id, x.id]
+    assert len(edges) == 2 and all(edge.relation == "implies" for edge in edges)
+    one_hop, _ = await store.get_neighborhood(hub.id, depth=1, relations=["implies"])
+    assert [node.id for node in one_hop] == [hub.id, y.id]
+    capped, _ = await store.get_neighborhood(hub.id, depth=2, max_nodes=1, relations=["implies"])
+    assert [node.id for node in capped] == [hub.id, y.id]
+
+    # created_at is projected rather than replaced by the load time
+    assert nodes[1].created_at == y.created_at
+    assert edges[0].created_at.tzinfo is not None
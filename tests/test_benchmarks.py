@@ -0,0 +1,43 @@
+"""Smoke tests for the benchmark suite (tiny sizes only)."""
+
+from benchmarks.generators import GENERATORS, argumentation, chain
+from benchmarks.run import bench_graph, compare
+from knowshowgo.models import LogicType
+
+
+def test_generators_are_deterministic_and_sized() -> None:
+    for name, generator in GENERATORS.items():
+        nodes, assocs = generator(50, seed=3)
+        again_nodes, again_assocs = generator(50, seed=3)
+        assert len(nodes) == 50, name
+        assert assocs, name
+        assert [n.prior for n in nodes] == [n.prior for n in again_nodes]
+        assert len(assocs) == len(again_assocs)
+
+
+def test_chain_and_argumentation_shapes() -> None:
+    nodes, assocs = chain(10)
+    assert len(assocs) == 9
+    assert all(a.logic_meta.type == LogicType.IMPLIES for a in assocs)
+
+    _, attacks = argumentation(20, attacks_per_node=3)
+    attack_count = sum(1 for a in attacks if a.logic_meta.type == LogicType.ATTACKS)
+    assert attack_count == 60
+
+
+def test_bench_graph_reports_every_benchmark() -> None:
+    results = bench_graph("power_law", 60, repeats=1, max_iterations=5)
+    names = [row["benchmark"] for row in results]
+    assert names == ["to_neuro_json", "engine_run", "run_inference", "train_epoch", "memory_peak"]
+    assert all(row["seconds_median"] >= 0 for row in results)
+    assert results[-1]["peak_bytes"] > 0
+
+
+def test_compare_flags_only_regressions() -> None:
+    row = {"generator": "chain", "size": 100, "benchmark": "engine_run"}
+    baseline = {"results": [dict(row, seconds_median=1.0), dict(row, benchmark="memory_peak", peak_bytes=100)]}
+    current = {"results": [dict(row, seconds_median=1.5), dict(row, benchmark="memory_peak", peak_bytes=110)]}
+
+    regressions = compare(current, baseline, tolerance=0.2)
+    assert [(r["benchmark"], r["metric"]) for r in regressions] == [("engine_run", "seconds_median")]
+    assert compare(current, baseline, tolerance=0.6) == []
@@ -0,0 +1,148 @@
+import pytest
+
+from fake_arango import FakeArangoClient
+from knowshowgo.api import KnowShowGoAPI
+from knowshowgo.arangodb_client import ArangoGraphStore
+from knowshowgo.graph_cache import ASSOCIATIONS, GraphCache, _approx_size
+from knowshowgo.models import Node
+from knowshowgo.neuro_service import NeuroService
+from knowshowgo.vsa import attach_vsa
+
+
+def _store() -> ArangoGraphStore:
+    return ArangoGraphStore(client=FakeArangoClient())
+
+
+def _seed(store: ArangoGraphStore, count: int) -> list[str]:
+    api = KnowShowGoAPI(store)
+    return [api.create_node("concept", payload={"name": f"n{i}"}).id for i in range(count)]
+
+
+def test_get_many_fetches_only_misses():
+    store = _store()
+    ids = _seed(store, 5)
+    nodes = store._db.collection("nodes")
+    cache = GraphCache(store)
+
+    assert set(cache.get_many(ids[:3])) == set(ids[:3])
+    before = nodes.requests
+    found = cache.get_many(ids + ["missing"])
+    assert set(found) == set(ids) and nodes.requests == before + 1
+    assert found[ids[4]].payload["name"] == "n4"
+
+    cache.get_many(ids)
+    assert nodes.requests == before + 1
+    assert cache.cache_info()["hits"] == 3 + 5
+
+
+def test_lru_eviction_by_count_and_bytes():
+    store = _store()
+    ids = _seed(store, 6)
+    cache = GraphCache(store, max_entries=3)
+    cache.get_many(ids[:3])
+    cache.get(ids[0])  # now most recent
+    cache.get(ids[3])
+    assert cache.peek(ids[1]) is None and cache.peek(ids[0]) is not None
+    assert cache.cache_info()["evictions"] == 1
+
+    one = GraphCache(store).get(ids[0])
+    small = GraphCache(store, max_bytes=int(_approx_size(one) * 2.5))
+    small.get_many(ids)
+    assert len(small) == 2 and small.cache_info()["bytes"] <= small.max_bytes
+
+
+def test_writes_through_api_and_stale_reads_are_not_cached():
+    store = _store()
+    cache = GraphCache(store)
+    api = KnowShowGoAPI(store, cache=cache, write_behind=True)
+    doc = api.create_node("document")
+    tag = api.create_node("tag")
+    assoc = api.add_tag(doc.id, tag.id)
+    assert cache.peek(doc.id) is doc and cache.peek(assoc.id, ASSOCIATIONS) is assoc
+    assert api.get_associations([assoc.id]) == {assoc.id: assoc}
+    assert api.pending_writes == 0  # reads flush first
+
+    # A write that lands while a read is in flight wins over the read's result
+    cache.invalidate([doc.id])
+    real = store.get_nodes
+
+    def racing_get_nodes(keys):
+        loaded = real(keys)
+        cache.put(doc)
+        return loaded
+
+    store.get_nodes = racing_get_nodes
+    stale = cache.get(doc.id)
+    assert stale is not doc and cache.peek(doc.id) is doc
+
+
+@pytest.mark.asyncio
+async def test_write_back_invalidates_cached_nodes():
+    store = _store()
+    a, b = _seed(store, 2)
+    KnowShowGoAPI(store).add_association(a, b, "implies", weight=1.0)
+    cache = GraphCache(store)
+    cache.get_many([a, b])
+
+    service = NeuroService(db=store, cache=cache)
+    results = await service.solve_context(a, depth=1, evidence={a: 1.0})
+    assert cache.peek(a) is None and cache.peek(b) is None
+    assert cache.get(b).truth_value == results[b]
+
+
+def test_write_stamps_are_dropped_between_reads():
+    store = _store()
+    cache = GraphCache(store)
+    api = KnowShowGoAPI(store, cache=cache)
+    for _ in range(100):
+        api.create_node("concept")
+    assert cache._written_at == {}
+
+    node = api.create_node("concept")
+    with cache.loading() as fill:
+        cache.invalidate([node.id])
+        assert len(cache._written_at) == 1
+        fill([node])  # written after the load began: not cached
+    assert cache.peek(node.id) is None and cache._written_at == {}
+
+
+
+def test_write_stamps_stay_bounded_under_overlapping_reads():
+    cache = GraphCache(_store())
+    nodes = [Node.create(prototype_id=None) for _ in range(50)]
+    reading = cache.loading()
+    reading.__enter__()
+    for node in nodes:
+        # Each read starts before the previous one ends, so some read is always in flight
+        cache.put(node)
+        newer = cache.loading()
+        fill = newer.__enter__()
+        reading.__exit__(None, None, None)
+        reading = newer
+        assert len(cache._written_at) <= 1
+    cache.invalidate([nodes[0].id])
+    fill([nodes[0]])  # still rejected: written after this read began
+    assert cache.peek(nodes[0].id) is None
+    reading.__exit__(None, None, None)
+    assert cache._written_at == {}
+
+
+@pytest.mark.asyncio
+async def test_vsa_context_fills_the_cache_with_its_center():
+    store = _store()
+    api = KnowShowGoAPI(store)
+    hub = api.create_node("concept")
+    attach_vsa(hub, [1.0, 0.0])
+    other = api.create_node("concept")
+    attach_vsa(other, [0.9, 0.1])
+    store.upsert_nodes([KnowShowGoAPI._node_doc(node) for node in (hub, other)])
+    cache = GraphCache(store)
+
+    service = NeuroService(db=store, cache=cache)
+    service.index_node_vectors([hub, other])
+    service.set_config(context_mode="vsa", context_top_k=1)
+    await service.fetch_context(hub.id)
+    assert cache.peek(hub.id).id == hub.id
+    calls = len(store._db.aql.calls)
+    await service.fetch_context(hub.id)
+    assert len(store._db.aql.calls) == calls + 1  # the subgraph only
@@ -1,5 +1,16 @@
+import asyncio
+
+import pytest
+
 from knowshowgo.graph import KnowledgeGraph
 from knowshowgo.inference import process_instruction
+from knowshowgo.replication import AsyncReplicator
+from knowshowgo.working_memory import WorkingMemoryGraph
+
+
+class FakeGraphClient:
+    async def increment_edge_weight(self, source: str, target: str, delta: float, max_weight: float) -> None:
+        pass
 
 
 def test_midnight_trash_event():
@@ -14,4 +25,15 @@ def test_midnight_trash_event():
     # Prototype is reused on subsequent event instructions
     proto2, inst2 = process_instruction(graph, "Remind me at midnight to check the oven.")
     assert proto2.id == proto.id
-    assert inst2.attributes["time"] == "00:00"
\ No newline at end of file
+    assert inst2.attributes["time"] == "00:00"
+
+@pytest.mark.asyncio
+async def test_full_block_queue_rejects_instead_of_spawning_tasks():
+    replicator = AsyncReplicator(FakeGraphClient(), max_queue=1)
+    graph, memory = KnowledgeGraph(), WorkingMemoryGraph()
+    for _ in range(3):
+        process_instruction(graph, "Write the report", working_memory=memory, replicator=replicator)
+
+    assert len(asyncio.all_tasks()) == 1  # only this test
+    metrics = replicator.metrics()
+    assert (metrics["depth"], metrics["enqueued"], metrics["rejected"]) == (1, 1, 2)
@@ -5,6 +5,28 @@ from knowshowgo.belief_resolver import BeliefResolver, GraphDerivedBeliefResolve
 from knowshowgo.models import Node, Association, LogicType, LogicMeta, CONTEXT_PROTOTYPE
 from knowshowgo.neuro_service import NeuroService, run_local_inference
 from knowshowgo.neuro import NeuroEngine, fuzzy_and, fuzzy_or, fuzzy_not, implies
+from knowshowgo.vsa import VsaEncoder, attach_vsa, bundle
+
+
+class FakeNeighborhoodDb:
+    """In-memory adapter exposing the reads NeuroService uses."""
+
+    def __init__(self, nodes, associations):
+        self.nodes = {node.id: node for node in nodes}
+        self.associations = list(associations)
+
+    async def get_node(self, node_id):
+        return self.nodes.get(node_id)
+
+    async def get_neighborhood(self, center_id, depth):
+        return list(self.nodes.values()), list(self.associations)
+
+    async def get_subgraph(self, node_ids):
+        keep = set(node_ids)
+        return (
+            [self.nodes[node_id] for node_id in node_ids if node_id in self.nodes],
+            [a for a in self.associations if a.source_id in keep and a.target_id in keep],
+        )
 
 
 class TestLogicCore:
@@ -163,6 +185,253 @@ class TestNeuroEngine:
         # Weight should have increased
         assert final_weight > initial_weight
 
+    def _feedback_schema(self):
+        """Cycle a -> b -> c -> a with SUPPORT/ATTACK feedback."""
+        rule = lambda rid, src, dst, w: {
+            "id": rid,
+            "type": "IMPLICATION",
+            "inputs": [src],
+            "output": dst,
+            "op": "IDENTITY",
+            "weight": w,
+        }
+        return {
+            "version": "1.0",
+            "variables": {name: {"type": "bool", "prior": 0.5} for name in "abcd"},
+            "rules": [
+                rule("ab", "a", "b", 0.9),
+                rule("bc", "b", "c", 0.9),
+                rule("ca", "c", "a", 0.95),
+                rule("da", "d", "a", 0.8),
+            ],
+            "constraints": [
+                {"id": "c_attacks_d", "type": "ATTACK", "source": "c", "target": "d", "weight": 0.3},
+                {"id": "d_supports_b", "type": "SUPPORT", "source": "d", "target": "b", "weight": 0.2},
+            ],
+        }
+
+    @pytest.mark.parametrize("strategy", ["adaptive", "sor", "anderson"])
+    def test_acceleration_reaches_same_fixed_point(self, strategy):
+        from knowshowgo.neuro.types import EngineConfig
+
+        schema = self._feedback_schema()
+        reference = NeuroEngine(
+            schema, EngineConfig(max_iterations=2000, convergence_threshold=1e-9)
+        ).run({"d": 0.9})
+        accelerated = NeuroEngine(
+            schema,
+            EngineConfig(max_iterations=200, convergence_threshold=1e-9, acceleration=strategy),
+        ).run({"d": 0.9})
+
+        for name, value in reference.items():
+            assert abs(accelerated[name] - value) < 1e-4
+
+    def test_anderson_converges_in_fewer_iterations(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        schema = self._feedback_schema()
+        reference = NeuroEngine(
+            schema, EngineConfig(max_iterations=2000, convergence_threshold=1e-9)
+        ).run({"d": 0.9})
+        plain = NeuroEngine(schema, EngineConfig(max_iterations=8)).run({"d": 0.9})
+        anderson = NeuroEngine(
+            schema, EngineConfig(max_iterations=8, acceleration="anderson")
+        ).run({"d": 0.9})
+
+        plain_error = max(abs(plain[k] - v) for k, v in reference.items())
+        anderson_error = max(abs(anderson[k] - v) for k, v in reference.items())
+        assert anderson_error < 1e-3 < plain_error
+
+    def test_unknown_acceleration_raises(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        with pytest.raises(ValueError):
+            NeuroEngine(self._feedback_schema(), EngineConfig(acceleration="bogus"))
+
+    def test_run_detailed_reports_convergence(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        engine = NeuroEngine(
+            self._feedback_schema(),
+            EngineConfig(max_iterations=200, acceleration="anderson"),
+        )
+        result = engine.run_detailed({"d": 0.9})
+
+        assert result.converged is True
+        assert 0 < result.iterations < 200
+        assert len(result.deltas) == result.iterations
+        assert result.deltas[-1] < engine.config.convergence_threshold
+        assert result.rule_evaluations > 0
+        assert result.wall_time >= 0.0
+        assert result.history is None
+        assert result.values == engine.export_state()
+
+    def test_run_detailed_flags_non_convergence_and_bounds_history(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        engine = NeuroEngine(self._feedback_schema(), EngineConfig(max_iterations=10))
+        result = engine.run_detailed({"d": 0.9}, history_variables=["a", "missing"], history_size=3)
+
+        assert result.converged is False
+        assert result.iterations == 10
+        assert len(result.history) == 3
+        assert result.history[-1] == {"a": result.states["a"].value}
+
+    def test_instrumentation_reports_phases_and_counts(self):
+        from knowshowgo.neuro import EngineMetrics
+        from knowshowgo.neuro.types import EngineConfig
+
+        metrics = EngineMetrics()
+        engine = NeuroEngine(
+            self._feedback_schema(), EngineConfig(max_iterations=10), instrumentation=metrics
+        )
+        engine.run({"d": 0.9})
+
+        data = metrics.to_dict()
+        assert data["runs"] == 1
+        assert data["last_iterations"] == 10
+        assert data["converged_runs"] == 0
+        assert data["phases"]["reset"]["calls"] == 1
+        assert data["phases"]["forward_pass"]["calls"] == 10
+        assert data["phases"]["constraints"]["calls"] == 10
+        # d is locked, so only a/b/c rules run: ab, bc, ca, da
+        assert data["rule_evaluations"] == {"IMPLICATION": 40}
+        # c attacks locked d (skipped); d supports b
+        assert data["constraint_updates"] == {"SUPPORT": 10}
+
+    def test_instrumentation_prometheus_export(self):
+        from knowshowgo.neuro import EngineMetrics
+
+        metrics = EngineMetrics(prefix="test_engine")
+        engine = NeuroEngine(self._feedback_schema(), instrumentation=metrics)
+        engine.run()
+        engine.run()
+
+        text = metrics.to_prometheus()
+        assert "# TYPE test_engine_runs_total counter" in text
+        assert "test_engine_runs_total 2" in text
+        assert 'test_engine_phase_seconds_total{phase="forward_pass"}' in text
+        assert 'test_engine_rule_evaluations_total{rule_type="IMPLICATION"}' in text
+        assert 'test_engine_constraint_updates_total{constraint_type="ATTACK"}' in text
+
+    def _argumentation_schema(self, constraints):
+        return {
+            "version": "1.0",
+            "variables": {
+                name: {"type": "bool", "prior": prior}
+                for name, prior in {"a": 0.9, "b": 0.6, "c": 0.7, "d": 0.4}.items()
+            },
+            "rules": [],
+            "constraints": constraints,
+        }
+
+    def test_sparse_constraints_match_sequential_on_independent_edges(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        constraints = [
+            {"id": "a_att_c", "type": "ATTACK", "source": "a", "target": "c", "weight": 0.5},
+            {"id": "b_att_c", "type": "ATTACK", "source": "b", "target": "c", "weight": 0.8},
+            {"id": "a_sup_d", "type": "SUPPORT", "source": "a", "target": "d", "weight": 0.3},
+            {"id": "b_sup_d", "type": "SUPPORT", "source": "b", "target": ["d"], "weight": 0.6},
+        ]
+        schema = self._argumentation_schema(constraints)
+        sequential = NeuroEngine(schema, EngineConfig(max_iterations=1)).run()
+        sparse = NeuroEngine(schema, EngineConfig(max_iterations=1, constraint_mode="sparse")).run()
+
+        for name, value in sequential.items():
+            assert abs(sparse[name] - value) < 1e-9
+
+    def test_sparse_constraints_are_order_independent(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        constraints = [
+            {"id": "a_att_b", "type": "ATTACK", "source": "a", "target": "b", "weight": 0.7},
+            {"id": "b_att_c", "type": "ATTACK", "source": "b", "target": "c", "weight": 0.9},
+            {"id": "c_sup_a", "type": "SUPPORT", "source": "c", "target": "a", "weight": 0.4},
+            {"id": "d_att_a", "type": "ATTACK", "source": "d", "target": "a", "weight": 1.0},
+        ]
+        config = EngineConfig(max_iterations=3, constraint_mode="sparse")
+        forward = NeuroEngine(self._argumentation_schema(constraints), config).run()
+        backward = NeuroEngine(self._argumentation_schema(constraints[::-1]), config).run()
+        assert forward == backward
+
+        sequential = EngineConfig(max_iterations=3)
+        assert NeuroEngine(self._argumentation_schema(constraints), sequential).run() != NeuroEngine(
+            self._argumentation_schema(constraints[::-1]), sequential
+        ).run()
+
+    def test_sparse_pure_python_fallback_matches(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        constraints = [
+            {"id": "a_att_b", "type": "ATTACK", "source": "a", "target": "b", "weight": 1.0},
+            {"id": "d_att_b", "type": "ATTACK", "source": "d", "target": "b", "weight": 0.5},
+            {"id": "c_sup_d", "type": "SUPPORT", "source": "c", "target": "d", "weight": 0.4},
+        ]
+        config = EngineConfig(max_iterations=5, constraint_mode="sparse")
+        vectorized = NeuroEngine(self._argumentation_schema(constraints), config)
+        fallback = NeuroEngine(self._argumentation_schema(constraints), config)
+        fallback._sparse_constraints._np = None
+
+        expected = vectorized.run({"a": 0.95})
+        actual = fallback.run({"a": 0.95})
+        for name, value in expected.items():
+            assert abs(actual[name] - value) < 1e-9
+
+    def test_unknown_constraint_mode_raises(self):
+        from knowshowgo.neuro.types import EngineConfig
+
+        with pytest.raises(ValueError):
+            NeuroEngine(self._argumentation_schema([]), EngineConfig(constraint_mode="dense"))
+
+    def _mutex_schema(self, priors, weight=1.0):
+        names = list(priors)
+        return {
+            "version": "1.0",
+            "variables": {name: {"type": "bool", "prior": p} for name, p in priors.items()},
+            "rules": [],
+            "constraints": [{
+                "id": "colors",
+                "type": "MUTEX",
+                "source": names[0],
+                "target": names[1:],
+                "weight": weight,
+            }],
+        }
+
+    @pytest.mark.parametrize("mode", ["sequential", "sparse"])
+    def test_mutex_group_is_normalized(self, mode):
+        from knowshowgo.neuro.types import EngineConfig
+
+        schema = self._mutex_schema({"red": 0.6, "green": 0.6, "blue": 0.3})
+        result = NeuroEngine(schema, EngineConfig(constraint_mode=mode)).run()
+
+        assert abs(sum(result.values()) - 1.0) < 1e-9
+        assert abs(result["red"] - 0.4) < 1e-9
+        assert abs(result["blue"] - 0.2) < 1e-9
+
+    def test_mutex_respects_locked_members_and_weight(self):
+        schema = self._mutex_schema({"red": 0.5, "green": 0.5, "blue": 0.5})
+        result = NeuroEngine(schema).run({"red": 0.8})
+        assert result["red"] == 0.8
+        assert abs(result["green"] + result["blue"] - 0.2) < 1e-9
+
+        partial = NeuroEngine(self._mutex_schema({"a": 0.8, "b": 0.8}, weight=0.5)).run(iterations=1)
+        # scale = 1 / 1.6; blended factor = 0.5 + 0.5 * scale
+        assert abs(partial["a"] - 0.8 * (0.5 + 0.5 / 1.6)) < 1e-9
+
+    def test_mutex_large_group_and_python_fallback(self):
+        priors = {f"c{i}": 0.5 for i in range(300)}
+        engine = NeuroEngine(self._mutex_schema(priors))
+        fallback = NeuroEngine(self._mutex_schema(priors))
+        fallback._mutex_index._np = None
+
+        expected = engine.run({"c0": 0.7})
+        actual = fallback.run({"c0": 0.7})
+        assert abs(sum(expected.values()) - 1.0) < 1e-9
+        for name, value in expected.items():
+            assert abs(actual[name] - value) < 1e-12
+
     def test_export(self):
         schema = {
             "version": "1.0",
@@ -232,6 +501,220 @@ class TestNeuroService:
         assert len(schema["rules"]) == 1  # One IMPLIES
         assert len(schema["constraints"]) == 1  # One ATTACK
 
+    def test_to_neuro_json_groups_mutex_edges(self):
+        nodes = [Node.create(prototype_id="color", prior=0.6) for _ in range(4)]
+        red, green, blue, other = nodes
+        assocs = [
+            # One declared group, split across edges that share its key
+            Association.create_mutex(red.id, green.id, group="palette"),
+            Association.create_mutex(blue.id, other.id, group="palette"),
+            Association.create_mutex(green.id, blue.id, group="palette"),
+        ]
+
+        service = NeuroService()
+        context = service.extract_context(nodes, assocs, center_node_id=red.id)
+        schema = service.to_neuro_json(context)
+
+        mutex = [c for c in schema["constraints"] if c["type"] == "MUTEX"]
+        assert len(mutex) == 1
+        members = [mutex[0]["source"], *mutex[0]["target"]]
+        assert sorted(members) == sorted(f"node_{n.id}" for n in nodes)
+        assert mutex[0]["weight"] == 1.0
+
+        results = service.run_inference(context)
+        assert sum(results.values()) <= 1.0 + 1e-9
+
+    def test_to_neuro_json_keeps_unkeyed_mutex_edges_pairwise(self):
+        a, b, c = [Node.create(prototype_id="x", prior=0.6) for _ in range(3)]
+        assocs = [Association.create_mutex(a.id, b.id), Association.create_mutex(b.id, c.id, weight=0.5)]
+
+        service = NeuroService()
+        schema = service.to_neuro_json(service.extract_context([a, b, c], assocs, a.id))
+        mutex = [con for con in schema["constraints"] if con["type"] == "MUTEX"]
+        # A and C were never declared exclusive, and each pair keeps its weight
+        assert [(con["source"], con["target"], con["weight"]) for con in mutex] == [
+            (f"node_{a.id}", [f"node_{b.id}"], 1.0),
+            (f"node_{b.id}", [f"node_{c.id}"], 0.5),
+        ]
+        results = service.run_inference(service.extract_context([a, b, c], assocs, a.id))
+        assert results[a.id] + results[b.id] <= 1.0 + 1e-9
+
+    def test_to_neuro_json_keeps_separate_mutex_components(self):
+        a, b, c, d = [Node.create(prototype_id="x", prior=0.7) for _ in range(4)]
+        assocs = [Association.create_mutex(a.id, b.id), Association.create_mutex(c.id, d.id)]
+
+        service = NeuroService()
+        schema = service.to_neuro_json(service.extract_context([a, b, c, d], assocs, a.id))
+        assert len([con for con in schema["constraints"] if con["type"] == "MUTEX"]) == 2
+
+    def test_to_neuro_json_groups_rules_by_rule_group(self):
+        target = Node.create(prototype_id="claim", prior=0.2)
+        sources = [Node.create(prototype_id="evidence", prior=0.5) for _ in range(50)]
+        assocs = [
+            Association.create(
+                source_id=src.id,
+                target_id=target.id,
+                relation="implies",
+                logic_type=LogicType.IMPLIES,
+                logic_weight=0.8,
+                metadata={"rule_group": "evidence"},
+            )
+            for src in sources
+        ]
+        # An ungrouped IDENTITY edge stays a single-input rule
+        extra = Node.create(prototype_id="evidence", prior=0.5)
+        assocs.append(Association.create_implies(extra.id, target.id, weight=0.6))
+
+        service = NeuroService()
+        context = service.extract_context([target, extra, *sources], assocs, center_node_id=target.id)
+        schema = service.to_neuro_json(context)
+
+        assert len(schema["rules"]) == 2
+        grouped = next(rule for rule in schema["rules"] if len(rule["inputs"]) > 1)
+        assert len(grouped["inputs"]) == 50
+        assert grouped["op"] == "WEIGHTED"
+        assert abs(grouped["weight"] - 0.8) < 1e-9
+
+        service.set_config(group_rules=False)
+        assert len(service.to_neuro_json(context)["rules"]) == 51
+
+    def test_weighted_group_matches_separate_rules(self):
+        target = Node.create(prototype_id="claim", prior=0.2)
+        weak, strong = (Node.create(prototype_id="evidence", prior=0.5) for _ in range(2))
+        assocs = [
+            Association.create(
+                source_id=src.id,
+                target_id=target.id,
+                relation="implies",
+                logic_type=LogicType.IMPLIES,
+                logic_weight=weight,
+                metadata={"rule_group": "evidence"},
+            )
+            for src, weight in ((weak, 0.1), (strong, 0.9))
+        ]
+        service = NeuroService()
+        context = service.extract_context([target, weak, strong], assocs, center_node_id=target.id)
+        evidence = {weak.id: 1.0, strong.id: 0.0}
+
+        grouped = service.to_neuro_json(context)["rules"]
+        assert len(grouped) == 1 and grouped[0]["weights"] == pytest.approx([0.01, 0.81])
+        grouped_result = service.run_inference(context, evidence)[target.id]
+        service.set_config(group_rules=False)
+        separate_result = service.run_inference(context, evidence)[target.id]
+        # The weak edge firing alone barely moves the claim either way
+        assert grouped_result == pytest.approx(separate_result)
+        assert grouped_result < 0.1
+
+    def test_repeated_source_group_matches_separate_rules(self):
+        target = Node.create(prototype_id="claim", prior=0.2)
+        source = Node.create(prototype_id="evidence", prior=0.5)
+        assocs = [
+            Association.create(
+                source_id=source.id,
+                target_id=target.id,
+                relation="implies",
+                logic_type=LogicType.IMPLIES,
+                logic_weight=weight,
+                metadata={"rule_group": "evidence"},
+            )
+            for weight in (0.2, 1.0)
+        ]
+        service = NeuroService()
+        context = service.extract_context([target, source], assocs, center_node_id=target.id)
+
+        grouped = service.to_neuro_json(context)["rules"]
+        assert len(grouped) == 1 and grouped[0]["weight"] == pytest.approx(1.04 / 1.2)
+        grouped_result = service.run_inference(context, {source.id: 1.0})[target.id]
+        service.set_config(group_rules=False)
+        separate_result = service.run_inference(context, {source.id: 1.0})[target.id]
+        assert grouped_result == pytest.approx(separate_result)
+
+    def test_not_edges_are_never_grouped(self):
+        target = Node.create(prototype_id="claim", prior=0.5)
+        sources = [Node.create(prototype_id="evidence", prior=0.5) for _ in range(2)]
+        assocs = [
+            Association.create(
+                source_id=src.id,
+                target_id=target.id,
+                relation="refutes",
+                logic_type=LogicType.IMPLIES,
+                logic_op="NOT",
+                metadata={"rule_group": "refuters"},
+            )
+            for src in sources
+        ]
+        service = NeuroService()
+        context = service.extract_context([target, *sources], assocs, center_node_id=target.id)
+
+        rules = service.to_neuro_json(context)["rules"]
+        assert [(rule["op"], len(rule["inputs"])) for rule in rules] == [("NOT", 1), ("NOT", 1)]
+        assert "weights" not in rules[0]
+
+    def test_and_edges_combine_into_one_rule(self):
+        a = Node.create(prototype_id="cond", prior=0.5)
+        b = Node.create(prototype_id="cond", prior=0.5)
+        out = Node.create(prototype_id="result", prior=0.1)
+        assocs = [
+            Association.create(a.id, out.id, "requires", logic_type=LogicType.IMPLIES, logic_op="AND"),
+            Association.create(b.id, out.id, "requires", logic_type=LogicType.IMPLIES, logic_op="AND"),
+        ]
+
+        service = NeuroService()
+        context = service.extract_context([a, b, out], assocs, center_node_id=out.id)
+        rules = service.to_neuro_json(context)["rules"]
+        assert len(rules) == 1
+        assert rules[0]["op"] == "AND"
+        assert sorted(rules[0]["inputs"]) == sorted([f"node_{a.id}", f"node_{b.id}"])
+
+        both = service.run_inference(context, evidence={a.id: 1.0, b.id: 1.0})
+        one = service.run_inference(context, evidence={a.id: 1.0, b.id: 0.0})
+        assert both[out.id] > 0.9
+        assert one[out.id] < 0.1
+
+    def create_hub(self, spokes=50):
+        """A hub whose first three spokes share most of its hypervector."""
+        encoder = VsaEncoder(dim=256, seed=3)
+        hub = Node.create(prototype_id="concept", payload={"name": "Hub"})
+        attach_vsa(hub, encoder.vector("hub"))
+        nodes, assocs = [hub], []
+        for i in range(spokes):
+            spoke = Node.create(prototype_id="concept", payload={"name": f"Spoke {i}"})
+            if i < 3:
+                attach_vsa(spoke, bundle([encoder.vector("hub"), encoder.vector(f"spoke_{i}")]))
+            elif i % 2 == 0:
+                attach_vsa(spoke, encoder.vector(f"spoke_{i}"))
+            nodes.append(spoke)
+            assocs.append(Association.create_implies(source_id=hub.id, target_id=spoke.id, weight=0.8))
+        return hub, nodes, assocs
+
+    @pytest.mark.asyncio
+    async def test_fetch_context_vsa_hops_caps_hub_neighborhood(self):
+        hub, nodes, assocs = self.create_hub()
+        service = NeuroService(db=FakeNeighborhoodDb(nodes, assocs))
+
+        full = await service.fetch_context(hub.id)
+        assert len(full.nodes) == 51
+
+        context = await service.fetch_context(hub.id, mode="vsa_hops", top_k=3)
+        assert set(context.nodes) == {hub.id} | {node.id for node in nodes[1:4]}
+        assert len(context.associations) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_context_vsa_uses_index(self):
+        hub, nodes, assocs = self.create_hub()
+        service = NeuroService(db=FakeNeighborhoodDb(nodes, assocs))
+        service.set_config(context_mode="vsa", context_top_k=3)
+        with pytest.raises(RuntimeError):
+            await service.fetch_context(hub.id)
+
+        assert service.index_node_vectors(nodes) == 1 + 3 + 23
+        context = await service.fetch_context(hub.id)
+        assert set(context.nodes) == {hub.id} | {node.id for node in nodes[1:4]}
+        assert all(a.source_id == hub.id for a in context.associations.values())
+
+        with pytest.raises(ValueError):
+            await service.fetch_context(hub.id, mode="nearest")
+
     def test_belief_resolver_overrides_prior(self):
         class FixedResolver(BeliefResolver):
             def get_prior(self, node: Node) -> float:
@@ -1,7 +1,7 @@
 import asyncio
 import pytest
 
-from knowshowgo.replication import AsyncReplicator, EdgeUpdate
+from knowshowgo.replication import AsyncReplicator, CircuitBreaker, EdgeUpdate, coalesce_updates
 
 
 class FakeGraphClient:
@@ -24,3 +24,164 @@ async def test_replicator_enqueues_and_flushes_updates():
     await replicator.stop()
 
     assert client.calls == [("a", "b", 0.5, 10.0)]
+
+
+class FakeBulkGraphClient(FakeGraphClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[EdgeUpdate]] = []
+
+    async def increment_edge_weights(self, updates: list[EdgeUpdate]) -> None:
+        self.batches.append(list(updates))
+
+
+def test_coalesce_sums_repeated_edges():
+    updates = [
+        EdgeUpdate("a", "b", 0.5, 10.0),
+        EdgeUpdate("c", "d", 1.0, 10.0),
+        EdgeUpdate("a", "b", 0.25, 10.0),
+        EdgeUpdate("a", "b", 1.0, 5.0),
+        EdgeUpdate("c", "d", -1.0, 10.0),
+        EdgeUpdate("c", "d", 2.0, 10.0),
+    ]
+    assert coalesce_updates(updates) == [
+        EdgeUpdate("a", "b", 0.75, 10.0),
+        EdgeUpdate("c", "d", 1.0, 10.0),
+        EdgeUpdate("a", "b", 1.0, 5.0),
+        EdgeUpdate("c", "d", -1.0, 10.0),
+        EdgeUpdate("c", "d", 2.0, 10.0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batching_replicator_coalesces_into_bulk_calls():
+    client = FakeBulkGraphClient()
+    replicator = AsyncReplicator(client, batch_size=100, batch_interval=0.05, workers=2)
+
+    for i in range(60):
+        await replicator.enqueue(EdgeUpdate(source="a", target=f"n{i % 3}", delta=0.1, max_weight=10.0))
+    await replicator.start()
+    await asyncio.wait_for(replicator.queue.join(), timeout=1.0)
+    await replicator.stop()
+
+    assert client.calls == []
+    sent = [upd for batch in client.batches for upd in batch]
+    assert len(sent) == 3
+    assert sum(upd.delta for upd in sent) == pytest.approx(6.0)
+
+
+@pytest.mark.asyncio
+async def test_batching_falls_back_to_single_calls():
+    client = FakeGraphClient()
+    replicator = AsyncReplicator(client, batch_size=10, batch_interval=0.01)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=0.5, max_weight=1.0))
+    await replicator.enqueue(EdgeUpdate(source="b", target="c", delta=0.5, max_weight=1.0))
+    await asyncio.wait_for(replicator.queue.join(), timeout=1.0)
+    await replicator.stop()
+
+    assert client.calls == [("a", "b", 0.5, 1.0), ("b", "c", 0.5, 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_bounds_the_queue():
+    client = FakeGraphClient()
+    replicator = AsyncReplicator(client, max_queue=2, overflow="drop_oldest")
+    for i in range(5):
+        await replicator.enqueue(EdgeUpdate(source="a", target=f"n{i}", delta=1.0, max_weight=5.0))
+
+    metrics = replicator.metrics()
+    assert (metrics["depth"], metrics["dropped"], metrics["enqueued"]) == (2, 3, 5)
+    assert metrics["lag_seconds"] >= 0.0
+
+    await replicator.start()
+    await replicator.stop()
+    assert [call[1] for call in client.calls] == ["n3", "n4"]
+    assert replicator.metrics()["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_merges_pending_updates():
+    client = FakeGraphClient()
+    replicator = AsyncReplicator(client, max_queue=2, overflow="coalesce")
+    first = EdgeUpdate(source="a", target="b", delta=1.0, max_weight=5.0)
+    await replicator.enqueue(first)
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=2.0, max_weight=5.0))
+    await replicator.enqueue(EdgeUpdate(source="a", target="c", delta=1.0, max_weight=5.0))
+    # Full with nothing to merge into: enqueue_nowait refuses instead of waiting
+    assert replicator.enqueue_nowait(EdgeUpdate(source="x", target="y", delta=1.0, max_weight=5.0)) is False
+    assert replicator.enqueue_nowait(EdgeUpdate(source="a", target="c", delta=0.5, max_weight=5.0)) is True
+
+    await replicator.start()
+    await replicator.stop()
+    assert client.calls == [("a", "b", 3.0, 5.0), ("a", "c", 1.5, 5.0)]
+    assert first.delta == 1.0
+    assert replicator.metrics()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    client = FakeGraphClient()
+    replicator = AsyncReplicator(client, max_queue=1)
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=1.0, max_weight=5.0))
+    blocked = asyncio.create_task(replicator.enqueue(EdgeUpdate(source="b", target="c", delta=1.0, max_weight=5.0)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await replicator.start()
+    await asyncio.wait_for(blocked, timeout=1.0)
+    await replicator.stop()
+    assert len(client.calls) == 2
+
+    with pytest.raises(ValueError):
+        AsyncReplicator(client, overflow="spill")
+
+
+class FlakyGraphClient(FakeGraphClient):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    async def increment_edge_weight(self, source: str, target: str, delta: float, max_weight: float) -> None:
+        self.attempts += 1
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("store unavailable")
+        await super().increment_edge_weight(source, target, delta, max_weight)
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried():
+    client = FlakyGraphClient(failures=2)
+    replicator = AsyncReplicator(client, max_retries=3, backoff_base=0.001)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=0.5, max_weight=1.0))
+    await replicator.stop(timeout=1.0)
+
+    assert client.calls == [("a", "b", 0.5, 1.0)]
+    assert replicator.metrics()["retries"] == 2
+    assert replicator.metrics()["breaker"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_exhausted_batches_are_dead_lettered_and_requeued():
+    client = FlakyGraphClient(failures=100)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.02)
+    replicator = AsyncReplicator(client, max_retries=1, backoff_base=0.001, breaker=breaker)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=0.5, max_weight=1.0))
+    await replicator.enqueue(EdgeUpdate(source="b", target="c", delta=0.5, max_weight=1.0))
+    await replicator.flush(timeout=1.0)
+
+    # The worker survives the failures; the breaker tripped and both batches parked
+    metrics = replicator.metrics()
+    assert (metrics["failed_batches"], metrics["dead_letters"]) == (2, 2)
+    assert metrics["breaker"] in ("open", "half_open")
+    assert "store unavailable" in replicator.dead_letters[0].error
+
+    client.failures = 0
+    assert await replicator.requeue_dead_letters() == 2
+    await replicator.stop(timeout=1.0)
+    assert client.calls == [("a", "b", 0.5, 1.0), ("b", "c", 0.5, 1.0)]
+    assert replicator.breaker.state == "closed"
@@ -0,0 +1,160 @@
+import asyncio
+import os
+
+import pytest
+
+from knowshowgo.replication import AsyncReplicator, EdgeUpdate
+from knowshowgo.replication_log import ReplicationLog
+
+
+class FakeGraphClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, float, float]] = []
+
+    async def increment_edge_weight(self, source: str, target: str, delta: float, max_weight: float) -> None:
+        self.calls.append((source, target, delta, max_weight))
+
+
+def _segments(directory) -> list[str]:
+    return sorted(name for name in os.listdir(directory) if name.endswith(".log"))
+
+
+def test_unacked_updates_survive_reopen(tmp_path):
+    log = ReplicationLog(str(tmp_path))
+    seqs = [log.append(EdgeUpdate("a", f"n{i}", 1.0, 5.0)) for i in range(3)]
+    log.ack(seqs[:1])
+    log.close()
+
+    # Simulate a crash mid-write: a torn record at the end of the segment
+    with open(tmp_path / _segments(tmp_path)[-1], "a", encoding="utf-8") as handle:
+        handle.write('{"s":99,"u":["a"')
+
+    reopened = ReplicationLog(str(tmp_path))
+    assert [(seq, upd.target) for seq, upd in reopened.pending()] == [(seqs[1], "n1"), (seqs[2], "n2")]
+    assert reopened.append(EdgeUpdate("a", "n3", 1.0, 5.0, ops=[("op-3", 1.0)])) == seqs[2] + 1
+    reopened.close()
+    # Op ids survive a restart, so a replayed update is recognised by the store
+    replayed = ReplicationLog(str(tmp_path))
+    assert replayed.pending()[-1][1].ops == [("op-3", 1.0)]
+    replayed.close()
+
+
+def test_rotation_drops_acked_segments_and_compacts(tmp_path):
+    log = ReplicationLog(str(tmp_path), segment_bytes=200)
+    seqs = [log.append(EdgeUpdate("src", f"t{i}", 0.5, 9.0)) for i in range(20)]
+    assert len(_segments(tmp_path)) > 3
+
+    log.ack(seqs[1:])
+    # Segment 1 still holds the unacked first update, which pins every later one
+    assert len(_segments(tmp_path)) > 3
+    log.compact()
+    assert len(_segments(tmp_path)) == 1
+    assert [seq for seq, _ in log.pending()] == [seqs[0]]
+
+    log.ack(seqs[:1])
+    log.close()
+    assert len(ReplicationLog(str(tmp_path))) == 0
+
+
+def test_interrupted_compaction_does_not_duplicate_updates(tmp_path):
+    log = ReplicationLog(str(tmp_path), segment_bytes=200)
+    seqs = [log.append(EdgeUpdate("src", f"t{i}", 0.5, 9.0)) for i in range(6)]
+    log.ack(seqs[2:])
+    old = {name: (tmp_path / name).read_text() for name in _segments(tmp_path)}
+    log.compact()
+    log.close()
+    # Crash after the compacted segment was synced but before the old ones went
+    for name, text in old.items():
+        (tmp_path / name).write_text(text)
+
+    reopened = ReplicationLog(str(tmp_path))
+    assert [seq for seq, _ in reopened.pending()] == seqs[:2]
+    reopened.ack(seqs[:2])
+    reopened.close()
+    assert len(ReplicationLog(str(tmp_path))) == 0
+    assert len(_segments(tmp_path)) == 1
+
+
+@pytest.mark.asyncio
+async def test_replicator_replays_log_after_restart(tmp_path):
+    log = ReplicationLog(str(tmp_path))
+    stalled = AsyncReplicator(FakeGraphClient(), wal=log)
+    await stalled.enqueue(EdgeUpdate(source="a", target="b", delta=0.5, max_weight=10.0))
+    await stalled.enqueue(EdgeUpdate(source="b", target="c", delta=0.25, max_weight=10.0))
+    log.close()  # process dies before the workers ever ran
+
+    client = FakeGraphClient()
+    log = ReplicationLog(str(tmp_path))
+    replicator = AsyncReplicator(client, wal=log)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate(source="c", target="d", delta=1.0, max_weight=10.0))
+    await asyncio.wait_for(replicator.stop(), timeout=1.0)
+    log.close()
+
+    assert client.calls == [("a", "b", 0.5, 10.0), ("b", "c", 0.25, 10.0), ("c", "d", 1.0, 10.0)]
+    assert len(ReplicationLog(str(tmp_path))) == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_and_dropped_updates_are_acked(tmp_path):
+    log = ReplicationLog(str(tmp_path))
+    client = FakeGraphClient()
+    replicator = AsyncReplicator(client, wal=log, max_queue=1, overflow="coalesce")
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=1.0, max_weight=10.0))
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=2.0, max_weight=10.0))
+    assert len(log) == 2
+
+    await replicator.start()
+    await replicator.stop()
+    assert client.calls == [("a", "b", 3.0, 10.0)]
+    assert len(log) == 0
+
+    dropping = AsyncReplicator(client, wal=log, max_queue=1, overflow="drop_oldest")
+    await dropping.enqueue(EdgeUpdate(source="x", target="y", delta=1.0, max_weight=10.0))
+    await dropping.enqueue(EdgeUpdate(source="x", target="z", delta=1.0, max_weight=10.0))
+    assert [upd.target for _, upd in log.pending()] == ["z"]
+    log.close()
+
+
+@pytest.mark.asyncio
+async def test_dead_lettered_updates_stay_in_log(tmp_path):
+    class DownClient(FakeGraphClient):
+        async def increment_edge_weight(self, source, target, delta, max_weight):
+            raise TimeoutError("store timed out")
+
+    log = ReplicationLog(str(tmp_path))
+    replicator = AsyncReplicator(DownClient(), wal=log, max_retries=0)
+    await replicator.start()
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=1.0, max_weight=10.0))
+    await replicator.stop(timeout=1.0)
+    assert len(replicator.dead_letters) == 1
+    assert [upd.target for _, upd in log.pending()] == ["b"]
+
+    replicator.client = FakeGraphClient()
+    await replicator.requeue_dead_letters()
+    assert len(log) == 1  # re-logged under a new sequence number, old one acked
+    await replicator.start()
+    await replicator.stop(timeout=1.0)
+    assert replicator.client.calls == [("a", "b", 1.0, 10.0)]
+    assert len(log) == 0
+    log.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_timeout_still_stops_workers_and_syncs(tmp_path):
+    class HangingClient(FakeGraphClient):
+        async def increment_edge_weight(self, source, target, delta, max_weight):
+            await asyncio.Event().wait()
+
+    log = ReplicationLog(str(tmp_path), sync_every=1000, sync_interval=60.0)
+    replicator = AsyncReplicator(HangingClient(), wal=log)
+    await replicator.start()
+    tasks = list(replicator._tasks)
+    await replicator.enqueue(EdgeUpdate(source="a", target="b", delta=1.0, max_weight=10.0))
+    with pytest.raises(asyncio.TimeoutError):
+        await replicator.stop(timeout=0.05)
+
+    assert all(task.done() for task in tasks) and replicator._tasks == []
+    assert log._synced == log._written  # the final sync still ran
+    assert [upd.target for _, upd in log.pending()] == ["b"]  # replayed next start
+    log.close()
@@ -1,12 +1,16 @@
+import pytest
+
 from knowshowgo.models import Node
 from knowshowgo.vsa import (
     VsaEncoder,
     VsaMemoryIndex,
+    _seed_from_symbol,
     attach_vsa,
     bind,
     bundle,
     cosine_similarity,
     get_node_vsa,
+    random_bipolar_vector,
     unbind,
 )
 
@@ -54,3 +58,192 @@ def test_attach_and_get_node_vsa() -> None:
     attach_vsa(node, vec)
     recovered = get_node_vsa(node)
     assert recovered == vec
+
+
+def test_matrix_index_matches_list_scan() -> None:
+    encoder = VsaEncoder(dim=64, seed=3)
+    fast = VsaMemoryIndex(encoder)
+    slow = VsaMemoryIndex(encoder, use_numpy=False)
+    symbols = [f"sym_{i}" for i in range(40)]
+    for symbol in symbols:
+        fast.add_symbol(symbol, symbol)
+        slow.add_symbol(symbol, symbol)
+
+    probe = bundle([encoder.vector("sym_5"), encoder.vector("sym_17")])
+    fast_hits = fast.query(probe, top_k=3)
+    slow_hits = slow.query(probe, top_k=3)
+    assert [item for item, _ in fast_hits[:2]] == [item for item, _ in slow_hits[:2]]
+    assert {item for item, _ in fast_hits[:2]} == {"sym_5", "sym_17"}
+    for (_, fast_score), (_, slow_score) in zip(fast_hits, slow_hits):
+        assert abs(fast_score - slow_score) < 1e-5
+
+
+def test_query_many_and_overwrite() -> None:
+    encoder = VsaEncoder(dim=32, seed=11)
+    index = VsaMemoryIndex(encoder)
+    index.add_many(["a", "b", "c"], [encoder.vector("a"), encoder.vector("b"), encoder.vector("c")])
+    assert len(index) == 3
+
+    results = index.query_many([encoder.vector("c"), encoder.vector("a")], top_k=10)
+    assert [hits[0][0] for hits in results] == ["c", "a"]
+    assert len(results[0]) == 3
+
+    # Re-adding an id replaces its vector instead of duplicating it
+    index.add("a", encoder.vector("c"))
+    assert len(index) == 3
+    assert index.query(encoder.vector("c"), top_k=2)[1][1] > 0.99
+
+
+def test_remove_from_both_backends() -> None:
+    encoder = VsaEncoder(dim=16, seed=8)
+    for index in (VsaMemoryIndex(encoder), VsaMemoryIndex(encoder, use_numpy=False)):
+        index.add_symbol("a", "alpha")
+        index.add_symbol("b", "beta")
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert "a" not in index
+        assert [item for item, _ in index.query(encoder.vector("alpha"), top_k=5)] == ["b"]
+
+
+def test_encoder_arrays_match_python_generator() -> None:
+    pytest.importorskip("numpy")
+    encoder = VsaEncoder(dim=257, seed=6)
+    array = encoder.array("gamma")
+    assert array is encoder.array("gamma")
+    assert not array.flags.writeable
+    assert encoder.vector("gamma") == array.tolist()
+    assert array.tolist() == random_bipolar_vector(257, _seed_from_symbol("gamma", 6))
+
+    block = encoder.vectors(["alpha", "gamma", "alpha"])
+    assert block.shape == (3, 257)
+    assert block[1].tolist() == array.tolist()
+    assert block[0].tolist() == block[2].tolist()
+
+
+def test_encoder_lru_cache_is_bounded() -> None:
+    encoder = VsaEncoder(dim=8, cache_size=2)
+    first = encoder.vector("a")
+    encoder.vector("b")
+    encoder.vector("a")
+    encoder.vector("c")  # evicts "b", the least recently used
+    assert encoder.cache_info() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2, "max_size": 2}
+    assert encoder.vector("a") == first
+    encoder.vector("b")
+    assert encoder.cache_info()["misses"] == 4
+
+
+def test_batch_operations_match_list_versions() -> None:
+    np = pytest.importorskip("numpy")
+    from knowshowgo.vsa import bind_batch, bundle_batch, unbind_batch
+
+    encoder = VsaEncoder(dim=64, seed=12)
+    left = encoder.vectors(["a", "b", "c"])
+    key = encoder.array("key")
+    bound = bind_batch(left, key)
+    for row, symbol in zip(bound, "abc"):
+        assert np.allclose(row, bind(encoder.vector(symbol), encoder.vector("key")))
+
+    # Unbinding in place into the same buffer recovers the originals
+    recovered = unbind_batch(bound, key, out=bound)
+    assert recovered is bound
+    assert np.allclose(recovered, left)
+
+    sets = np.stack([left, left[::-1]])
+    bundled = bundle_batch(sets, weights=[1.0, 2.0, 0.0])
+    expected = bundle([encoder.vector("a"), encoder.vector("b")], weights=[1.0, 2.0])
+    assert np.allclose(bundled[0], expected)
+    assert bundled.shape == (2, 64)
+
+
+def test_role_filler_cleanup() -> None:
+    np = pytest.importorskip("numpy")
+    from knowshowgo.vsa import bind_batch, bundle_batch, unbind_and_cleanup
+
+    encoder = VsaEncoder(dim=1024, seed=1)
+    fillers = VsaMemoryIndex(encoder)
+    for i in range(20):
+        fillers.add_symbol(f"filler_{i}", f"filler_{i}")
+
+    roles = encoder.vectors(["role_color", "role_shape"])
+    # Node n has color filler_n and shape filler_(n + 10)
+    records = bundle_batch(
+        np.stack(
+            [
+                bind_batch(encoder.vectors([f"filler_{n}", f"filler_{n + 10}"]), roles)
+                for n in range(5)
+            ]
+        )
+    )
+    hits = unbind_and_cleanup(records, roles[1], fillers)
+    assert [found[0][0] for found in hits] == [f"filler_{n + 10}" for n in range(5)]
+
+
+@pytest.mark.parametrize("encoding,tolerance", [("float32", 1e-7), ("float16", 1e-3), ("bits", 1e-12)])
+def test_compact_payload_round_trip(encoding, tolerance, monkeypatch) -> None:
+    import json
+
+    from knowshowgo import vsa
+
+    vector = VsaEncoder(dim=128, seed=2).vector("compact")
+    node = Node.create(prototype_id=None)
+    attach_vsa(node, vector, encoding=encoding)
+    assert len(json.dumps(node.payload)) < len(json.dumps(vector))
+    decoded = get_node_vsa(node)
+    assert max(abs(a - b) for a, b in zip(decoded, vector)) < tolerance
+
+    # The pure-Python codec produces and reads the same payload
+    monkeypatch.setattr(vsa, "np", None)
+    assert vsa.encode_vsa_payload(vector, encoding) == node.payload["vsa_vector"]
+    assert vsa.decode_vsa_payload(node.payload["vsa_vector"]) == pytest.approx(decoded, abs=1e-12)
+
+
+def test_payload_cache_is_keyed_by_version() -> None:
+    from knowshowgo.vsa import VsaPayloadCache
+
+    encoder = VsaEncoder(dim=16, seed=4)
+    cache = VsaPayloadCache()
+    node = Node.create(prototype_id=None)
+    attach_vsa(node, encoder.vector("v1"), encoding="float32")
+    assert get_node_vsa(node, cache=cache) == pytest.approx(encoder.vector("v1"))
+
+    # A reloaded copy of the same node version reuses the decoded vector
+    copy = Node(id=node.id, prototype_id=None, payload=dict(node.payload))
+    get_node_vsa(copy, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    attach_vsa(node, encoder.vector("v2"), encoding="float32")
+    assert get_node_vsa(node, cache=cache) == pytest.approx(encoder.vector("v2"))
+    assert cache.misses == 2
+
+    node.payload["vsa_vector"] = {"encoding": "float32", "dim": 16, "data": "broken"}
+    node.payload["vsa_version"] += 1
+    assert get_node_vsa(node, cache=cache) is None
+
+
+def test_payload_cache_checks_the_payload_and_is_bounded_by_bytes() -> None:
+    import json
+
+    from knowshowgo.vsa import VsaPayloadCache
+
+    cache = VsaPayloadCache()
+    node = Node.create(prototype_id=None)
+    attach_vsa(node, [1.0, 0.0])
+    assert get_node_vsa(node, cache=cache) == [1.0, 0.0]
+    # Set behind attach_vsa's back: the version is unchanged, the payload is not
+    node.payload["vsa_vector"] = [0.0, 1.0]
+    assert get_node_vsa(node, cache=cache) == [0.0, 1.0]
+
+    # An equal encoded payload from a reload still hits
+    attach_vsa(node, [0.5, 0.5], encoding="float32")
+    get_node_vsa(node, cache=cache)
+    reloaded = Node(id=node.id, prototype_id=None, payload=json.loads(json.dumps(node.payload)))
+    get_node_vsa(reloaded, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    small = VsaPayloadCache(max_bytes=3 * 16 * 8)
+    encoder = VsaEncoder(dim=16, seed=4)
+    for idx in range(5):
+        other = Node.create(prototype_id=None)
+        attach_vsa(other, encoder.vector(f"n{idx}"))
+        get_node_vsa(other, cache=small)
+    assert len(small) == 3 and small.nbytes <= small.max_bytes
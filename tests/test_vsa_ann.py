@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from knowshowgo.vsa import VsaEncoder
+from knowshowgo.vsa_ann import LshVsaIndex, measure_recall
+
+
+def _noisy_dataset(items: int = 2000, dim: int = 64, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    base = rng.standard_normal((items, dim)).astype(np.float32)
+    probes = base[:50] + 0.3 * rng.standard_normal((50, dim)).astype(np.float32)
+    return base, probes
+
+
+def test_lsh_finds_near_duplicates() -> None:
+    base, probes = _noisy_dataset()
+    index = LshVsaIndex(VsaEncoder(dim=64), num_tables=16, num_bits=8, multiprobe=2)
+    index.add_many([f"item_{i}" for i in range(len(base))], base)
+
+    stats = measure_recall(index, list(probes), top_k=1)
+    assert stats["recall"] >= 0.9
+    assert stats["mean_candidates"] < len(base)
+
+
+def test_lsh_incremental_add_and_remove() -> None:
+    encoder = VsaEncoder(dim=64, seed=4)
+    index = LshVsaIndex(encoder, num_tables=8, num_bits=6)
+    for i in range(20):
+        index.add_symbol(f"id_{i}", f"sym_{i}")
+
+    assert index.query(encoder.vector("sym_3"), top_k=1)[0][0] == "id_3"
+
+    assert index.remove("id_3") is True
+    assert index.remove("id_3") is False
+    assert len(index) == 19
+    assert all(item != "id_3" for item, _ in index.query(encoder.vector("sym_3"), top_k=19))
+    # The row moved into the freed slot is still found
+    assert index.query(encoder.vector("sym_19"), top_k=1)[0][0] == "id_19"
+
+
+def test_exact_fallback_when_buckets_are_sparse() -> None:
+    encoder = VsaEncoder(dim=32, seed=2)
+    index = LshVsaIndex(encoder, num_tables=1, num_bits=20, exact_fallback=True)
+    for i in range(10):
+        index.add_symbol(f"id_{i}", f"sym_{i}")
+
+    hits = index.query(encoder.vector("unrelated"), top_k=5)
+    assert len(hits) == 5
@@ -0,0 +1,64 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from knowshowgo.vsa_binary import (
+    BinaryVsaEncoder,
+    BinaryVsaIndex,
+    bind_binary,
+    bundle_binary,
+    hamming_distance,
+    hamming_similarity,
+    pack_bipolar,
+    packed_bytes,
+    unbind_binary,
+)
+
+
+def test_binary_encoder_is_deterministic_and_packed() -> None:
+    encoder = BinaryVsaEncoder(dim=10000, seed=5)
+    first = encoder.vector("apple")
+    assert first.dtype == np.uint8
+    assert first.nbytes == packed_bytes(10000) == 1256
+    assert first is encoder.vector("apple")
+    assert not first.flags.writeable
+    assert np.array_equal(first, BinaryVsaEncoder(dim=10000, seed=5).vector("apple"))
+    # Random vectors are near-orthogonal
+    assert abs(hamming_similarity(first, encoder.vector("pear"), 10000)) < 0.05
+
+
+def test_xor_binding_is_exactly_invertible() -> None:
+    encoder = BinaryVsaEncoder(dim=1000, seed=1)
+    key, value = encoder.vector("key"), encoder.vector("value")
+    assert np.array_equal(unbind_binary(bind_binary(key, value), key), value)
+
+
+def test_majority_bundle_stays_similar_to_members() -> None:
+    encoder = BinaryVsaEncoder(dim=4096, seed=2)
+    members = [encoder.vector(s) for s in ("a", "b", "c")]
+    merged = bundle_binary(members, 4096)
+    for member in members:
+        assert hamming_similarity(merged, member, 4096) > 0.3
+    assert abs(hamming_similarity(merged, encoder.vector("d"), 4096)) < 0.1
+
+
+def test_padding_bits_do_not_count() -> None:
+    left = pack_bipolar([1.0, -1.0, 1.0])
+    right = pack_bipolar([1.0, 1.0, 1.0])
+    assert left.nbytes == 8
+    assert hamming_distance(left, right) == 1
+    assert hamming_similarity(left, right, 3) == pytest.approx(1 / 3)
+
+
+def test_binary_index_returns_best_match() -> None:
+    encoder = BinaryVsaEncoder(dim=2048, seed=3)
+    index = BinaryVsaIndex(encoder)
+    for i in range(100):
+        index.add_symbol(f"id_{i}", f"sym_{i}")
+
+    exact = index.query(encoder.vector("sym_42"), top_k=1)
+    assert exact == [("id_42", 1.0)]
+
+    probe = bundle_binary([encoder.vector(s) for s in ("sym_7", "sym_13", "sym_99")], 2048)
+    results = index.query(probe, top_k=3)
+    assert {item for item, _ in results} == {"id_7", "id_13", "id_99"}
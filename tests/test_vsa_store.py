@@ -0,0 +1,84 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from knowshowgo.vsa import VsaEncoder, VsaMemoryIndex
+from knowshowgo.vsa_ann import LshVsaIndex
+from knowshowgo.vsa_binary import BinaryVsaEncoder, BinaryVsaIndex
+from knowshowgo.vsa_store import read_vector_file
+
+
+def test_index_round_trip_is_memory_mapped(tmp_path) -> None:
+    encoder = VsaEncoder(dim=32, seed=5)
+    index = VsaMemoryIndex(encoder)
+    for i in range(10):
+        index.add_symbol(f"id_{i}", f"sym_{i}")
+    path = str(tmp_path / "index.vsa")
+    index.save(path)
+
+    loaded = VsaMemoryIndex.load(path, encoder)
+    assert isinstance(loaded._matrix, np.memmap)
+    assert len(loaded) == 10
+    probe = encoder.vector("sym_4")
+    assert loaded.query(probe, top_k=3) == index.query(probe, top_k=3)
+
+    # Mutations copy the mapping instead of writing through to the file
+    loaded.add("id_4", encoder.vector("sym_9"))
+    loaded.remove("id_0")
+    assert len(read_vector_file(path).ids) == 10
+    assert loaded.query(probe, top_k=1)[0][0] != "id_4"
+
+
+def test_list_backend_and_dimension_check(tmp_path) -> None:
+    encoder = VsaEncoder(dim=16, seed=1)
+    index = VsaMemoryIndex(encoder, use_numpy=False)
+    index.add_symbol("a", "alpha")
+    index.add_symbol("b", "beta")
+    path = str(tmp_path / "list.vsa")
+    index.save(path)
+
+    loaded = VsaMemoryIndex.load(path, encoder, use_numpy=False)
+    assert loaded.query(encoder.vector("beta"), top_k=1)[0][0] == "b"
+    with pytest.raises(ValueError):
+        VsaMemoryIndex.load(path, VsaEncoder(dim=8))
+
+
+def test_codebook_round_trip(tmp_path) -> None:
+    encoder = VsaEncoder(dim=24, seed=9)
+    expected = {symbol: encoder.vector(symbol) for symbol in ("x", "y", "z")}
+    path = str(tmp_path / "codebook.vsa")
+    encoder.save_codebook(path)
+
+    loaded = VsaEncoder.load_codebook(path)
+    assert (loaded.dim, loaded.seed) == (24, 9)
+    assert loaded._cache == {}
+    assert all(loaded.vector(symbol) == vector for symbol, vector in expected.items())
+    # Unknown symbols are generated exactly as before
+    assert loaded.vector("w") == encoder.vector("w")
+
+
+def test_lsh_and_binary_indexes_reload(tmp_path) -> None:
+    encoder = VsaEncoder(dim=64, seed=4)
+    lsh = LshVsaIndex(encoder, num_tables=8, num_bits=6)
+    for i in range(20):
+        lsh.add_symbol(f"id_{i}", f"sym_{i}")
+    lsh.save(str(tmp_path / "lsh.vsa"))
+    reloaded = LshVsaIndex.load(str(tmp_path / "lsh.vsa"), encoder, num_tables=8, num_bits=6)
+    assert reloaded.query(encoder.vector("sym_7"), top_k=1)[0][0] == "id_7"
+
+    binary_encoder = BinaryVsaEncoder(dim=1000, seed=2)
+    binary = BinaryVsaIndex(binary_encoder)
+    for i in range(5):
+        binary.add_symbol(f"id_{i}", f"sym_{i}")
+    binary.save(str(tmp_path / "binary.vsa"))
+    loaded = BinaryVsaIndex.load(str(tmp_path / "binary.vsa"), binary_encoder)
+    assert loaded.query(binary_encoder.vector("sym_3"), top_k=1) == [("id_3", 1.0)]
+    loaded.add_symbol("id_3", "sym_0")
+    assert loaded.query(binary_encoder.vector("sym_0"), top_k=1)[0][1] == 1.0
+
+
+def test_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "junk.vsa"
+    path.write_bytes(b"not a vector file at all, just some bytes" * 4)
+    with pytest.raises(ValueError):
+        read_vector_file(str(path))